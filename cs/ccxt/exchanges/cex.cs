@@ -146,6 +146,7 @@ public partial class cex : Exchange
                 } },
             } },
             { "options", new Dictionary<string, object>() {
+                { "loadCurrenciesBeforeMarkets", true },
                 { "fetchOHLCVWarning", true },
                 { "createMarketBuyOrderRequiresPrice", true },
                 { "order", new Dictionary<string, object>() {
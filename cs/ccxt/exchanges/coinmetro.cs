@@ -199,6 +199,7 @@ public partial class coinmetro : Exchange
             } },
             { "precisionMode", DECIMAL_PLACES },
             { "options", new Dictionary<string, object>() {
+                { "loadCurrenciesBeforeMarkets", true },
                 { "currenciesByIdForParseMarket", null },
                 { "currencyIdsListForParseMarket", null },
             } },
@@ -206,6 +206,7 @@ public partial class latoken : Exchange
                 } },
             } },
             { "options", new Dictionary<string, object>() {
+                { "loadCurrenciesBeforeMarkets", true },
                 { "defaultType", "spot" },
                 { "types", new Dictionary<string, object>() {
                     { "wallet", "ACCOUNT_TYPE_WALLET" },
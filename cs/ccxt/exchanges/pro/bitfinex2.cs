@@ -729,22 +729,41 @@ public partial class bitfinex2 : ccxt.bitfinex2
         object asks = getValue(book, "asks");
         object prec = this.safeString(subscription, "prec", "P0");
         object isRaw = (isEqual(prec, "R0"));
-        object idToCheck = ((bool) isTrue(isRaw)) ? 2 : 0;
-        // pepperoni pizza from bitfinex
-        for (object i = 0; isLessThan(i, depth); postFixIncrement(ref i))
+        if (isTrue(isRaw))
         {
-            object bid = this.safeValue(bids, i);
-            object ask = this.safeValue(asks, i);
-            if (isTrue(!isEqual(bid, null)))
+            // the raw books are checked with the order ids instead of the prices
+            // pepperoni pizza from bitfinex
+            for (object i = 0; isLessThan(i, depth); postFixIncrement(ref i))
             {
-                ((IList<object>)stringArray).Add(this.numberToString(getValue(getValue(bids, i), idToCheck)));
-                ((IList<object>)stringArray).Add(this.numberToString(getValue(getValue(bids, i), 1)));
+                object bid = this.safeValue(bids, i);
+                object ask = this.safeValue(asks, i);
+                if (isTrue(!isEqual(bid, null)))
+                {
+                    ((IList<object>)stringArray).Add(this.numberToString(getValue(getValue(bids, i), 2)));
+                    ((IList<object>)stringArray).Add(this.numberToString(getValue(getValue(bids, i), 1)));
+                }
+                if (isTrue(!isEqual(ask, null)))
+                {
+                    ((IList<object>)stringArray).Add(this.numberToString(getValue(getValue(asks, i), 2)));
+                    ((IList<object>)stringArray).Add(Precise.stringNeg(this.numberToString(getValue(getValue(asks, i), 1))));
+                }
             }
-            if (isTrue(!isEqual(ask, null)))
+        } else
+        {
+            object bidStrings = (bids as IOrderBookSide).topStrings(depth);
+            object askStrings = (asks as IOrderBookSide).topStrings(depth);
+            for (object i = 0; isLessThan(i, depth); postFixIncrement(ref i))
             {
-                ((IList<object>)stringArray).Add(this.numberToString(getValue(getValue(asks, i), idToCheck)));
-                object aski1 = getValue(getValue(asks, i), 1);
-                ((IList<object>)stringArray).Add(this.numberToString(prefixUnaryNeg(ref aski1)));
+                if (isTrue(isLessThan(i, getArrayLength(bidStrings))))
+                {
+                    ((IList<object>)stringArray).Add(getValue(getValue(bidStrings, i), 0));
+                    ((IList<object>)stringArray).Add(getValue(getValue(bidStrings, i), 1));
+                }
+                if (isTrue(isLessThan(i, getArrayLength(askStrings))))
+                {
+                    ((IList<object>)stringArray).Add(getValue(getValue(askStrings, i), 0));
+                    ((IList<object>)stringArray).Add(Precise.stringNeg(getValue(getValue(askStrings, i), 1)));
+                }
             }
         }
         object payload = String.Join(":", ((IList<object>)stringArray).ToArray());
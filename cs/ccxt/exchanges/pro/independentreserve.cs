@@ -253,7 +253,7 @@ public partial class independentreserve : ccxt.independentreserve
 
     public virtual object valueToChecksum(object value)
     {
-        object result = toFixed(value, 8);
+        object result = toFixed(parseFloat(value), 8);
         result = ((string)result).Replace((string)".", (string)"");
         // remove leading zeros
         result = this.parseNumber(result);
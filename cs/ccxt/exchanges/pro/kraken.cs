@@ -834,14 +834,16 @@ public partial class kraken : ccxt.kraken
                 object payloadArray = new List<object>() {};
                 if (isTrue(!isEqual(c, null)))
                 {
-                    for (object i = 0; isLessThan(i, 10); postFixIncrement(ref i))
+                    object askStrings = (storedAsks as IOrderBookSide).topStrings(10);
+                    object bidStrings = (storedBids as IOrderBookSide).topStrings(10);
+                    for (object i = 0; isLessThan(i, getArrayLength(askStrings)); postFixIncrement(ref i))
                     {
-                        object formatted = add(this.formatNumber(getValue(getValue(storedAsks, i), 0), priceLength), this.formatNumber(getValue(getValue(storedAsks, i), 1), amountLength));
+                        object formatted = add(this.formatNumber(getValue(getValue(askStrings, i), 0), priceLength), this.formatNumber(getValue(getValue(askStrings, i), 1), amountLength));
                         ((IList<object>)payloadArray).Add(formatted);
                     }
-                    for (object i = 0; isLessThan(i, 10); postFixIncrement(ref i))
+                    for (object i = 0; isLessThan(i, getArrayLength(bidStrings)); postFixIncrement(ref i))
                     {
-                        object formatted = add(this.formatNumber(getValue(getValue(storedBids, i), 0), priceLength), this.formatNumber(getValue(getValue(storedBids, i), 1), amountLength));
+                        object formatted = add(this.formatNumber(getValue(getValue(bidStrings, i), 0), priceLength), this.formatNumber(getValue(getValue(bidStrings, i), 1), amountLength));
                         ((IList<object>)payloadArray).Add(formatted);
                     }
                 }
@@ -980,10 +980,7 @@ public partial class okx : ccxt.okx
 
     public override void handleDeltas(object bookside, object deltas)
     {
-        for (object i = 0; isLessThan(i, getArrayLength(deltas)); postFixIncrement(ref i))
-        {
-            this.handleDelta(bookside, getValue(deltas, i));
-        }
+        (bookside as IOrderBookSide).applyDeltas(deltas);
     }
 
     public virtual object handleOrderBookMessage(WebSocketClient client, object message, object orderbook, object messageHash)
@@ -1015,20 +1012,22 @@ public partial class okx : ccxt.okx
         object checksum = this.safeBool(this.options, "checksum", true);
         if (isTrue(checksum))
         {
-            object asksLength = getArrayLength(storedAsks);
-            object bidsLength = getArrayLength(storedBids);
+            object bidStrings = (storedBids as IOrderBookSide).topStrings(25);
+            object askStrings = (storedAsks as IOrderBookSide).topStrings(25);
+            object asksLength = getArrayLength(askStrings);
+            object bidsLength = getArrayLength(bidStrings);
             object payloadArray = new List<object>() {};
             for (object i = 0; isLessThan(i, 25); postFixIncrement(ref i))
             {
                 if (isTrue(isLessThan(i, bidsLength)))
                 {
-                    ((IList<object>)payloadArray).Add(this.numberToString(getValue(getValue(storedBids, i), 0)));
-                    ((IList<object>)payloadArray).Add(this.numberToString(getValue(getValue(storedBids, i), 1)));
+                    ((IList<object>)payloadArray).Add(getValue(getValue(bidStrings, i), 0));
+                    ((IList<object>)payloadArray).Add(getValue(getValue(bidStrings, i), 1));
                 }
                 if (isTrue(isLessThan(i, asksLength)))
                 {
-                    ((IList<object>)payloadArray).Add(this.numberToString(getValue(getValue(storedAsks, i), 0)));
-                    ((IList<object>)payloadArray).Add(this.numberToString(getValue(getValue(storedAsks, i), 1)));
+                    ((IList<object>)payloadArray).Add(getValue(getValue(askStrings, i), 0));
+                    ((IList<object>)payloadArray).Add(getValue(getValue(askStrings, i), 1));
                 }
             }
             object payload = String.Join(":", ((IList<object>)payloadArray).ToArray());
@@ -21,6 +21,8 @@ public interface IOrderBookSide : IList<object>
 {
     void store(object price, object size);
     void storeArray(object delta);
+    void applyDeltas(object deltas, object priceIndex = null, object amountIndex = null);
+    object topStrings(object depth);
     void limit();
     void store(object price, object size, object order_id);
     IOrderBookSide Copy();
@@ -203,6 +205,49 @@ public class OrderBookSide : SlimConcurrentList<object>, IOrderBookSide
         }
     }
 
+    public static object parseDeltaNumber(object value)
+    {
+        return Convert.ToDouble(value, System.Globalization.CultureInfo.InvariantCulture);
+    }
+
+    public static int deltaIndex(object index, int defaultIndex)
+    {
+        return (index == null) ? defaultIndex : Convert.ToInt32(index);
+    }
+
+    // stores raw price levels like [["31738.3", "0.05973179"], ...] in one call
+    // prices and amounts can be strings or numbers
+    public virtual void applyDeltas(object deltas2, object priceIndex = null, object amountIndex = null)
+    {
+        lock (_syncRoot)
+        {
+            var deltas = (IList<object>)deltas2;
+            var pi = deltaIndex(priceIndex, 0);
+            var ai = deltaIndex(amountIndex, 1);
+            for (var i = 0; i < deltas.Count; i++)
+            {
+                var delta = (IList<object>)deltas[i];
+                this.storeArray(new SlimConcurrentList<object> { parseDeltaNumber(delta[pi]), parseDeltaNumber(delta[ai]) });
+            }
+        }
+    }
+
+    // the [price, amount] strings of the first levels, for the checksums
+    public object topStrings(object depth)
+    {
+        lock (_syncRoot)
+        {
+            var result = new List<object>();
+            var length = Math.Min(Convert.ToInt32(depth), this.Count);
+            for (var i = 0; i < length; i++)
+            {
+                var level = (IList<object>)this[i];
+                result.Add(new List<object> { ccxt.Exchange.NumberToString(level[0]), ccxt.Exchange.NumberToString(level[1]) });
+            }
+            return result;
+        }
+    }
+
     public void limit()
     {
         lock (_syncRoot)
@@ -303,6 +348,27 @@ public class CountedOrderBookSide : OrderBookSide, IOrderBookSide
         }
     }
 
+    public override void applyDeltas(object deltas2, object priceIndex = null, object amountIndex = null)
+    {
+        this.applyDeltas(deltas2, priceIndex, amountIndex, null);
+    }
+
+    public void applyDeltas(object deltas2, object priceIndex, object amountIndex, object countIndex)
+    {
+        lock (_syncRoot)
+        {
+            var deltas = (IList<object>)deltas2;
+            var pi = deltaIndex(priceIndex, 0);
+            var ai = deltaIndex(amountIndex, 1);
+            var ci = deltaIndex(countIndex, 2);
+            for (var i = 0; i < deltas.Count; i++)
+            {
+                var delta = (IList<object>)deltas[i];
+                this.storeArray(new SlimConcurrentList<object> { parseDeltaNumber(delta[pi]), parseDeltaNumber(delta[ai]), Convert.ToInt32(parseDeltaNumber(delta[ci])) });
+            }
+        }
+    }
+
     public void storeArray(object deltaArra2)
     {
         lock (_syncRoot)
@@ -390,7 +456,7 @@ public class IndexedOrderBookSide : OrderBookSide, IOrderBookSide
         {
 
             var delta = (IList<object>)delta2;
-            var price = Convert.ToDecimal(delta[0]);
+            var price = Convert.ToDecimal(delta[0]); // a missing (null) price converts to 0
             var size = Convert.ToDecimal(delta[1]);
             var order_id = delta[2];
             decimal? index_price = -1;
@@ -488,6 +554,29 @@ public class IndexedOrderBookSide : OrderBookSide, IOrderBookSide
         }
     }
 
+    public override void applyDeltas(object deltas2, object priceIndex = null, object amountIndex = null)
+    {
+        this.applyDeltas(deltas2, priceIndex, amountIndex, null);
+    }
+
+    public void applyDeltas(object deltas2, object priceIndex, object amountIndex, object idIndex)
+    {
+        lock (_syncRoot)
+        {
+            // the price can be missing when an order is changed or deleted
+            var deltas = (IList<object>)deltas2;
+            var pi = deltaIndex(priceIndex, 0);
+            var ai = deltaIndex(amountIndex, 1);
+            var ii = deltaIndex(idIndex, 2);
+            for (var i = 0; i < deltas.Count; i++)
+            {
+                var delta = (IList<object>)deltas[i];
+                var price = (delta[pi] == null) ? null : parseDeltaNumber(delta[pi]);
+                this.storeArray(new SlimConcurrentList<object> { price, parseDeltaNumber(delta[ai]), delta[ii] });
+            }
+        }
+    }
+
     // public void limit() {
     //     if (this.Count > this._depth) {
     //         FirstChanceExceptionEventArgs ()
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+from ccxt.async_support.base.throttler import Throttler  # noqa: E402
+
+# compares the polling looper against the timer scheduler of the REST rate limiter
+# with many exchange-like instances that all have a backlog of queued requests
+# wakeups are counted as event loop iterations, latency is measured against the
+# ideal token bucket schedule (one grant every cost / refillRate milliseconds)
+
+INSTANCES = 40
+REQUESTS = 50
+RATE_LIMIT = 50  # milliseconds per request
+
+
+class CountingEventLoop(asyncio.SelectorEventLoop):
+
+    iterations = 0
+
+    def _run_once(self):
+        self.iterations += 1
+        super()._run_once()
+
+
+async def consumer(throttler, lateness):
+    interval = 1 / throttler.config['refillRate']
+    first = None
+    for i in range(REQUESTS):
+        await throttler()
+        now = time.perf_counter() * 1000
+        if first is None:
+            first = now
+        else:
+            lateness.append(now - (first + i * interval))
+
+
+async def run(scheduler):
+    lateness = []
+    throttlers = [Throttler({
+        'refillRate': 1 / RATE_LIMIT,
+        'scheduler': scheduler,
+    }, asyncio.get_running_loop()) for i in range(INSTANCES)]
+    await asyncio.gather(*[consumer(throttler, lateness) for throttler in throttlers])
+    return lateness
+
+
+def benchmark(scheduler):
+    loop = CountingEventLoop()
+    cpu = time.process_time()
+    start = time.perf_counter()
+    lateness = loop.run_until_complete(run(scheduler))
+    elapsed = time.perf_counter() - start
+    cpu = time.process_time() - cpu
+    loop.close()
+    lateness.sort()
+    p50 = lateness[len(lateness) // 2]
+    p99 = lateness[int(len(lateness) * 0.99)]
+    print(f'{scheduler:>8} | {loop.iterations:>10} | {cpu * 1000:>8.1f} | {elapsed * 1000:>8.1f} | {p50:>8.3f} | {p99:>8.3f}')
+
+
+print(f'{INSTANCES} throttlers x {REQUESTS} requests, rateLimit {RATE_LIMIT}ms')
+print(f'{"":>8} | {"wakeups":>10} | {"cpu ms":>8} | {"wall ms":>8} | {"p50 ms":>8} | {"p99 ms":>8}')
+for scheduler in ['looper', 'timer']:
+    benchmark(scheduler)
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import json
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+from aiohttp import WSMessage, WSMsgType  # noqa: E402
+from ccxt.async_support.base.ws.fast_client import FastClient  # noqa: E402
+from ccxt.async_support.base.ws.order_book import OrderBook  # noqa: E402
+
+# replays bursts of binance-like depth updates for many symbols into a FastClient
+# and compares handling one message per event loop iteration against batched dispatch
+# loop lag is how late a 1ms timer fires while the messages are handled
+
+SYMBOLS = 200
+BURSTS = 20
+UPDATES = 10  # per symbol per burst
+LEVELS = 10  # per side per update
+
+
+def depth_update(symbol, i):
+    return json.dumps({
+        'e': 'depthUpdate',
+        's': symbol,
+        'u': i,
+        'b': [[str(100 - j * 0.01 - (i % 7) * 0.001), str(j + i % 3)] for j in range(LEVELS)],
+        'a': [[str(100 + j * 0.01 + (i % 5) * 0.001), str(j + i % 2)] for j in range(LEVELS)],
+    })
+
+
+def on_message(client, message):
+    orderbook = client.orderbooks[message['s']]
+    for bid in message['b']:
+        orderbook['bids'].store(float(bid[0]), float(bid[1]))
+    for ask in message['a']:
+        orderbook['asks'].store(float(ask[0]), float(ask[1]))
+    orderbook['nonce'] = message['u']
+    client.resolve(orderbook, 'orderbook:' + message['s'])
+
+
+async def watch(client, symbol, counter):
+    while True:
+        await client.future('orderbook:' + symbol)
+        counter['resolved'] += 1
+
+
+async def monitor(lags, stop):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append((time.perf_counter() - start) * 1000 - 1)
+
+
+async def run(batch_size):
+    loop = asyncio.get_running_loop()
+    client = FastClient('wss://example.com', on_message, None, None, None, {
+        'asyncio_loop': loop,
+        'batchSize': batch_size,
+    })
+    symbols = ['SYMBOL' + str(i) for i in range(SYMBOLS)]
+    client.orderbooks = dict((symbol, OrderBook()) for symbol in symbols)
+    counter = {'resolved': 0}
+    watchers = [asyncio.ensure_future(watch(client, symbol, counter)) for symbol in symbols]
+    bursts = [[WSMessage(WSMsgType.TEXT, depth_update(symbol, b * UPDATES + i), None) for i in range(UPDATES) for symbol in symbols] for b in range(BURSTS)]
+    lags = []
+    stop = asyncio.Event()
+    monitoring = asyncio.ensure_future(monitor(lags, stop))
+    await asyncio.sleep(0.01)
+    handling = 0
+    for burst in bursts:
+        start = time.perf_counter()
+        for message in burst:
+            client.feed_data(message, 0)
+        while client.stack or client.callback_scheduled:
+            await asyncio.sleep(0)
+        handling += time.perf_counter() - start
+        await asyncio.sleep(0.01)
+    stop.set()
+    await monitoring
+    for watcher in watchers:
+        watcher.cancel()
+    lags.sort()
+    messages = BURSTS * UPDATES * SYMBOLS
+    p99 = lags[int(len(lags) * 0.99)]
+    print(f'{batch_size:>10} | {messages / handling:>12.0f} | {counter["resolved"]:>8} | {p99:>10.3f} | {lags[-1]:>10.3f}')
+
+
+print(f'{BURSTS} bursts of {UPDATES} updates for {SYMBOLS} symbols')
+print(f'{"batchSize":>10} | {"messages/s":>12} | {"resolved":>8} | {"p99 lag ms":>10} | {"max lag ms":>10}')
+for batch_size in [0, 100, 1000, 4000]:
+    asyncio.run(run(batch_size))
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+import os
+import random
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheByTimestamp, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide  # noqa: E402
+from ccxt.async_support.base.exchange import Exchange  # noqa: E402
+
+# appends the updates of the websocket streams to the caches the way the exchange handlers do it
+# and reads the new updates the way watch_orders, watch_trades etc do it after every few updates
+# then returns the last trades of full caches the way watch_trades does it, with and without since
+#
+#     python cache-benchmark.py [cache size ...]
+
+UPDATES = 100000
+READS = 10000
+SYMBOLS = ['BTC/USDT', 'ETH/USDT', 'SOL/USDT', 'XRP/USDT', 'DOGE/USDT']
+
+random.seed(1)
+
+
+def orders(size):
+    # mostly updates of the open orders, some orders are new
+    updates = []
+    ids = []
+    for i in range(UPDATES):
+        if not ids or random.random() < 0.2:
+            ids.append(str(i))
+            ids = ids[-size:]
+            order_id = ids[-1]
+        else:
+            order_id = random.choice(ids)
+        updates.append({'id': order_id, 'symbol': SYMBOLS[int(order_id) % len(SYMBOLS)], 'status': 'open', 'filled': i})
+    return updates
+
+
+def positions(size):
+    return [{'symbol': 'SYMBOL' + str(random.randrange(size // 2)), 'side': random.choice(['long', 'short']), 'contracts': i} for i in range(UPDATES)]
+
+
+def trades(size):
+    return [{'id': str(i), 'symbol': random.choice(SYMBOLS), 'price': 1.0} for i in range(UPDATES)]
+
+
+def candles(size):
+    return [[60000 * (i // 10), 1.0, 1.0, 1.0, 1.0, float(i)] for i in range(UPDATES)]
+
+
+def replay(cache, updates, symbol=None):
+    start = time.perf_counter()
+    for i, update in enumerate(updates):
+        cache.append(update)
+        if i % 10 == 0:
+            limit = cache.getLimit(symbol, None)
+            cache[-limit:] if limit else []
+    return time.perf_counter() - start
+
+
+sizes = [int(size) for size in sys.argv[1:]] or [1000, 10000]
+print(f'{UPDATES} updates per cache, the new updates are read after every 10')
+print(f'{"cache":>26} | {"size":>6} | {"ns/update":>10} | {"updates/s":>10}')
+for size in sizes:
+    for cache_class, generate in [
+        (ArrayCache, trades),
+        (ArrayCacheByTimestamp, candles),
+        (ArrayCacheBySymbolById, orders),
+        (ArrayCacheBySymbolBySide, positions),
+    ]:
+        updates = generate(size)
+        cache = cache_class(size)
+        elapsed = replay(cache, updates)
+        print(f'{cache_class.__name__:>26} | {size:>6} | {elapsed / UPDATES * 1e9:>10.0f} | {UPDATES / elapsed:>10.0f}')
+
+
+print(f'{READS} watch_trades returns of the last 50 trades of a full cache')
+print(f'{"cache":>26} | {"size":>6} | {"filter":>24} | {"us/return":>10}')
+exchange = Exchange()
+for size in sizes:
+    cache = ArrayCache(size)
+    for i in range(size * 2):
+        cache.append({'id': str(i), 'symbol': SYMBOLS[i % len(SYMBOLS)], 'timestamp': 1700000000000 + i, 'price': 1.0})
+    since = cache[-100]['timestamp']
+    for name, method, arguments in [
+        ('since_limit', exchange.filter_by_since_limit, (None, 50, 'timestamp', True)),
+        ('since_limit since', exchange.filter_by_since_limit, (since, 50, 'timestamp', True)),
+        ('symbol_since_limit', exchange.filter_by_symbol_since_limit, ('BTC/USDT', None, 50, True)),
+        ('symbol_since_limit since', exchange.filter_by_symbol_since_limit, ('BTC/USDT', since, 50, True)),
+    ]:
+        start = time.perf_counter()
+        for i in range(READS):
+            method(cache, *arguments)
+        elapsed = time.perf_counter() - start
+        print(f'{"ArrayCache":>26} | {size:>6} | {name:>24} | {elapsed / READS * 1e6:>10.2f}')
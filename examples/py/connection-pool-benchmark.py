@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import sys
+import time
+
+from aiohttp import web
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt.async_support as ccxt  # noqa: E402
+
+# sends bursts of concurrent requests to a local server that answers after a simulated latency, the way
+# a fan-out of fetch_order_book over hundreds of symbols does it, with the default connector and with
+# a tuned aiohttp_connector and aiohttp_prewarm, and reports the time per burst and connection_pool_stats()
+#
+#     python connection-pool-benchmark.py [requests per burst] [latency in milliseconds]
+
+REQUESTS = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+LATENCY = float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.2
+BURSTS = 5
+CONFIGS = {
+    'default': {},
+    'tuned': {
+        'aiohttp_connector': {'limit': 0, 'keepalive_timeout': 60, 'ttl_dns_cache': 300},
+        'aiohttp_prewarm': 10,
+    },
+}
+
+
+async def order_book(request):
+    await asyncio.sleep(LATENCY)
+    return web.json_response({'bids': [['100.0', '1.0']], 'asks': [['101.0', '1.0']]})
+
+
+async def main():
+    app = web.Application()
+    app.router.add_route('*', '/{tail:.*}', order_book)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    url = 'http://127.0.0.1:' + str(port) + '/'
+    print(f'{BURSTS} bursts of {REQUESTS} requests, {LATENCY * 1e3:.0f} ms latency')
+    print(f'{"connector":>9} | {"ms/burst":>8} | {"created":>7} | {"reused":>6} | {"queued":>6} | {"ms queued":>9} | {"limit":>5}')
+    for name, config in CONFIGS.items():
+        exchange = ccxt.Exchange(ccxt.Exchange.extend({'id': 'local', 'urls': {'api': {'public': url}}}, config))
+        exchange.open()
+        if exchange.prewarming is not None:
+            await exchange.prewarming
+        timings = []
+        for i in range(BURSTS):
+            start = time.perf_counter()
+            await asyncio.gather(*[exchange.fetch(url + 'depth?symbol=' + str(j)) for j in range(REQUESTS)])
+            timings.append(time.perf_counter() - start)
+        stats = exchange.connection_pool_stats()
+        await exchange.close()
+        average = sum(timings) / len(timings)
+        print(f'{name:>9} | {average * 1e3:>8.0f} | {stats["created"]:>7} | {stats["reused"]:>6} | {stats["queued"]:>6} | {stats["queuedTime"]:>9} | {stats["limit"]:>5}')
+    await runner.cleanup()
+
+
+asyncio.run(main())
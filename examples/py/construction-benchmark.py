@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+import ccxt.pro  # noqa: E402
+
+# creates short-lived instances of every exchange with the api keys of a user the way
+# multi-tenant services do it, after the first instance of every class has been created,
+# and reports the construction time per package and of the slowest exchanges
+#
+#     python construction-benchmark.py [instances per exchange]
+
+INSTANCES = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+
+def config(i):
+    return {
+        'apiKey': 'key' + str(i),
+        'secret': 'secret' + str(i),
+        'options': {'defaultType': 'spot'},
+    }
+
+
+print(f'{INSTANCES} instances per exchange')
+print(f'{"package":>18} | {"exchanges":>9} | {"ms/instance":>11} | slowest')
+for package in [ccxt, ccxt.async_support, ccxt.pro]:
+    timings = {}
+    for name in package.exchanges:
+        exchange_class = getattr(package, name)
+        exchange_class(config(0))
+        best = None
+        for j in range(3):
+            start = time.perf_counter()
+            for i in range(INSTANCES):
+                exchange_class(config(i))
+            elapsed = (time.perf_counter() - start) / INSTANCES
+            best = elapsed if best is None else min(best, elapsed)
+        timings[name] = best
+    average = sum(timings.values()) / len(timings)
+    slowest = ', '.join(f'{name} {timings[name] * 1e3:.2f}' for name in sorted(timings, key=lambda name: -timings[name])[:3])
+    print(f'{package.__name__:>18} | {len(timings):>9} | {average * 1e3:>11.2f} | {slowest}')
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+import os
+import subprocess
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# imports ccxt, ccxt.async_support and ccxt.pro in fresh interpreters the way short-lived
+# workers and command line tools do it, with and without creating two exchanges, and reports
+# the best import time and the peak memory, fails if importing a package imports any exchange
+#
+#     python import-benchmark.py [rounds]
+
+ROUNDS = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+SCRIPT = '''
+import resource
+import sys
+import time
+sys.path.insert(0, {path!r})
+start = time.perf_counter()
+import {package} as package
+imported = time.perf_counter() - start
+loaded = [name for name in package.exchanges if {package!r} + '.' + name in sys.modules]
+for name in {create!r}:
+    getattr(package, name)()
+elapsed = time.perf_counter() - start
+print(imported, elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, len(sys.modules), ','.join(loaded))
+'''
+
+
+def run(package, create):
+    best = None
+    for i in range(ROUNDS):
+        script = SCRIPT.format(path=root + '/python', package=package, create=create)
+        output = subprocess.run([sys.executable, '-c', script], check=True, capture_output=True, text=True).stdout.split(' ')
+        imported, elapsed, rss, modules = float(output[0]), float(output[1]), int(output[2]), int(output[3])
+        loaded = output[4].strip()
+        if not create and loaded:
+            raise AssertionError('import ' + package + ' imported the exchanges ' + loaded)
+        if best is None or elapsed < best[1]:
+            best = (imported, elapsed, rss, modules)
+    return best
+
+
+print(f'best of {ROUNDS} fresh interpreters')
+print(f'{"package":>18} | {"exchanges":>16} | {"ms/import":>9} | {"ms/total":>8} | {"MB rss":>6} | {"modules":>7}')
+for package in ['ccxt', 'ccxt.async_support', 'ccxt.pro']:
+    for create in [[], ['binance', 'okx']]:
+        imported, elapsed, rss, modules = run(package, create)
+        print(f'{package:>18} | {",".join(create) or "-":>16} | {imported * 1e3:>9.0f} | {elapsed * 1e3:>8.0f} | {rss / 1024:>6.0f} | {modules:>7}')
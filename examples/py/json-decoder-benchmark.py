@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+import glob
+import json
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+from ccxt.base.json_decoders import get_json_decoder  # noqa: E402
+from ccxt.base.errors import NotSupported  # noqa: E402
+
+# decodes the http responses recorded for the static response tests with every installed decoder
+# 'bytes' is how binary websocket messages are decoded, 'str' is text messages and responses
+# with quoteJsonNumbers = False, the responses with quoteJsonNumbers = True (the default) are
+# always decoded by the json module and are shown for comparison
+
+ROUNDS = 20
+
+
+def load_payloads():
+    payloads = []
+    for path in sorted(glob.glob(root + '/ts/src/test/static/response/*.json')):
+        with open(path, encoding='utf-8') as file:
+            methods = json.load(file)['methods']
+        for results in methods.values():
+            for result in results:
+                response = result.get('httpResponse')
+                if isinstance(response, (dict, list)):
+                    payloads.append(json.dumps(response, separators=(',', ':')))
+    return payloads
+
+
+def measure(decode, payloads):
+    start = time.perf_counter()
+    for i in range(ROUNDS):
+        for payload in payloads:
+            decode(payload)
+    return (time.perf_counter() - start) / ROUNDS
+
+
+def megabytes_per_second(seconds, size):
+    return size / seconds / 1000000
+
+
+payloads = load_payloads()
+encoded = [payload.encode() for payload in payloads]
+size = sum(len(payload) for payload in encoded)
+print(f'{len(payloads)} responses, {size / 1000:.0f} kB, MB/s over {ROUNDS} rounds')
+print(f'{"":>16} | {"bytes":>8} | {"str":>8}')
+print(f'{"decode + json":>16} | {megabytes_per_second(measure(lambda data: json.loads(data.decode()), encoded), size):>8.1f} | {"":>8}')
+print(f'{"quoted json":>16} | {"":>8} | {megabytes_per_second(measure(lambda data: json.loads(data, parse_float=str, parse_int=str), payloads), size):>8.1f}')
+for name in ['json', 'orjson', 'msgspec']:
+    try:
+        decoder = get_json_decoder(name)
+    except NotSupported:
+        print(f'{name:>16} | not installed')
+        continue
+    for payload, data in zip(payloads, encoded):
+        assert decoder.loads(data) == json.loads(payload)
+    from_bytes = measure(decoder.loads, encoded)
+    from_str = measure(decoder.loads, payloads)
+    print(f'{name:>16} | {megabytes_per_second(from_bytes, size):>8.1f} | {megabytes_per_second(from_str, size):>8.1f}')
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import json
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt.async_support as ccxt  # noqa: E402
+
+# loads the markets of okx the way a freshly deployed service does it, with the responses of
+# fetch_currencies and of fetch_markets_by_type for every market type answered after a simulated
+# network latency, every request waits in the throttler of the exchange first, and compares the
+# requests sent one after another with the requests sent at once by load_markets and by the
+# fetch_markets of okx
+#
+#     python load-markets-benchmark.py [latency in milliseconds]
+
+LATENCY = float(sys.argv[1]) / 1000 if len(sys.argv) > 1 else 0.2
+TYPES = ['spot', 'future', 'swap', 'option']
+
+with open(root + '/ts/src/test/static/markets/okx.json', encoding='utf-8') as file:
+    static = list(json.load(file).values())
+
+
+class Concurrent(ccxt.okx):
+
+    async def respond(self, response):
+        await self.throttle(1)
+        await asyncio.sleep(LATENCY)
+        return response
+
+    async def fetch_currencies(self, params={}):
+        return await self.respond({})
+
+    async def fetch_markets_by_type(self, type, params={}):
+        return await self.respond([market for market in static if market['type'] == type])
+
+
+class Sequential(Concurrent):
+
+    async def fetch_markets(self, params={}):
+        result = []
+        for type in TYPES:
+            result = self.array_concat(result, await self.fetch_markets_by_type(type, params))
+        return result
+
+    async def fetch_markets_and_currencies(self, params={}):
+        currencies = await self.fetch_currencies()
+        markets = await self.fetch_markets(params)
+        return markets, currencies
+
+
+async def run(exchange_class):
+    best = None
+    for i in range(3):
+        exchange = exchange_class()
+        start = time.perf_counter()
+        markets = await exchange.load_markets()
+        elapsed = time.perf_counter() - start
+        await exchange.close()
+        best = elapsed if best is None else min(best, elapsed)
+    return best, len(markets)
+
+
+async def main():
+    print(f'{len(TYPES) + 1} requests, {LATENCY * 1e3:.0f} ms latency, {ccxt.okx().rateLimit:.0f} ms rate limit')
+    print(f'{"requests":>10} | {"markets":>7} | {"ms/load_markets":>15}')
+    for name, exchange_class in [('sequential', Sequential), ('concurrent', Concurrent)]:
+        elapsed, count = await run(exchange_class)
+        print(f'{name:>10} | {count:>7} | {elapsed * 1e3:>15.0f}')
+
+
+asyncio.run(main())
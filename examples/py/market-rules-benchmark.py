@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import random
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+
+# prepares a stream of orders the way an order pipeline does it before create_order, first with market(),
+# amount_to_precision, price_to_precision and the limits read from the market, then with the compiled
+# exchange.market_rules(symbol).validate, and checks that both return the same amounts and prices
+#
+#     python market-rules-benchmark.py [orders] [exchange ...]
+
+ORDERS = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+EXCHANGES = sys.argv[2:] or ['binance', 'okx', 'kraken', 'bybit']
+static = root + '/ts/src/test/static/markets/'
+
+random.seed(1)
+
+
+def prepare(exchange, symbol, amount, price):
+    market = exchange.market(symbol)
+    amount_string = exchange.amount_to_precision(symbol, amount)
+    price_string = exchange.price_to_precision(symbol, price)
+    limits = market['limits']
+    if limits['amount']['min'] is not None and float(amount_string) < limits['amount']['min']:
+        raise ccxt.InvalidOrder('amount')
+    if limits['amount']['max'] is not None and float(amount_string) > limits['amount']['max']:
+        raise ccxt.InvalidOrder('amount')
+    if limits['price']['min'] is not None and float(price_string) < limits['price']['min']:
+        raise ccxt.InvalidOrder('price')
+    if limits['price']['max'] is not None and float(price_string) > limits['price']['max']:
+        raise ccxt.InvalidOrder('price')
+    cost = float(amount_string) * float(price_string) * (market['contractSize'] or 1)
+    if limits['cost']['min'] is not None and cost < limits['cost']['min']:
+        raise ccxt.InvalidOrder('cost')
+    if limits['cost']['max'] is not None and cost > limits['cost']['max']:
+        raise ccxt.InvalidOrder('cost')
+    return amount_string, price_string
+
+
+def validate(exchange, symbol, amount, price):
+    return exchange.market_rules(symbol).validate(amount, price)
+
+
+def run(function, exchange, orders):
+    results = []
+    for symbol, amount, price in orders:
+        try:
+            results.append(function(exchange, symbol, amount, price))
+        except ccxt.InvalidOrder:
+            results.append(None)
+    return results
+
+
+print(f'{ORDERS} orders per exchange over the spot markets quoted in USDT')
+print(f'{"exchange":>10} | {"markets":>7} | {"us/order":>8} | {"us/validate":>11}')
+for name in EXCHANGES:
+    with open(static + name + '.json', encoding='utf-8') as file:
+        exchange = getattr(ccxt, name)({'markets': json.load(file)})
+    symbols = [symbol for symbol, market in exchange.markets.items() if market['spot'] and market['quote'] == 'USDT' and not market['inverse']]
+    orders = [(random.choice(symbols), random.uniform(0.001, 100), random.uniform(0.01, 50000)) for i in range(ORDERS)]
+    timings = []
+    results = []
+    for function in [prepare, validate]:
+        best = None
+        for i in range(5):
+            start = time.perf_counter()
+            result = run(function, exchange, orders)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        timings.append(best / ORDERS * 1e6)
+        results.append(result)
+    assert [result is None for result in results[0]] == [result is None for result in results[1]]
+    assert [result for result in results[0] if result is not None] == [result for result in results[1] if result is not None]
+    print(f'{name:>10} | {len(symbols):>7} | {timings[0]:>8.2f} | {timings[1]:>11.2f}')
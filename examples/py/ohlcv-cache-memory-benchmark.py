@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+from ccxt.async_support.base.ws.cache import ArrayCacheByTimestamp, ColumnarCacheByTimestamp  # noqa: E402
+
+# fills the ohlcv caches of many symbols and timeframes the way watch_ohlcv_for_symbols does it
+# with every candle updated a few times, and measures the memory they take with the candles in lists
+# and in columns (exchange.ohlcvColumnar = True), then how long it takes to read the closes of a cache
+#
+#     python ohlcv-cache-memory-benchmark.py [caches] [candles per cache]
+
+CACHES = int(sys.argv[1]) if len(sys.argv) > 1 else 1200  # 300 symbols x 4 timeframes
+CANDLES = int(sys.argv[2]) if len(sys.argv) > 2 else 1000  # the default OHLCVLimit
+UPDATES = 3  # per candle
+
+random.seed(1)
+
+
+def candles():
+    result = []
+    price = random.uniform(1, 1000)
+    for j in range(CANDLES):
+        for k in range(UPDATES):
+            price *= random.uniform(0.999, 1.001)
+            result.append([str(1700000000000 + j * 60000)] + ['%.8f' % value for value in [price, price * 1.001, price * 0.999, price, random.uniform(0, 100)]])
+    return result
+
+
+def fill(cache_class, streams):
+    caches = []
+    for stream in streams:
+        cache = cache_class(CANDLES)
+        for i, candle in enumerate(stream):
+            # the exchanges parse a new candle for every update
+            cache.append([int(candle[0]), float(candle[1]), float(candle[2]), float(candle[3]), float(candle[4]), float(candle[5])])
+            if i % UPDATES == 0:
+                cache.getLimit(None, None)
+        caches.append(cache)
+    return caches
+
+
+def measure(cache_class, streams):
+    gc.collect()
+    tracemalloc.start()
+    caches = fill(cache_class, streams)
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del caches
+    start = time.perf_counter()
+    caches = fill(cache_class, streams[:50])
+    appending = (time.perf_counter() - start) / (50 * CANDLES * UPDATES)
+    return caches, current, appending
+
+
+def closes(cache):
+    if isinstance(cache, ColumnarCacheByTimestamp):
+        return cache.to_arrays()[4]
+    return [candle[4] for candle in cache]
+
+
+print(f'{CACHES} caches of {CANDLES} candles')
+print(f'{"cache":>26} | {"MB":>8} | {"B/candle":>8} | {"us/append":>10} | {"us/closes":>10}')
+streams = [candles() for i in range(CACHES)]
+for cache_class in [ArrayCacheByTimestamp, ColumnarCacheByTimestamp]:
+    caches, size, appending = measure(cache_class, streams)
+    start = time.perf_counter()
+    for cache in caches:
+        closes(cache)
+    reading = (time.perf_counter() - start) / len(caches)
+    print(f'{cache_class.__name__:>26} | {size / 1e6:>8.1f} | {size / (CACHES * CANDLES):>8.0f} | {appending * 1e6:>10.2f} | {reading * 1e6:>10.2f}')
+    del caches
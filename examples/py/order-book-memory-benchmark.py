@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+from ccxt.async_support.base.ws.order_book import OrderBook, CountedOrderBook  # noqa: E402
+
+# fills many deep order books the way the exchange handlers do it and measures the memory
+# they take with the levels in lists and with compact=True, then how long it takes
+# to apply the updates and to read the top levels and the whole books
+#
+#     python order-book-memory-benchmark.py [books] [levels per side]
+
+BOOKS = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+LEVELS = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+UPDATES = 200  # per book, 20 levels each
+
+random.seed(1)
+
+
+def snapshot(counted):
+    def level(price):
+        result = ['%.2f' % price, '%.4f' % random.uniform(0.001, 5)]
+        if counted:
+            result.append(str(random.randint(1, 9)))
+        return result
+    return {
+        'bids': [level(30000 - i * 0.01) for i in range(LEVELS)],
+        'asks': [level(30000.01 + i * 0.01) for i in range(LEVELS)],
+    }
+
+
+def updates(counted):
+    result = []
+    for i in range(UPDATES):
+        deltas = []
+        for j in range(20):
+            distance = min(int(random.expovariate(20 / LEVELS)), LEVELS)
+            price = 30000 - distance * 0.01 if j % 2 else 30000.01 + distance * 0.01
+            delta = ['%.2f' % price, '0' if random.random() < 0.3 else '%.4f' % random.uniform(0.001, 5)]
+            if counted:
+                delta.append('0' if delta[1] == '0' else str(random.randint(1, 9)))
+            deltas.append(delta)
+        result.append(deltas)
+    return result
+
+
+def fill(book_class, compact, snapshots):
+    gc.collect()
+    tracemalloc.start()
+    books = []
+    for data in snapshots:
+        orderbook = book_class({}, None, False, compact)
+        orderbook['bids'].apply_deltas(data['bids'])
+        orderbook['asks'].apply_deltas(data['asks'])
+        books.append(orderbook)
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return books, current
+
+
+def measure(books, stream):
+    start = time.perf_counter()
+    for orderbook in books:
+        for deltas in stream:
+            orderbook['bids'].apply_deltas(deltas)
+            orderbook['asks'].apply_deltas(deltas)
+    applying = time.perf_counter() - start
+    start = time.perf_counter()
+    for orderbook in books:
+        for i in range(100):
+            orderbook['bids'][:10]
+            orderbook['asks'][:10]
+    top = time.perf_counter() - start
+    start = time.perf_counter()
+    for orderbook in books:
+        list(orderbook['bids'])
+        list(orderbook['asks'])
+    whole = time.perf_counter() - start
+    return applying, top, whole
+
+
+print(f'{BOOKS} books, {LEVELS} levels per side')
+print(f'{"book":>16} | {"compact":>7} | {"MB":>8} | {"B/level":>8} | {"us/update":>10} | {"us/top 10":>10} | {"ms/book":>8}')
+for book_class in [OrderBook, CountedOrderBook]:
+    counted = book_class is CountedOrderBook
+    snapshots = [snapshot(counted) for i in range(BOOKS)]
+    stream = updates(counted)
+    for compact in [False, True]:
+        books, size = fill(book_class, compact, snapshots)
+        levels = sum(len(orderbook['bids']) + len(orderbook['asks']) for orderbook in books)
+        applying, top, whole = measure(books[:50], stream)
+        print(f'{book_class.__name__:>16} | {str(compact):>7} | {size / 1e6:>8.1f} | {size / levels:>8.0f} | {applying / (50 * UPDATES * 2) * 1e6:>10.2f} | {top / (50 * 100 * 2) * 1e6:>10.2f} | {whole / 50 * 1e3:>8.3f}')
+        del books
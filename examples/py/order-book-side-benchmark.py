@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import random
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+from ccxt.async_support.base.ws.order_book import OrderBook, CountedOrderBook  # noqa: E402
+
+# replays depth streams into order books the way the exchange handlers do it,
+# either one storeArray call per price level with prices and amounts parsed from strings
+# or one apply_deltas call per side of a message
+#
+#     python order-book-side-benchmark.py [recording.jsonl ...]
+#
+# a recording has one depth message per line, either binance-like {"b": [...], "a": [...]}
+# or {"bids": [...], "asks": [...]}, the first line is used as the snapshot
+# without recordings the streams are generated, most updates hit the levels near the top
+
+random.seed(1)
+
+
+def generate(name, depth, messages, levels, counted=False):
+    tick = 0.01
+    mid = 30000.0
+
+    def level(side, distance, size):
+        price = mid - distance * tick if side == 'bids' else mid + tick + distance * tick
+        result = ['%.2f' % price, size]
+        if counted:
+            result.append('0' if size == '0' else str(random.randint(1, 9)))
+        return result
+
+    snapshot = {
+        'bids': [level('bids', i, '%.4f' % random.uniform(0.001, 5)) for i in range(depth)],
+        'asks': [level('asks', i, '%.4f' % random.uniform(0.001, 5)) for i in range(depth)],
+    }
+    stream = []
+    for i in range(messages):
+        message = {'bids': [], 'asks': []}
+        for j in range(levels):
+            side = 'bids' if j % 2 else 'asks'
+            # distance from the top of the book, exponentially distributed
+            distance = min(int(random.expovariate(1 / (depth / 20))), depth + depth // 10)
+            size = '0' if random.random() < 0.3 else '%.4f' % random.uniform(0.001, 5)
+            message[side].append(level(side, distance, size))
+        stream.append(message)
+    return name, snapshot, stream
+
+
+def load(path):
+    with open(path, encoding='utf-8') as file:
+        messages = [json.loads(line) for line in file if line.strip()]
+    messages = [{'bids': message.get('b', message.get('bids', [])), 'asks': message.get('a', message.get('asks', []))} for message in messages]
+    return os.path.basename(path), messages[0], messages[1:]
+
+
+def replay(book_class, snapshot, stream, bulk):
+    orderbook = book_class()
+    counted = book_class is CountedOrderBook
+    parse = (lambda level: [float(level[0]), float(level[1]), int(level[2])]) if counted else (lambda level: [float(level[0]), float(level[1])])
+    orderbook.reset({'bids': [parse(level) for level in snapshot['bids']], 'asks': [parse(level) for level in snapshot['asks']]})
+    bids = orderbook['bids']
+    asks = orderbook['asks']
+    start = time.perf_counter()
+    levels = 0
+    for message in stream:
+        if bulk:
+            bids.apply_deltas(message['bids'])
+            asks.apply_deltas(message['asks'])
+        else:
+            for level in message['bids']:
+                bids.storeArray(parse(level))
+            for level in message['asks']:
+                asks.storeArray(parse(level))
+        levels += len(message['bids']) + len(message['asks'])
+    elapsed = time.perf_counter() - start
+    return levels, elapsed, len(bids) + len(asks)
+
+
+streams = [load(path) for path in sys.argv[1:]] or [
+    generate('binance 1000', 1000, 20000, 20),
+    generate('binance 5000', 5000, 20000, 20),
+    generate('kraken 1000', 1000, 20000, 4),
+    generate('bitfinex counted', 250, 20000, 10, True),
+]
+
+print(f'{"stream":>20} | {"book":>16} | {"method":>12} | {"levels":>8} | {"ns/level":>10} | {"levels/s":>10} | {"size":>6}')
+for name, snapshot, stream in streams:
+    counted = len(snapshot['bids'][0]) > 2 if snapshot['bids'] else False
+    book_class = CountedOrderBook if counted else OrderBook
+    for method in ['storeArray', 'apply_deltas']:
+        levels, elapsed, size = replay(book_class, snapshot, stream, method == 'apply_deltas')
+        print(f'{name:>20} | {book_class.__name__:>16} | {method:>12} | {levels:>8} | {elapsed / levels * 1e9:>10.0f} | {levels / elapsed:>10.0f} | {size:>6}')
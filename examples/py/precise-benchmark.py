@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+import glob
+import json
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+from ccxt.base.precise import Precise  # noqa: E402
+
+# replays the responses recorded for the static response tests of the methods that parse trades,
+# tickers and orders, with the fetch method of the exchanges replaced by the recorded response
+# and counts the Precise calls they make, then compares chained string_ calls with Precise.expr
+#
+#     python precise-benchmark.py [exchange ...]
+
+METHODS = ['fetchTrades', 'fetchMyTrades', 'fetchTicker', 'fetchTickers', 'fetchOrders', 'fetchOpenOrders', 'fetchClosedOrders']
+ROUNDS = 20
+static = root + '/ts/src/test/static'
+
+
+def load(path):
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)
+
+
+def cases(names):
+    result = []
+    for path in sorted(glob.glob(static + '/response/*.json')):
+        name = os.path.basename(path)[:-5]
+        if (names and name not in names) or not hasattr(ccxt, name):
+            continue
+        data = load(path)
+        markets_path = static + '/markets/' + name + '.json'
+        currencies_path = static + '/currencies/' + name + '.json'
+        exchange = getattr(ccxt, name)({
+            'markets': load(markets_path) if os.path.exists(markets_path) else None,
+            'currencies': load(currencies_path) if os.path.exists(currencies_path) else None,
+            'apiKey': 'key',
+            'secret': 'secretsecret',
+            'password': 'password',
+            'uid': 'uid',
+            'enableRateLimit': False,
+        })
+        for method in METHODS:
+            for test in data['methods'].get(method, []):
+                result.append((exchange, method, test['input'], test['httpResponse']))
+    return result
+
+
+def replay(tests):
+    for exchange, method, arguments, response in tests:
+        exchange.fetch = lambda url, method='GET', headers=None, body=None, response=response: response
+        try:
+            getattr(exchange, method)(*arguments)
+        except Exception:
+            pass
+
+
+def count_calls(tests):
+    counts = {}
+    originals = {}
+    for name in dir(Precise):
+        if name.startswith('string_'):
+            originals[name] = getattr(Precise, name)
+
+            def counted(*arguments, name=name):
+                counts[name] = counts.get(name, 0) + 1
+                return originals[name](*arguments)
+            setattr(Precise, name, staticmethod(counted))
+    replay(tests)
+    for name, method in originals.items():
+        setattr(Precise, name, staticmethod(method))
+    return counts
+
+
+tests = cases(sys.argv[1:])
+counts = count_calls(tests)
+replay(tests)
+start = time.perf_counter()
+for i in range(ROUNDS):
+    replay(tests)
+elapsed = (time.perf_counter() - start) / ROUNDS
+print(f'{len(tests)} recorded responses of {", ".join(METHODS)}')
+print(f'{elapsed * 1000:.1f} ms per replay, {sum(counts.values())} Precise calls per replay')
+for name, count in sorted(counts.items(), key=lambda item: -item[1])[:8]:
+    print(f'{name:>16} | {count:>8}')
+
+# a trade cost and fee as the exchanges compute them, with a few prices repeating
+prices = ['%.2f' % (30000 + i % 50 * 0.5) for i in range(1000)]
+amounts = ['%.4f' % (0.001 * (i % 37 + 1)) for i in range(1000)]
+rate = '0.001'
+
+
+def trades():
+    for price, amount in zip(prices, amounts):
+        cost = Precise.string_mul(price, amount)
+        Precise.string_sub(cost, Precise.string_mul(cost, rate))
+
+
+def expressions():
+    for price, amount in zip(prices, amounts):
+        Precise.expr('price * amount * (1 - rate)', price=price, amount=amount, rate=rate)
+
+
+print(f'{"":>24} | {"us/trade":>10}')
+for name, function in [('string_mul + string_sub', trades), ('expr', expressions)]:
+    best = None
+    for i in range(5):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f'{name:>24} | {best / len(prices) * 1e6:>10.2f}')
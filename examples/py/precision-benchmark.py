@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import random
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+
+# rounds the prices and amounts of a grid of orders to the precision of a few markets one by one
+# with price_to_precision and amount_to_precision, and all at once with prices_to_precision
+# and amounts_to_precision, checks that both return the same strings and compares the times
+#
+#     python precision-benchmark.py [orders] [exchange ...]
+
+ORDERS = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+EXCHANGES = sys.argv[2:] or ['binance', 'okx', 'kraken', 'bybit']
+static = root + '/ts/src/test/static/markets/'
+
+random.seed(1)
+
+
+def best_of(function, rounds=5):
+    best = None
+    for i in range(rounds):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+print(f'{ORDERS} prices and amounts per market')
+print(f'{"market":>24} | {"mode":>4} | {"us/price":>8} | {"us/prices":>9} | {"us/amount":>9} | {"us/amounts":>10}')
+for name in EXCHANGES:
+    with open(static + name + '.json', encoding='utf-8') as file:
+        exchange = getattr(ccxt, name)({'markets': json.load(file)})
+    symbol = 'BTC/USDT' if 'BTC/USDT' in exchange.markets else exchange.symbols[0]
+    prices = [random.uniform(20000, 40000) for i in range(ORDERS)]
+    amounts = [random.uniform(0.01, 2) for i in range(ORDERS)]
+    row = []
+    for scalar, batch, values in [
+        (exchange.price_to_precision, exchange.prices_to_precision, prices),
+        (exchange.amount_to_precision, exchange.amounts_to_precision, amounts),
+    ]:
+        expected, one_by_one = best_of(lambda: [scalar(symbol, value) for value in values])
+        result, at_once = best_of(lambda: batch(symbol, values))
+        assert result == expected
+        row += [one_by_one / ORDERS * 1e6, at_once / ORDERS * 1e6]
+    print(f'{name + " " + symbol:>24} | {exchange.precisionMode:>4} | {row[0]:>8.2f} | {row[1]:>9.2f} | {row[2]:>9.2f} | {row[3]:>10.2f}')
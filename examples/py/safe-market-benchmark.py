@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+
+# resolves the market ids of the static markets of the tests with safe_symbol the way the parsers of
+# fetch_tickers, fetch_trades and fetch_orders do it, the ids shared by several markets with their type,
+# and reports the time per call for the known ids and for the unknown ids split by a delimiter
+#
+#     python safe-market-benchmark.py [rounds] [exchange ...]
+
+ROUNDS = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+EXCHANGES = sys.argv[2:] or ['binance', 'okx', 'bybit', 'kraken', 'gate']
+static = root + '/ts/src/test/static/markets/'
+
+
+def best(function, calls):
+    result = None
+    for i in range(5):
+        start = time.perf_counter()
+        for j in range(ROUNDS):
+            function()
+        elapsed = time.perf_counter() - start
+        result = elapsed if result is None else min(result, elapsed)
+    return result / ROUNDS / calls * 1e6
+
+
+print(f'{"exchange":>10} | {"ids":>4} | {"us/known id":>11} | {"us/unknown id":>13}')
+for name in EXCHANGES:
+    with open(static + name + '.json', encoding='utf-8') as file:
+        exchange = getattr(ccxt, name)({'markets': json.load(file)})
+    calls = [(market_id, markets[0]['type'] if len(markets) > 1 else None) for market_id, markets in exchange.markets_by_id.items()]
+    unknown = ['UNKNOWN' + str(i) + '_USDT' for i in range(len(calls))]
+
+    def known_ids():
+        for market_id, market_type in calls:
+            exchange.safe_symbol(market_id, None, None, market_type)
+
+    def unknown_ids():
+        for market_id in unknown:
+            exchange.safe_symbol(market_id, None, '_')
+
+    print(f'{name:>10} | {len(calls):>4} | {best(known_ids, len(calls)):>11.2f} | {best(unknown_ids, len(unknown)):>13.2f}')
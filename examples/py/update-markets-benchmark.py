@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+import copy
+import json
+import os
+import random
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+
+# grows the static markets of the tests to thousands of markets the way the option chains do it,
+# loads them with set_markets and with apply_markets like load_markets does it, then reloads them
+# with a few listings, delistings and changes the way a service that polls for new listings does it,
+# and checks that both leave the same markets and currencies
+#
+#     python update-markets-benchmark.py [markets] [exchange ...]
+
+MARKETS = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+EXCHANGES = sys.argv[2:] or ['binance', 'okx', 'bybit', 'kraken']
+ATTRIBUTES = ['markets', 'markets_by_id', 'symbols', 'ids', 'currencies', 'currencies_by_id', 'codes', 'baseCurrencies', 'quoteCurrencies']
+static = root + '/ts/src/test/static/markets/'
+
+random.seed(1)
+
+
+def grow(markets, count):
+    result = []
+    for i in range(count):
+        market = copy.deepcopy(markets[i % len(markets)])
+        if i >= len(markets):
+            suffix = '-' + str(i // len(markets))
+            market['symbol'] += suffix
+            market['id'] += suffix
+            market['base'] += suffix
+        result.append(market)
+    return result
+
+
+def relist(markets):
+    # one percent of the markets change, a few are delisted and a few are listed
+    result = [copy.deepcopy(market) for market in markets]
+    for market in random.sample(result, len(result) // 100):
+        market['active'] = not market['active']
+    for i in range(len(result) // 1000):
+        del result[random.randrange(len(result))]
+    for i in range(len(result) // 1000):
+        market = copy.deepcopy(random.choice(markets))
+        market['symbol'] += '-listed' + str(i)
+        market['id'] += '-listed' + str(i)
+        result.append(market)
+    return result
+
+
+def best(function, rounds=5):
+    result = None
+    for i in range(rounds):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        result = elapsed if result is None else min(result, elapsed)
+    return result * 1e3
+
+
+print(f'{"exchange":>10} | {"markets":>7} | {"ms/set_markets":>14} | {"ms/apply_markets":>16} | {"ms/reload set":>13} | {"ms/reload apply":>15}')
+for name in EXCHANGES:
+    with open(static + name + '.json', encoding='utf-8') as file:
+        loaded = grow(list(json.load(file).values()), MARKETS)
+    reloaded = relist(loaded)
+    exchange_class = getattr(ccxt, name)
+    first = exchange_class()
+    second = exchange_class()
+    load = best(lambda: first.set_markets(loaded))
+    apply = best(lambda: exchange_class().apply_markets(loaded))
+
+    def reload(exchange, method):
+        getattr(exchange, method)(loaded)
+        start = time.perf_counter()
+        getattr(exchange, method)(reloaded)
+        return time.perf_counter() - start
+
+    reload_set = min(reload(first, 'set_markets') for i in range(5)) * 1e3
+    reload_apply = min(reload(second, 'apply_markets') for i in range(5)) * 1e3
+    for attribute in ATTRIBUTES:
+        # in the same order too
+        assert repr(getattr(first, attribute)) == repr(getattr(second, attribute)), attribute
+    print(f'{name:>10} | {len(loaded):>7} | {load:>14.1f} | {apply:>16.1f} | {reload_set:>13.1f} | {reload_apply:>15.1f}')
@@ -4834,10 +4834,7 @@ class Exchange {
     }
 
     public function safe_market(?string $marketId, ?array $market = null, ?string $delimiter = null, ?string $marketType = null) {
-        $result = $this->safe_market_structure(array(
-            'symbol' => $marketId,
-            'marketId' => $marketId,
-        ));
+        // the $markets of markets_by_id are returned as they are, the structure is only made for the unknown ids
         if ($marketId !== null) {
             if (($this->markets_by_id !== null) && (is_array($this->markets_by_id) && array_key_exists($marketId, $this->markets_by_id))) {
                 $markets = $this->markets_by_id[$marketId];
@@ -4860,6 +4857,10 @@ class Exchange {
                     }
                 }
             } elseif ($delimiter !== null && $delimiter !== '') {
+                $result = $this->safe_market_structure(array(
+                    'symbol' => $marketId,
+                    'marketId' => $marketId,
+                ));
                 $parts = explode($delimiter, $marketId);
                 $partsLength = count($parts);
                 if ($partsLength === 2) {
@@ -4877,7 +4878,10 @@ class Exchange {
         if ($market !== null) {
             return $market;
         }
-        return $result;
+        return $this->safe_market_structure(array(
+            'symbol' => $marketId,
+            'marketId' => $marketId,
+        ));
     }
 
     public function check_required_credentials($error = true) {
@@ -2929,10 +2929,7 @@ class Exchange extends \ccxt\Exchange {
     }
 
     public function safe_market(?string $marketId, ?array $market = null, ?string $delimiter = null, ?string $marketType = null) {
-        $result = $this->safe_market_structure(array(
-            'symbol' => $marketId,
-            'marketId' => $marketId,
-        ));
+        // the $markets of markets_by_id are returned as they are, the structure is only made for the unknown ids
         if ($marketId !== null) {
             if (($this->markets_by_id !== null) && (is_array($this->markets_by_id) && array_key_exists($marketId, $this->markets_by_id))) {
                 $markets = $this->markets_by_id[$marketId];
@@ -2955,6 +2952,10 @@ class Exchange extends \ccxt\Exchange {
                     }
                 }
             } elseif ($delimiter !== null && $delimiter !== '') {
+                $result = $this->safe_market_structure(array(
+                    'symbol' => $marketId,
+                    'marketId' => $marketId,
+                ));
                 $parts = explode($delimiter, $marketId);
                 $partsLength = count($parts);
                 if ($partsLength === 2) {
@@ -2972,7 +2973,10 @@ class Exchange extends \ccxt\Exchange {
         if ($market !== null) {
             return $market;
         }
-        return $result;
+        return $this->safe_market_structure(array(
+            'symbol' => $marketId,
+            'marketId' => $marketId,
+        ));
     }
 
     public function check_required_credentials($error = true) {
@@ -211,6 +211,7 @@ class coinmetro extends Exchange {
             'precisionMode' => DECIMAL_PLACES,
             // exchange-specific options
             'options' => array(
+                'loadCurrenciesBeforeMarkets' => true,
                 'currenciesByIdForParseMarket' => null,
                 'currencyIdsListForParseMarket' => null,
             ),
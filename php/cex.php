@@ -189,6 +189,7 @@ class cex extends Exchange {
                 ),
             ),
             'options' => array(
+                'loadCurrenciesBeforeMarkets' => true,
                 'fetchOHLCVWarning' => true,
                 'createMarketBuyOrderRequiresPrice' => true,
                 'order' => array(
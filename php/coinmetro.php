@@ -206,6 +206,7 @@ class coinmetro extends Exchange {
             'precisionMode' => DECIMAL_PLACES,
             // exchange-specific options
             'options' => array(
+                'loadCurrenciesBeforeMarkets' => true,
                 'currenciesByIdForParseMarket' => null,
                 'currencyIdsListForParseMarket' => null,
             ),
@@ -212,6 +212,7 @@ class latoken extends Exchange {
                 ),
             ),
             'options' => array(
+                'loadCurrenciesBeforeMarkets' => true,
                 'defaultType' => 'spot',
                 'types' => array(
                     'wallet' => 'ACCOUNT_TYPE_WALLET',
@@ -64,6 +64,27 @@ class OrderBookSide extends \ArrayObject implements \JsonSerializable {
         $this->storeArray(array($price, $size));
     }
 
+    public function apply_deltas(...$args) {
+        return $this->applyDeltas(...$args);
+    }
+
+    // stores raw price levels like [["31738.3", "0.05973179"], ...] in one call
+    // prices and amounts can be strings or numbers
+    public function applyDeltas($deltas, $price_index = 0, $amount_index = 1) {
+        foreach ($deltas as $delta) {
+            $this->storeArray(array(floatval($delta[$price_index]), floatval($delta[$amount_index])));
+        }
+    }
+
+    // the [price, amount] strings of the first levels, for the checksums
+    public function topStrings($depth) {
+        $result = array();
+        foreach (array_slice($this->getArrayCopy(), 0, $depth) as $level) {
+            $result[] = array(\ccxt\Exchange::number_to_string($level[0]), \ccxt\Exchange::number_to_string($level[1]));
+        }
+        return $result;
+    }
+
     public function limit() {
         $difference = count($this) - $this->depth;
         if ($difference > 0) {
@@ -122,6 +143,12 @@ class CountedOrderBookSide extends OrderBookSide {
         $this->storeArray(array($price, $size, $id));
     }
 
+    public function applyDeltas($deltas, $price_index = 0, $amount_index = 1, $count_index = 2) {
+        foreach ($deltas as $delta) {
+            $this->storeArray(array(floatval($delta[$price_index]), floatval($delta[$amount_index]), intval($delta[$count_index])));
+        }
+    }
+
     public function storeArray($delta) {
         $price = $delta[0];
         $size = $delta[1];
@@ -165,6 +192,14 @@ class IndexedOrderBookSide extends OrderBookSide {
         $this->storeArray(array($price, $size, $id));
     }
 
+    public function applyDeltas($deltas, $price_index = 0, $amount_index = 1, $id_index = 2) {
+        // the price can be missing when an order is changed or deleted
+        foreach ($deltas as $delta) {
+            $price = $delta[$price_index];
+            $this->storeArray(array($price === null ? null : floatval($price), floatval($delta[$amount_index]), $delta[$id_index]));
+        }
+    }
+
     public function storeArray($delta) {
         $price = $delta[0];
         $size = $delta[1];
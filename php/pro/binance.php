@@ -784,9 +784,7 @@ class binance extends \ccxt\async\binance {
     }
 
     public function handle_deltas($bookside, $deltas) {
-        for ($i = 0; $i < count($deltas); $i++) {
-            $this->handle_delta($bookside, $deltas[$i]);
-        }
+        $bookside->applyDeltas ($deltas);
     }
 
     public function handle_order_book_message(Client $client, $message, $orderbook) {
@@ -680,19 +680,33 @@ class bitfinex2 extends \ccxt\async\bitfinex2 {
         $asks = $book['asks'];
         $prec = $this->safe_string($subscription, 'prec', 'P0');
         $isRaw = ($prec === 'R0');
-        $idToCheck = $isRaw ? 2 : 0;
-        // pepperoni pizza from bitfinex
-        for ($i = 0; $i < $depth; $i++) {
-            $bid = $this->safe_value($bids, $i);
-            $ask = $this->safe_value($asks, $i);
-            if ($bid !== null) {
-                $stringArray[] = $this->number_to_string($bids[$i][$idToCheck]);
-                $stringArray[] = $this->number_to_string($bids[$i][1]);
+        if ($isRaw) {
+            // the raw books are checked with the order ids instead of the prices
+            // pepperoni pizza from bitfinex
+            for ($i = 0; $i < $depth; $i++) {
+                $bid = $this->safe_value($bids, $i);
+                $ask = $this->safe_value($asks, $i);
+                if ($bid !== null) {
+                    $stringArray[] = $this->number_to_string($bids[$i][2]);
+                    $stringArray[] = $this->number_to_string($bids[$i][1]);
+                }
+                if ($ask !== null) {
+                    $stringArray[] = $this->number_to_string($asks[$i][2]);
+                    $stringArray[] = Precise::string_neg($this->number_to_string($asks[$i][1]));
+                }
             }
-            if ($ask !== null) {
-                $stringArray[] = $this->number_to_string($asks[$i][$idToCheck]);
-                $aski1 = $asks[$i][1];
-                $stringArray[] = $this->number_to_string(-$aski1);
+        } else {
+            $bidStrings = $bids->topStrings ($depth);
+            $askStrings = $asks->topStrings ($depth);
+            for ($i = 0; $i < $depth; $i++) {
+                if ($i < count($bidStrings)) {
+                    $stringArray[] = $bidStrings[$i][0];
+                    $stringArray[] = $bidStrings[$i][1];
+                }
+                if ($i < count($askStrings)) {
+                    $stringArray[] = $askStrings[$i][0];
+                    $stringArray[] = Precise::string_neg($askStrings[$i][1]);
+                }
             }
         }
         $payload = implode(':', $stringArray);
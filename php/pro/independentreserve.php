@@ -240,7 +240,7 @@ class independentreserve extends \ccxt\async\independentreserve {
     }
 
     public function value_to_checksum($value) {
-        $result = sprintf('%.8f', $value);
+        $result = sprintf('%.8f', floatval($value));
         $result = str_replace('.', '', $result);
         // remove leading zeros
         $result = $this->parse_number($result);
@@ -788,12 +788,14 @@ class kraken extends \ccxt\async\kraken {
                 $amountLength = strlen($amountParts[1]) - 0;
                 $payloadArray = array();
                 if ($c !== null) {
-                    for ($i = 0; $i < 10; $i++) {
-                        $formatted = $this->format_number($storedAsks[$i][0], $priceLength) . $this->format_number($storedAsks[$i][1], $amountLength);
+                    $askStrings = $storedAsks->topStrings (10);
+                    $bidStrings = $storedBids->topStrings (10);
+                    for ($i = 0; $i < count($askStrings); $i++) {
+                        $formatted = $this->format_number($askStrings[$i][0], $priceLength) . $this->format_number($askStrings[$i][1], $amountLength);
                         $payloadArray[] = $formatted;
                     }
-                    for ($i = 0; $i < 10; $i++) {
-                        $formatted = $this->format_number($storedBids[$i][0], $priceLength) . $this->format_number($storedBids[$i][1], $amountLength);
+                    for ($i = 0; $i < count($bidStrings); $i++) {
+                        $formatted = $this->format_number($bidStrings[$i][0], $priceLength) . $this->format_number($bidStrings[$i][1], $amountLength);
                         $payloadArray[] = $formatted;
                     }
                 }
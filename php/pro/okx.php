@@ -922,9 +922,7 @@ class okx extends \ccxt\async\okx {
     }
 
     public function handle_deltas($bookside, $deltas) {
-        for ($i = 0; $i < count($deltas); $i++) {
-            $this->handle_delta($bookside, $deltas[$i]);
-        }
+        $bookside->applyDeltas ($deltas);
     }
 
     public function handle_order_book_message(Client $client, $message, $orderbook, $messageHash) {
@@ -954,17 +952,19 @@ class okx extends \ccxt\async\okx {
         $symbol = $this->safe_symbol($marketId);
         $checksum = $this->safe_bool($this->options, 'checksum', true);
         if ($checksum) {
-            $asksLength = count($storedAsks);
-            $bidsLength = count($storedBids);
+            $bidStrings = $storedBids->topStrings (25);
+            $askStrings = $storedAsks->topStrings (25);
+            $asksLength = count($askStrings);
+            $bidsLength = count($bidStrings);
             $payloadArray = array();
             for ($i = 0; $i < 25; $i++) {
                 if ($i < $bidsLength) {
-                    $payloadArray[] = $this->number_to_string($storedBids[$i][0]);
-                    $payloadArray[] = $this->number_to_string($storedBids[$i][1]);
+                    $payloadArray[] = $bidStrings[$i][0];
+                    $payloadArray[] = $bidStrings[$i][1];
                 }
                 if ($i < $asksLength) {
-                    $payloadArray[] = $this->number_to_string($storedAsks[$i][0]);
-                    $payloadArray[] = $this->number_to_string($storedAsks[$i][1]);
+                    $payloadArray[] = $askStrings[$i][0];
+                    $payloadArray[] = $askStrings[$i][1];
                 }
             }
             $payload = implode(':', $payloadArray);
@@ -0,0 +1,135 @@
+import asyncio
+import multiprocessing
+import threading
+from time import time
+
+# a token bucket that several throttlers draw from, so that exchange instances
+# sharing one API key or IP address stay within one rate limit together
+#
+#     budget = Budget({'refillRate': 1 / 50})
+#     first = ccxt.binance({'tokenBucket': {'budget': budget}})
+#     second = ccxt.binance({'tokenBucket': {'budget': budget}})
+#
+# every budget has a coroutine acquire(cost, threshold) that takes `cost` tokens
+# if the bucket holds at least `threshold` tokens and returns 0, otherwise it takes
+# nothing and returns the number of milliseconds until there will be enough tokens
+
+
+def take(tokens, timestamp, config, cost, threshold, now):
+    if tokens < config['capacity']:
+        tokens = min(tokens + (now - timestamp) * config['refillRate'], config['capacity'])
+    if tokens >= threshold:
+        return tokens - cost, 0
+    return tokens, (threshold - tokens) / config['refillRate']
+
+
+class Budget:
+    """A budget shared by the exchange instances of one process"""
+
+    def __init__(self, config):
+        self.config = {
+            'refillRate': 1.0,
+            'capacity': 1.0,
+            'tokens': 0,
+        }
+        self.config.update(config)
+        self.tokens = self.config['tokens']
+        self.timestamp = time() * 1000
+        # instances can run on event loops in different threads
+        self.lock = threading.Lock()
+
+    async def acquire(self, cost, threshold=0):
+        with self.lock:
+            now = time() * 1000
+            self.tokens, delay = take(self.tokens, self.timestamp, self.config, cost, threshold, now)
+            self.timestamp = now
+            return delay
+
+
+class SharedBudget:
+    """A budget in shared memory for the processes started with the multiprocessing module,
+    it has to be passed to them as an argument of the Process or the initializer of the Pool"""
+
+    def __init__(self, config):
+        self.config = {
+            'refillRate': 1.0,
+            'capacity': 1.0,
+            'tokens': 0,
+        }
+        self.config.update(config)
+        # tokens and the timestamp of the last refill, guarded by the lock of the array
+        self.state = multiprocessing.Array('d', [self.config['tokens'], time() * 1000])
+
+    async def acquire(self, cost, threshold=0):
+        with self.state.get_lock():
+            now = time() * 1000
+            self.state[0], delay = take(self.state[0], self.state[1], self.config, cost, threshold, now)
+            self.state[1] = now
+            return delay
+
+
+class BudgetServer:
+    """Serves a budget over a unix socket to SocketBudget clients in other processes"""
+
+    def __init__(self, path, config):
+        self.path = path
+        self.budget = Budget(config)
+        self.server = None
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                cost, threshold = line.split()
+                delay = await self.budget.acquire(float(cost), float(threshold))
+                writer.write(repr(delay).encode() + b'\n')
+                await writer.drain()
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self):
+        self.server = await asyncio.start_unix_server(self.handle, self.path)
+        return self
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+
+class SocketBudget:
+    """A budget that is kept by a BudgetServer listening on a unix socket"""
+
+    def __init__(self, path):
+        self.path = path
+        self.reader = None
+        self.writer = None
+        self.lock = None
+
+    async def acquire(self, cost, threshold=0):
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+        async with self.lock:
+            if self.writer is None:
+                self.reader, self.writer = await asyncio.open_unix_connection(self.path)
+            try:
+                self.writer.write((repr(float(cost)) + ' ' + repr(float(threshold)) + '\n').encode())
+                await self.writer.drain()
+                line = await self.reader.readline()
+                if not line:
+                    raise ConnectionError('budget server at ' + self.path + ' closed the connection')
+                return float(line)
+            except Exception:
+                self.close()
+                raise
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.reader = None
+            self.writer = None
@@ -13,6 +13,7 @@ import certifi
 import aiohttp
 import ssl
 import sys
+import time
 import yarl
 import math
 from typing import Any, List
@@ -20,7 +21,7 @@ from ccxt.base.types import Int, Str, Num, Strings
 
 # -----------------------------------------------------------------------------
 
-from ccxt.async_support.base.throttler import Throttler
+from ccxt.async_support.base.throttler import Throttler, request_lane
 
 # -----------------------------------------------------------------------------
 
@@ -37,6 +38,7 @@ from ccxt.async_support.base.ws.functions import inflate, inflate64, gunzip
 from ccxt.async_support.base.ws.fast_client import FastClient
 from ccxt.async_support.base.ws.future import Future
 from ccxt.async_support.base.ws.order_book import OrderBook, IndexedOrderBook, CountedOrderBook
+from ccxt.async_support.base.ws.cache import columnar_ohlcv
 
 
 # -----------------------------------------------------------------------------
@@ -64,6 +66,13 @@ class Exchange(BaseExchange):
     }
     ping = None
     newUpdates = True
+    # the levels of the websocket order books are [price, amount] strings as sent by the exchange
+    orderBookStrings = False
+    # the levels of the websocket order books are kept in arrays of floats and read as [price, amount] lists
+    # it takes less memory for many deep books, the levels of indexed order books are always lists
+    orderBookCompact = False
+    # the candles of watch_ohlcv are kept in arrays and read as lists, see ColumnarCacheByTimestamp
+    ohlcvColumnar = False
     clients = {}
 
     def __init__(self, config={}):
@@ -78,6 +87,20 @@ class Exchange(BaseExchange):
         self.init_rest_rate_limiter()
         self.markets_loading = None
         self.reloading_markets = False
+        self.markets_refreshing = None
+        self.prewarming = None
+        # updated by the trace of the session, see connection_pool_stats
+        self.connection_counters = {
+            'requests': 0,
+            'active': 0,
+            'created': 0,
+            'reused': 0,
+            'queued': 0,
+            'waiting': 0,
+            'queuedTime': 0,
+            'dnsCacheHits': 0,
+            'dnsCacheMisses': 0,
+        }
 
     def init_rest_rate_limiter(self):
         self.throttle = Throttler(self.tokenBucket, self.asyncio_loop)
@@ -114,10 +137,95 @@ class Exchange(BaseExchange):
 
         if self.own_session and self.session is None:
             # Pass this SSL context to aiohttp and create a TCPConnector
-            connector = aiohttp.TCPConnector(ssl=self.ssl_context, loop=self.asyncio_loop, enable_cleanup_closed=True)
-            self.session = aiohttp.ClientSession(loop=self.asyncio_loop, connector=connector, trust_env=self.aiohttp_trust_env)
+            connector = aiohttp.TCPConnector(**self.extend({
+                'ssl': self.ssl_context,
+                'loop': self.asyncio_loop,
+                'enable_cleanup_closed': True,
+            }, self.aiohttp_connector or {}))
+            self.session = aiohttp.ClientSession(loop=self.asyncio_loop, connector=connector, trust_env=self.aiohttp_trust_env, trace_configs=[self.connection_trace_config()])
+            if self.aiohttp_prewarm:
+                self.prewarming = asyncio.ensure_future(self.prewarm_connections(self.aiohttp_prewarm), loop=self.asyncio_loop)
+
+    def connection_trace_config(self):
+        # counts the requests and the connections of the session, the callbacks keep the counters only and not the exchange
+        counters = self.connection_counters
+        trace_config = aiohttp.TraceConfig()
+
+        def count(*keys, change=1):
+            async def callback(session, context, params):
+                for key in keys:
+                    counters[key] += change
+            return callback
+
+        async def on_queued_start(session, context, params):
+            counters['queued'] += 1
+            counters['waiting'] += 1
+            context.queued = time.monotonic()
+
+        async def on_queued_end(session, context, params):
+            counters['waiting'] -= 1
+            counters['queuedTime'] += int((time.monotonic() - context.queued) * 1000)
+
+        trace_config.on_request_start.append(count('requests', 'active'))
+        trace_config.on_request_end.append(count('active', change=-1))
+        trace_config.on_request_exception.append(count('active', change=-1))
+        trace_config.on_connection_create_end.append(count('created'))
+        trace_config.on_connection_reuseconn.append(count('reused'))
+        trace_config.on_connection_queued_start.append(on_queued_start)
+        trace_config.on_connection_queued_end.append(on_queued_end)
+        trace_config.on_dns_cache_hit.append(count('dnsCacheHits'))
+        trace_config.on_dns_cache_miss.append(count('dnsCacheMisses'))
+        return trace_config
+
+    def connection_pool_stats(self):
+        # the counters since the session was opened with the limits of the pool, waiting and queuedTime (ms) show a saturated pool
+        connector = self.session.connector if self.session is not None else None
+        return self.extend(self.connection_counters, {
+            'limit': connector.limit if connector is not None else None,
+            'limitPerHost': connector.limit_per_host if connector is not None else None,
+        })
+
+    def api_origins(self):
+        # scheme://host/ of every http url in urls['api']
+        origins = []
+        urls = [self.urls.get('api')]
+        while urls:
+            url = urls.pop(0)
+            if isinstance(url, dict):
+                urls.extend(url.values())
+            elif isinstance(url, str) and url.startswith('http'):
+                parsed = yarl.URL(self.implode_hostname(url))
+                origin = str(parsed.origin()) + '/' if parsed.host and '{' not in parsed.host else None
+                if origin is not None and origin not in origins:
+                    origins.append(origin)
+        return origins
+
+    async def prewarm_connections(self, connections=1):
+        # opens connections to the api hosts with HEAD requests and leaves them in the pool of the session
+        # the first requests skip the dns lookup and the tls handshake, the hosts behind a proxy are skipped
+        async def prewarm(origin):
+            httpProxy, httpsProxy, socksProxy = self.check_proxy_settings(origin, 'HEAD')
+            if self.aiohttp_proxy or self.check_proxy_url_settings(origin, 'HEAD') or httpProxy or httpsProxy or socksProxy:
+                return False
+            async with self.session.head(origin, timeout=aiohttp.ClientTimeout(total=self.timeout / 1000)) as response:
+                await response.read()
+            return True
+
+        results = await asyncio.gather(*[prewarm(origin) for origin in self.api_origins() for i in range(connections)], return_exceptions=True)
+        self.prewarming = None
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.debug(self.id + ' could not prewarm a connection: ' + str(result))
+        # the number of connections opened
+        return sum(1 for result in results if result is True)
 
     async def close(self):
+        if self.markets_refreshing is not None:
+            self.markets_refreshing.cancel()
+            self.markets_refreshing = None
+        if self.prewarming is not None:
+            self.prewarming.cancel()
+            self.prewarming = None
         await self.ws_close()
         if self.session is not None:
             if self.own_session:
@@ -212,6 +320,7 @@ class Exchange(BaseExchange):
                         headers[header] = raw_headers[header]
                 http_status_code = response.status
                 http_status_text = response.reason
+                self.throttle.sync(url, headers)
                 http_response = self.on_rest_response(http_status_code, http_status_text, url, method, headers, http_response, request_headers, request_body)
                 json_response = self.parse_json(http_response)
                 if self.enableLastHttpResponse:
@@ -256,11 +365,33 @@ class Exchange(BaseExchange):
                 if not self.markets_by_id:
                     return self.set_markets(self.markets)
                 return self.markets
-        currencies = None
-        if self.has['fetchCurrencies'] is True:
-            currencies = await self.fetch_currencies()
-        markets = await self.fetch_markets(params)
-        return self.set_markets(markets, currencies)
+            cache = self.read_markets_cache(params)
+            if cache is not None:
+                if self.milliseconds() - cache['timestamp'] > self.marketsCacheTTL:
+                    # the loop of the exchange is set by open, the refresh sends requests with the session anyway
+                    self.open()
+                    self.markets_refreshing = asyncio.ensure_future(self.refresh_markets(params), loop=self.asyncio_loop)
+                return self.apply_markets(cache['markets'], cache['currencies'])
+        markets, currencies = await self.fetch_markets_and_currencies(params)
+        self.write_markets_cache(params, markets, currencies)
+        return self.apply_markets(markets, currencies)
+
+    async def refresh_markets(self, params={}):
+        # fetches the markets loaded from an expired cache in the background, set_markets swaps them in at once
+        # the markets loaded from the cache are kept if they can not be fetched
+        try:
+            markets, currencies = await self.fetch_markets_and_currencies(params)
+        except Exception as e:
+            self.logger.warning(self.id + ' could not refresh the saved markets: ' + str(e))
+            return self.markets
+        finally:
+            self.markets_refreshing = None
+        self.write_markets_cache(params, markets, currencies)
+        result = self.apply_markets(markets, currencies)
+        # load_markets returns the refreshed markets from now on
+        self.markets_loading = self.asyncio_loop.create_future()
+        self.markets_loading.set_result(result)
+        return result
 
     async def load_markets(self, reload=False, params={}):
         if (reload and not self.reloading_markets) or not self.markets_loading:
@@ -298,6 +429,30 @@ class Exchange(BaseExchange):
         # and may be changed for consistency later
         return self.currencies
 
+    async def fetch_markets_and_currencies(self, params={}):
+        # the requests of fetch_currencies and fetch_markets wait for each other in the throttler only
+        # the exchanges whose fetch_markets fetches the currencies that are not loaded yet set loadCurrenciesBeforeMarkets
+        # so the currencies are requested once
+        if self.has['fetchCurrencies'] is True and self.safe_bool(self.options, 'loadCurrenciesBeforeMarkets', False):
+            currencies = await self.fetch_currencies()
+            return await self.fetch_markets(params), currencies
+        if self.has['fetchCurrencies'] is True:
+            currencies, markets = await asyncio.gather(self.fetch_currencies(), self.fetch_markets(params))
+            return markets, currencies
+        return await self.fetch_markets(params), None
+
+    async def call_endpoint(self, path, api='public', method='GET', params={}, config={}):
+        # the implicit api methods call this, the lane of the request reaches the throttler through request_lane
+        # because the fetch2 transpiled from javascript only passes the cost to it
+        priority = self.calculate_rate_limiter_priority(api, method, path, params, config)
+        if 'rateLimitPriority' in params:
+            params = self.omit(params, 'rateLimitPriority')
+        token = request_lane.set((priority, api, path))
+        try:
+            return await self.request(path, api, method, params, config=config)
+        finally:
+            request_lane.reset(token)
+
     async def fetchOHLCVC(self, symbol, timeframe='1m', since=None, limit=None, params={}):
         return await self.fetch_ohlcvc(symbol, timeframe, since, limit, params)
 
@@ -342,18 +497,39 @@ class Exchange(BaseExchange):
         return gunzip(data)
 
     def order_book(self, snapshot={}, depth=None):
-        return OrderBook(snapshot, depth)
+        return OrderBook(snapshot, depth, self.orderBookStrings, self.orderBookCompact)
 
     def indexed_order_book(self, snapshot={}, depth=None):
-        return IndexedOrderBook(snapshot, depth)
+        return IndexedOrderBook(snapshot, depth, self.orderBookStrings)
 
     def counted_order_book(self, snapshot={}, depth=None):
-        return CountedOrderBook(snapshot, depth)
+        return CountedOrderBook(snapshot, depth, self.orderBookStrings, self.orderBookCompact)
+
+    def filter_by_since_limit(self, array, since=None, limit=None, key='timestamp', tail=False):
+        # the websocket caches with the entries in ascending order are bisected instead of scanned, see BaseCache.sorted_by
+        # only the entries that the filter returns are passed on to it
+        sorted_by = getattr(array, 'sorted_by', None)
+        if since is not None and sorted_by is not None and sorted_by(key):
+            start = array.bisect(since)
+            if not limit:
+                array = array[start:]
+            elif tail:
+                array = array[max(start, len(array) - limit):]
+            else:
+                array = array[start:start + limit]
+        return super(Exchange, self).filter_by_since_limit(array, since, limit, key, tail)
+
+    def filter_by_value_since_limit(self, array, field, value=None, since=None, limit=None, key='timestamp', tail=False):
+        # see filter_by_since_limit, nothing is returned since 0
+        sorted_by = getattr(array, 'sorted_by', None)
+        if since and sorted_by is not None and sorted_by(key):
+            array = array[array.bisect(since):]
+        return super(Exchange, self).filter_by_value_since_limit(array, field, value, since, limit, key, tail)
 
     def client(self, url):
         self.clients = self.clients or {}
         if url not in self.clients:
-            on_message = self.handle_message
+            on_message = self.handle_columnar_message if self.ohlcvColumnar else self.handle_message
             on_error = self.on_error
             on_close = self.on_close
             on_connected = self.on_connected
@@ -365,11 +541,20 @@ class Exchange(BaseExchange):
                 'verbose': self.verbose,
                 'throttle': Throttler(self.tokenBucket, self.asyncio_loop),
                 'asyncio_loop': self.asyncio_loop,
+                'json_decoder': self.json_decoder,
             }, ws_options)
             self.clients[url] = FastClient(url, on_message, on_error, on_close, on_connected, options)
             self.clients[url].proxy = self.get_ws_proxy()
         return self.clients[url]
 
+    def handle_columnar_message(self, client, message):
+        # the ArrayCacheByTimestamp caches that the handlers create are ColumnarCacheByTimestamp, see ohlcvColumnar
+        token = columnar_ohlcv.set(True)
+        try:
+            return self.handle_message(client, message)
+        finally:
+            columnar_ohlcv.reset(token)
+
     def get_ws_proxy(self):
         httpProxy, httpsProxy, socksProxy = self.check_ws_proxy_settings()
         if httpProxy:
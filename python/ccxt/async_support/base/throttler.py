@@ -1,6 +1,51 @@
 import asyncio
 import collections
-from time import time
+import contextvars
+
+# the lane, the api and the path of the request being sent, set by Exchange.call_endpoint
+request_lane = contextvars.ContextVar('request_lane', default=(None, None, None))
+
+
+class Bucket:
+    """A fixed window counter that mirrors a limit enforced by the exchange, like the request weight used per minute"""
+
+    def __init__(self, config):
+        self.limit = config['limit']
+        self.interval = config['interval']
+        # the response header that reports how much of the limit is used in the current window
+        self.header = config['header'].lower() if config.get('header') else None
+        # only requests from these lanes, apis and paths and responses from urls containing this string are counted
+        self.lanes = config.get('lanes')
+        self.apis = config.get('apis')
+        self.paths = config.get('paths')
+        self.url = config.get('url')
+        # how much of the limit one unit of request cost uses
+        self.scale = config.get('scale', 1)
+        self.used = 0
+        self.window = 0
+
+    def roll(self, now):
+        window = now - now % self.interval
+        if window > self.window:
+            self.window = window
+            self.used = 0
+
+    def counts(self, lane, api, path):
+        return (self.lanes is None or lane in self.lanes) and (self.apis is None or api in self.apis) and (self.paths is None or path in self.paths)
+
+    def delay(self, cost, now):
+        self.roll(now)
+        if self.used == 0 or self.used + cost * self.scale <= self.limit:
+            return 0
+        return self.window + self.interval - now
+
+    def consume(self, cost):
+        self.used += cost * self.scale
+
+    def sync(self, used, now):
+        self.roll(now)
+        # the exchange does not know about the requests that are still in flight
+        self.used = max(self.used, used)
 
 
 class Throttler:
@@ -13,38 +58,200 @@ class Throttler:
             'tokens': 0,
             'maxCapacity': 2000,
             'capacity': 1.0,
+            # 'looper' polls every `delay` seconds while the bucket is empty
+            # 'timer' sleeps once until enough tokens have been refilled
+            'scheduler': 'looper',
+            # lanes with a lower number are served first, unknown lanes are served last
+            'priorities': {
+                'trading': 0,
+                'account': 1,
+                'marketData': 2,
+            },
+            # tokens reserved for a lane, the lanes served after it have to leave them in the bucket
+            'reserved': {},
+            # additional limits checked for every request, see Bucket
+            'buckets': {},
+            # a token bucket shared with other throttlers, see ccxt.async_support.base.budget
+            # refillRate, capacity and tokens of this config are not used when it is set
+            'budget': None,
         }
         self.config.update(config)
-        self.queue = collections.deque()
+        self.buckets = {name: Bucket(bucket) for name, bucket in self.config['buckets'].items()}
+        self.queues = {}
+        self.lanes = []
+        self.thresholds = {}
+        self.length = 0
         self.running = False
+        self.timer = None
+        self.waiting = None
+        # set when a request is queued while the borrower sleeps
+        self.queued = None
+        self.last_timestamp = None
+
+    def now(self):
+        # milliseconds of the monotonic clock of the loop, the refill, the delays and the bucket windows all use it
+        return (self.loop or asyncio.get_event_loop()).time() * 1000
+
+    def rank(self, lane):
+        priorities = self.config['priorities']
+        return priorities.get(lane, len(priorities))
+
+    def add_lane(self, lane):
+        self.queues[lane] = collections.deque()
+        self.lanes.append(lane)
+        self.lanes.sort(key=self.rank)
+        reserved = self.config['reserved']
+        self.thresholds[lane] = sum(reserved[other] for other in reserved if self.rank(other) < self.rank(lane))
+
+    def bucket_delay(self, lane, cost, api, path, now):
+        delay = 0
+        for bucket in self.buckets.values():
+            if bucket.counts(lane, api, path):
+                delay = max(delay, bucket.delay(cost, now))
+        return delay
+
+    def delay(self, lane, cost, api, path, now):
+        # milliseconds until the first request of the lane can be granted
+        delay = (self.thresholds[lane] - self.config['tokens']) / self.config['refillRate']
+        return max(delay, self.bucket_delay(lane, cost, api, path, now))
+
+    def next_grant(self, now, tokens=True):
+        # the first lane in the order of priority whose head request can be granted now, the lanes held back
+        # by their own buckets are skipped, otherwise the milliseconds until the first of them can be granted
+        wait = None
+        for lane in self.lanes:
+            if self.queues[lane]:
+                future, cost, api, path = self.queues[lane][0]
+                cost = self.config['cost'] if cost is None else cost
+                delay = self.delay(lane, cost, api, path, now) if tokens else self.bucket_delay(lane, cost, api, path, now)
+                if delay <= 0:
+                    return lane, 0
+                wait = delay if wait is None else min(wait, delay)
+        return None, wait
+
+    def grant(self, lane, take=True):
+        future, cost, api, path = self.queues[lane].popleft()
+        self.length -= 1
+        cost = self.config['cost'] if cost is None else cost
+        if take:
+            self.config['tokens'] -= cost
+        for bucket in self.buckets.values():
+            if bucket.counts(lane, api, path):
+                bucket.consume(cost)
+        if not future.done():
+            future.set_result(None)
 
     async def looper(self):
-        last_timestamp = time() * 1000
+        last_timestamp = self.now()
         while self.running:
-            future, cost = self.queue[0]
-            cost = self.config['cost'] if cost is None else cost
-            if self.config['tokens'] >= 0:
-                self.config['tokens'] -= cost
-                if not future.done():
-                    future.set_result(None)
-                self.queue.popleft()
+            lane, delay = self.next_grant(self.now())
+            if delay <= 0:
+                self.grant(lane)
                 # context switch
                 await asyncio.sleep(0)
-                if len(self.queue) == 0:
+                if self.length == 0:
                     self.running = False
             else:
                 await asyncio.sleep(self.config['delay'])
-                now = time() * 1000
+                now = self.now()
                 elapsed = now - last_timestamp
                 last_timestamp = now
                 self.config['tokens'] = min(self.config['tokens'] + elapsed * self.config['refillRate'], self.config['capacity'])
 
-    def __call__(self, cost=None):
+    async def pause(self, delay):
+        # sleeps until the delay is over or until another request is queued
+        self.queued.clear()
+        try:
+            await asyncio.wait_for(self.queued.wait(), delay / 1000)
+        except asyncio.TimeoutError:
+            pass
+
+    async def borrower(self):
+        budget = self.config['budget']
+        self.queued = asyncio.Event()
+        try:
+            while self.length:
+                lane, delay = self.next_grant(self.now(), False)
+                if delay <= 0:
+                    cost = self.queues[lane][0][1]
+                    cost = self.config['cost'] if cost is None else cost
+                    delay = await budget.acquire(cost, self.thresholds[lane])
+                if delay > 0:
+                    await self.pause(delay)
+                else:
+                    # the tokens were taken from the shared budget
+                    self.grant(lane, False)
+                    await asyncio.sleep(0)
+        except Exception as e:
+            for queue in self.queues.values():
+                while queue:
+                    future = queue.popleft()[0]
+                    if not future.done():
+                        future.set_exception(e)
+            self.length = 0
+        self.running = False
+
+    def refill(self):
+        now = self.now()
+        if self.last_timestamp is not None and self.config['tokens'] < self.config['capacity']:
+            elapsed = now - self.last_timestamp
+            self.config['tokens'] = min(self.config['tokens'] + elapsed * self.config['refillRate'], self.config['capacity'])
+        self.last_timestamp = now
+
+    def wakeup(self):
+        self.timer = None
+        loop = self.loop or asyncio.get_event_loop()
+        self.refill()
+        now = self.now()
+        while self.length:
+            lane, delay = self.next_grant(now)
+            if delay > 0:
+                # sleep exactly until the bucket is refilled up to the threshold of a lane
+                # or until the windows of the exchange limits of a lane are reset
+                self.timer = loop.call_at((now + delay) / 1000, self.wakeup)
+                self.waiting = now + delay
+                return
+            self.grant(lane)
+        self.running = False
+
+    def sync(self, url, headers):
+        """Updates the buckets with the usage reported in the response headers of the exchange"""
+        if not self.buckets or not headers:
+            return
+        now = self.now()
+        lowercase = {key.lower(): value for key, value in headers.items()}
+        for bucket in self.buckets.values():
+            if bucket.header in lowercase and (bucket.url is None or bucket.url in url):
+                try:
+                    bucket.sync(float(lowercase[bucket.header]), now)
+                except ValueError:
+                    pass
+
+    def __call__(self, cost=None, priority=None, api=None, path=None):
+        if priority is None and api is None:
+            priority, api, path = request_lane.get()
         future = asyncio.Future()
-        if len(self.queue) > self.config['maxCapacity']:
+        if self.length > self.config['maxCapacity']:
             raise RuntimeError('throttle queue is over maxCapacity (' + str(int(self.config['maxCapacity'])) + '), see https://github.com/ccxt/ccxt/issues/11645#issuecomment-1195695526')
-        self.queue.append((future, cost))
+        if priority not in self.queues:
+            self.add_lane(priority)
+        self.queues[priority].append((future, cost, api, path))
+        self.length += 1
         if not self.running:
             self.running = True
-            asyncio.ensure_future(self.looper(), loop=self.loop)
+            if self.config['budget'] is not None:
+                asyncio.ensure_future(self.borrower(), loop=self.loop)
+            elif self.config['scheduler'] == 'timer':
+                self.wakeup()
+            else:
+                asyncio.ensure_future(self.looper(), loop=self.loop)
+        elif self.queued is not None:
+            self.queued.set()
+        elif self.timer is not None:
+            self.refill()
+            now = self.now()
+            if now + self.delay(priority, self.config['cost'] if cost is None else cost, api, path, now) < self.waiting:
+                # the new request can be granted before the ones the timer is waiting for
+                self.timer.cancel()
+                self.wakeup()
         return future
@@ -6,12 +6,18 @@ from aiohttp import WSMsgType
 from .functions import milliseconds, iso8601, is_json_encoded_object
 from ccxt.async_support.base.ws.client import Client
 from ccxt.async_support.base.ws.functions import gunzip, inflate
+from ccxt.base.json_decoders import JsonDecoder
 from ccxt import NetworkError, RequestTimeout, ExchangeClosedByUser
 
 
+# the first byte of a json encoded object or array, see is_json_encoded_object
+JSON_START = b'{['
+
+
 class AiohttpClient(Client):
 
     proxy = None
+    json_decoder = JsonDecoder()
 
     def closed(self):
         return (self.connection is None) or self.connection.closed
@@ -24,8 +30,10 @@ class AiohttpClient(Client):
         if self.verbose:
             self.log(iso8601(milliseconds()), 'message', data)
         if isinstance(data, bytes):
-            data = data.decode()
-        decoded = json.loads(data) if is_json_encoded_object(data) else data
+            # the decoder reads json from bytes without decoding them to a str first
+            decoded = self.json_decoder.loads(data) if len(data) >= 2 and data[0] in JSON_START else data.decode()
+        else:
+            decoded = self.json_decoder.loads(data) if is_json_encoded_object(data) else data
         self.on_message_callback(self, decoded)
 
     def handle_message(self, message):
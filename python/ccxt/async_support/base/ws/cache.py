@@ -1,4 +1,19 @@
+import bisect
 import collections
+import contextvars
+import itertools
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+nan = float('nan')
+
+# whether ArrayCacheByTimestamp(max_size) creates a ColumnarCacheByTimestamp, the exchanges
+# with ohlcvColumnar set it while they handle the websocket messages
+columnar_ohlcv = contextvars.ContextVar('columnar_ohlcv', default=False)
 
 
 class Delegate:
@@ -11,6 +26,295 @@ class Delegate:
         return getattr(deque, self.name)
 
 
+class RingBuffer:
+    # a bounded deque in a list, with O(1) random access and slices that copy only the items they return
+    # the list grows up to maxlen, or like a list if there is no maxlen, then the oldest items are overwritten
+    def __init__(self, maxlen=None):
+        self.maxlen = maxlen
+        self.reset([])
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        return iter(self[:])
+
+    def __reversed__(self):
+        return reversed(self[:])
+
+    def __contains__(self, value):
+        return value in self[:]
+
+    def position(self, index):
+        if index < 0:
+            index += self._length
+        if index < 0 or index >= self._length:
+            raise IndexError('deque index out of range')
+        return (self._start + index) % len(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step != 1:
+                return [self._items[self.position(i)] for i in range(start, stop, step)]
+            if start >= stop:
+                return []
+            items = self._items
+            first = (self._start + start) % len(items)
+            last = first + stop - start
+            if last <= len(items):
+                return items[first:last]
+            return items[first:] + items[:last - len(items)]
+        return self._items[self.position(index)]
+
+    def __setitem__(self, index, value):
+        self._items[self.position(index)] = value
+
+    def __delitem__(self, index):
+        self.position(index)
+        values = self[:]
+        del values[index]
+        self.reset(values)
+
+    def reset(self, values):
+        capacity = 16 if self.maxlen is None else min(16, self.maxlen)
+        self._items = values + [None] * max(capacity - len(values), 0)
+        self._start = 0
+        self._length = len(values)
+
+    def clear(self):
+        self.reset([])
+
+    def append(self, value):
+        items = self._items
+        if self._length == len(items):
+            if self._length == self.maxlen:
+                if self.maxlen:
+                    items[self._start] = value
+                    self._start = (self._start + 1) % self.maxlen
+                return
+            values = self[:]
+            capacity = 2 * len(values) if self.maxlen is None else min(2 * len(values), self.maxlen)
+            self._items = items = values + [None] * (capacity - len(values))
+            self._start = 0
+        items[(self._start + self._length) % len(items)] = value
+        self._length += 1
+
+    def popleft(self):
+        if not self._length:
+            raise IndexError('pop from an empty deque')
+        value = self._items[self._start]
+        self._items[self._start] = None
+        self._start = (self._start + 1) % len(self._items)
+        self._length -= 1
+        return value
+
+
+class KeyedDeque:
+    # the values of an ordered dict with the interface of a bounded deque
+    # a value is moved to the end or removed by its key in O(1), see ArrayCacheBySymbolById
+    def __init__(self, maxlen=None):
+        self.maxlen = maxlen
+        self._items = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items.values())
+
+    def __reversed__(self):
+        return reversed(self._items.values())
+
+    def __contains__(self, value):
+        return value in self._items.values()
+
+    def key_at(self, index):
+        length = len(self._items)
+        if index < 0:
+            index += length
+        if index < 0 or index >= length:
+            raise IndexError('deque index out of range')
+        # walks from the nearest end
+        if index < length // 2:
+            return next(itertools.islice(self._items, index, None))
+        return next(itertools.islice(reversed(self._items), length - 1 - index, None))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self._items))
+            if step != 1 or start >= stop:
+                return list(self._items.values())[index]
+            # walks from the nearest end
+            if start < len(self._items) - stop:
+                return list(itertools.islice(self._items.values(), start, stop))
+            values = list(itertools.islice(reversed(self._items.values()), len(self._items) - stop, len(self._items) - start))
+            values.reverse()
+            return values
+        return self._items[self.key_at(index)]
+
+    def __setitem__(self, index, value):
+        self._items[self.key_at(index)] = value
+
+    def __delitem__(self, index):
+        del self._items[self.key_at(index)]
+
+    def clear(self):
+        self._items.clear()
+
+    def popleft(self):
+        return self._items.popitem(last=False)[1]
+
+    def set(self, key, value):
+        # appends the value or moves it to the end if the key is known, the first value is dropped when the deque is full
+        items = self._items
+        if key in items:
+            items.move_to_end(key)
+            items[key] = value
+            return None
+        dropped = None
+        if len(items) == self.maxlen:
+            dropped = items.popitem(last=False)[1]
+        items[key] = value
+        return dropped
+
+
+class CandleColumns:
+    # the candles of a ColumnarCacheByTimestamp in a ring of columns with the interface of a bounded deque
+    # the timestamps are int64 and the values are float64 with nan for None, every column is written
+    # twice, at a slot and at slot + capacity, so the candles are contiguous from the oldest to the newest
+    width = 6
+
+    def __init__(self, maxlen=None):
+        self.maxlen = maxlen
+        self._first = 0  # the sequence number of the oldest candle, its slot is _first % capacity
+        self._length = 0
+        self._ascending = True
+        self.allocate(16 if maxlen is None else min(16, maxlen))
+
+    def allocate(self, capacity):
+        candles = self[:] if self._length else []
+        self._capacity = capacity
+        self._timestamps = array('q', bytes(16 * capacity))
+        self._values = [array('d', bytes(16 * capacity)) for i in range(self.width - 1)]
+        self._widths = array('b', bytes(2 * capacity))
+        for i, candle in enumerate(candles):
+            self.write((self._first + i) % capacity, candle, 0)
+
+    def write(self, slot, candle, width):
+        mirror = slot + self._capacity
+        length = min(len(candle), self.width)
+        self._timestamps[slot] = self._timestamps[mirror] = int(candle[0])
+        values = self._values
+        for i in range(1, length):
+            value = candle[i]
+            column = values[i - 1]
+            column[slot] = column[mirror] = nan if value is None else value
+        if length > width:
+            self._widths[slot] = self._widths[mirror] = length
+
+    def read(self, slot):
+        candle = [self._timestamps[slot]]
+        for i in range(1, self._widths[slot]):
+            value = self._values[i - 1][slot]
+            candle.append(None if value != value else value)
+        return candle
+
+    def slot(self, index):
+        if index < 0:
+            index += self._length
+        if index < 0 or index >= self._length:
+            raise IndexError('deque index out of range')
+        return (self._first + index) % self._capacity
+
+    def find(self, timestamp):
+        # the slot of the candle with the timestamp or None, the updates are mostly for the last candle
+        if not self._length:
+            return None
+        start = self._first % self._capacity
+        timestamps = self._timestamps
+        if timestamps[start + self._length - 1] == timestamp:
+            return (start + self._length - 1) % self._capacity
+        if self._ascending:
+            index = bisect.bisect_left(memoryview(timestamps)[start:start + self._length], timestamp)
+            if index < self._length and timestamps[start + index] == timestamp:
+                return (start + index) % self._capacity
+            return None
+        for index in range(start, start + self._length):
+            if timestamps[index] == timestamp:
+                return index % self._capacity
+        return None
+
+    def set(self, candle):
+        # updates the candle with the same timestamp or appends the candle, returns True if it is new
+        if self.maxlen == 0:
+            return True
+        slot = self.find(candle[0])
+        if slot is not None:
+            self.write(slot, candle, self._widths[slot])
+            return False
+        if self._length and candle[0] <= self._timestamps[self.slot(-1)]:
+            self._ascending = False
+        if self._length == self.maxlen:
+            self._first += 1
+            self._length -= 1
+        elif self._length == self._capacity:
+            self.allocate(2 * self._capacity if self.maxlen is None else min(2 * self._capacity, self.maxlen))
+        self.write((self._first + self._length) % self._capacity, candle, 0)
+        self._length += 1
+        return True
+
+    def bisect(self, timestamp):
+        start = self._first % self._capacity
+        return bisect.bisect_left(memoryview(self._timestamps)[start:start + self._length], timestamp)
+
+    def columns(self):
+        # the timestamps, opens, highs, lows, closes and volumes from the oldest to the newest candle
+        # numpy arrays if numpy is installed or memoryviews otherwise, they are views of the columns
+        # until the capacity of the cache grows
+        start = self._first % self._capacity
+        result = []
+        for column in [self._timestamps] + self._values:
+            view = numpy.frombuffer(column, dtype=numpy.int64 if column.typecode == 'q' else numpy.float64) if numpy is not None else memoryview(column)
+            result.append(view[start:start + self._length])
+        return tuple(result)
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start = self._first % self._capacity
+            return [self.read(start + i) for i in range(*index.indices(self._length))]
+        return self.read(self.slot(index))
+
+    def __setitem__(self, index, candle):
+        self.write(self.slot(index), candle, 0)
+
+    def __delitem__(self, index):
+        self.slot(index)
+        candles = self[:]
+        del candles[index]
+        self.clear()
+        for candle in candles:
+            self.set(candle)
+
+    def __iter__(self):
+        return iter(self[:])
+
+    def __reversed__(self):
+        return reversed(self[:])
+
+    def __contains__(self, candle):
+        return candle in self[:]
+
+    def clear(self):
+        self._first = 0
+        self._length = 0
+        self._ascending = True
+        self.allocate(self._capacity)
+
+
 class BaseCache(list):
     # implicitly called magic methods don't invoke __getattribute__
     # https://docs.python.org/3/reference/datamodel.html#special-method-lookup
@@ -24,10 +328,15 @@ class BaseCache(list):
     __reversed__ = Delegate('__reversed__', '_deque')
     clear = Delegate('clear', '_deque')
 
+    # the key of the items that they are appended in ascending order of, see sorted_by
+    _sort_key = None
+
     def __init__(self, max_size=None):
         super(BaseCache, self).__init__()
         self.max_size = max_size
-        self._deque = collections.deque([], max_size)
+        self._deque = RingBuffer(max_size)
+        self._sorted = True
+        self._last_sort_value = None
 
     def __eq__(self, other):
         return list(self) == other
@@ -39,13 +348,31 @@ class BaseCache(list):
         return list(self) + other
 
     def __getitem__(self, item):
-        # deque doesn't support slicing
-        deque = super(list, self).__getattribute__('_deque')
-        if isinstance(item, slice):
-            start, stop, step = item.indices(len(deque))
-            return [deque[i] for i in range(start, stop, step)]
+        return super(list, self).__getattribute__('_deque')[item]
+
+    def check_sorted(self, value):
+        # the items stay sorted while the values of the appended items do not decrease
+        if not value or (self._last_sort_value is not None and value < self._last_sort_value):
+            self._sorted = False
         else:
-            return deque[item]
+            self._last_sort_value = value
+
+    def sorted_by(self, key):
+        return self._sorted and key == self._sort_key
+
+    def bisect(self, value):
+        # the index of the first item with a value of the sort key that is not less than value, see sorted_by
+        deque = self._deque
+        key = self._sort_key
+        low = 0
+        high = len(deque)
+        while low < high:
+            middle = (low + high) // 2
+            if deque[middle][key] < value:
+                low = middle + 1
+            else:
+                high = middle
+        return low
 
     # to be overriden
     def getLimit(self, symbol, limit):
@@ -57,6 +384,8 @@ class BaseCache(list):
 
 
 class ArrayCache(BaseCache):
+    _sort_key = 'timestamp'
+
     def __init__(self, max_size=None):
         super(ArrayCache, self).__init__(max_size)
         self._nested_new_updates_by_symbol = False
@@ -84,6 +413,8 @@ class ArrayCache(BaseCache):
 
     def append(self, item):
         self._deque.append(item)
+        if self._sorted:
+            self.check_sorted(item.get('timestamp'))
         if self._clear_all_updates:
             self._clear_all_updates = False
             self._clear_updates_by_symbol.clear()
@@ -97,6 +428,13 @@ class ArrayCache(BaseCache):
 
 
 class ArrayCacheByTimestamp(BaseCache):
+    _sort_key = 0
+
+    def __new__(cls, max_size=None):
+        if cls is ArrayCacheByTimestamp and columnar_ohlcv.get():
+            cls = ColumnarCacheByTimestamp
+        return super(ArrayCacheByTimestamp, cls).__new__(cls)
+
     def __init__(self, max_size=None):
         super(ArrayCacheByTimestamp, self).__init__(max_size)
         self.hashmap = {}
@@ -121,19 +459,49 @@ class ArrayCacheByTimestamp(BaseCache):
                 delete_reference = self._deque.popleft()
                 del self.hashmap[delete_reference[0]]
             self._deque.append(item)
+            if self._sorted:
+                self.check_sorted(item[0])
+        if self._clear_updates:
+            self._clear_updates = False
+            self._size_tracker.clear()
+        self._size_tracker.add(item[0])
+        self._new_updates = len(self._size_tracker)
+
+
+class ColumnarCacheByTimestamp(ArrayCacheByTimestamp):
+    # an ArrayCacheByTimestamp that keeps the candles in arrays instead of lists, see CandleColumns
+    # a candle takes about 100 bytes instead of about 350, the candles are created when they are read
+    # so a candle that was read is not changed by the later updates of that candle
+    def __init__(self, max_size=None):
+        super(ColumnarCacheByTimestamp, self).__init__(max_size)
+        self._deque = CandleColumns(max_size)
+
+    def append(self, item):
+        if self._deque.set(item) and self._sorted:
+            self.check_sorted(item[0])
         if self._clear_updates:
             self._clear_updates = False
             self._size_tracker.clear()
         self._size_tracker.add(item[0])
         self._new_updates = len(self._size_tracker)
 
+    def bisect(self, value):
+        return self._deque.bisect(value)
+
+    def to_arrays(self):
+        return self._deque.columns()
+
 
 class ArrayCacheBySymbolById(ArrayCache):
+    # updated items are moved to the end
+    _sort_key = None
+
     def __init__(self, max_size=None):
         super(ArrayCacheBySymbolById, self).__init__(max_size)
         self._nested_new_updates_by_symbol = True
         self.hashmap = {}
-        self._index = collections.deque([], max_size)
+        # keyed by (symbol, id)
+        self._deque = KeyedDeque(max_size)
 
     def append(self, item):
         by_id = self.hashmap.setdefault(item['symbol'], {})
@@ -142,17 +510,11 @@ class ArrayCacheBySymbolById(ArrayCache):
             if reference != item:
                 reference.update(item)
             item = reference
-            index = self._index.index(item['id'])
-            del self._deque[index]
-            del self._index[index]
         else:
             by_id[item['id']] = item
-        if len(self._deque) == self._deque.maxlen:
-            delete_item = self._deque.popleft()
-            self._index.popleft()
+        delete_item = self._deque.set((item['symbol'], item['id']), item)
+        if delete_item is not None:
             del self.hashmap[delete_item['symbol']][delete_item['id']]
-        self._deque.append(item)
-        self._index.append(item['id'])
         if self._clear_all_updates:
             self._clear_all_updates = False
             self._clear_updates_by_symbol.clear()
@@ -171,11 +533,15 @@ class ArrayCacheBySymbolById(ArrayCache):
 
 
 class ArrayCacheBySymbolBySide(ArrayCache):
+    # updated items are moved to the end
+    _sort_key = None
+
     def __init__(self, max_size=None):
         super(ArrayCacheBySymbolBySide, self).__init__(max_size)
         self._nested_new_updates_by_symbol = True
         self.hashmap = {}
-        self._index = collections.deque([], max_size)
+        # keyed by (symbol, side)
+        self._deque = KeyedDeque(max_size)
 
     def append(self, item):
         by_side = self.hashmap.setdefault(item['symbol'], {})
@@ -184,17 +550,11 @@ class ArrayCacheBySymbolBySide(ArrayCache):
             if reference != item:
                 reference.update(item)
             item = reference
-            index = self._index.index(item['side'])
-            del self._deque[index]
-            del self._index[index]
         else:
             by_side[item['side']] = item
-        if len(self._deque) == self._deque.maxlen:
-            delete_item = self._deque.popleft()
-            self._index.popleft()
+        delete_item = self._deque.set((item['symbol'], item['side']), item)
+        if delete_item is not None:
             del self.hashmap[delete_item['symbol']][delete_item['side']]
-        self._deque.append(item)
-        self._index.append(item['side'])
         if self._clear_all_updates:
             self._clear_all_updates = False
             self._clear_updates_by_symbol.clear()
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+
+import sys
+import bisect
+from array import array
+from ccxt.base.decimal_to_precision import number_to_string
+
+"""Order book sides that keep their levels in arrays of floats instead of a list of lists"""
+"""A level takes 16 bytes, 24 with the order count, instead of about 250 bytes in an OrderBookSide"""
+"""The levels are tuples created when they are read, they can not be changed"""
+
+
+class CompactOrderBookSide(object):
+    side = None  # set to True for bids and False for asks
+
+    def __init__(self, deltas=[], depth=None):
+        self._depth = depth or sys.maxsize
+        # the prices of the levels, negative for bids, in ascending order
+        self._index = array('d')
+        self._amounts = array('d')
+        # the deltas of the levels, see keep_strings
+        self._strings = None
+        self._string_indexes = (0, 1)
+        # the last result of top_strings, None after one of its levels has changed
+        self._top = None
+        self._top_depth = None
+        self._boundary = float('inf')
+        for delta in deltas:
+            self.storeArray(list(delta))
+
+    def store_array(self, delta):
+        return self.storeArray(delta)
+
+    def storeArray(self, delta):
+        self.store(delta[0], delta[1])
+
+    def store(self, price, size, delta=None):
+        index_price = -price if self.side else price
+        index = bisect.bisect_left(self._index, index_price)
+        if index < len(self._index) and self._index[index] == index_price:
+            if size:
+                self._amounts[index] = size
+                if self._strings is not None:
+                    self._strings[index] = delta
+            else:
+                self.remove_index(index)
+        elif size:
+            self._index.insert(index, index_price)
+            self._amounts.insert(index, size)
+            if self._strings is not None:
+                self._strings.insert(index, delta)
+        else:
+            return
+        if index_price <= self._boundary:
+            self._top = None
+
+    def remove_index(self, index):
+        del self._index[index]
+        del self._amounts[index]
+        if self._strings is not None:
+            del self._strings[index]
+
+    def applyDeltas(self, deltas, *indexes):
+        # the name used by the exchange classes transpiled from javascript
+        return self.apply_deltas(deltas, *indexes)
+
+    def apply_deltas(self, deltas, price_index=0, amount_index=1):
+        self.set_string_indexes(price_index, amount_index)
+        for delta in deltas:
+            self.store(float(delta[price_index]), float(delta[amount_index]), delta)
+
+    def set_string_indexes(self, price_index, amount_index):
+        # the kept deltas are read with the indexes of the last apply_deltas, the ones
+        # kept with other indexes are dropped and their levels are formatted from the numbers
+        if self._string_indexes != (price_index, amount_index):
+            if self._strings is not None:
+                self._strings[:] = [None] * len(self._strings)
+            self._string_indexes = (price_index, amount_index)
+            self._top = None
+
+    def limit(self):
+        if len(self._index) > self._depth:
+            del self._index[self._depth:]
+            del self._amounts[self._depth:]
+            if self._strings is not None:
+                del self._strings[self._depth:]
+            self._top = None
+
+    def clear(self):
+        del self._index[:]
+        del self._amounts[:]
+        if self._strings is not None:
+            del self._strings[:]
+        self._top = None
+        self._boundary = float('inf')
+
+    def keep_strings(self):
+        # keeps the deltas passed to apply_deltas parallel to the arrays, for the checksums of the exchanges
+        # that are computed from the strings they send, it takes as much memory as the deltas do
+        if self._strings is None:
+            self._strings = [None] * len(self._index)
+
+    def top_changed(self, depth):
+        return self._top is None or depth != self._top_depth
+
+    def topStrings(self, depth):
+        # the name used by the exchange classes transpiled from javascript
+        return self.top_strings(depth)
+
+    def top_strings(self, depth):
+        if self.top_changed(depth):
+            strings = self._strings
+            price_index, amount_index = self._string_indexes
+            top = []
+            for i in range(min(depth, len(self._index))):
+                delta = None if strings is None else strings[i]
+                if isinstance(delta, (list, tuple)) and isinstance(delta[price_index], str):
+                    top.append([delta[price_index], delta[amount_index]])
+                else:
+                    level = self.level(i)
+                    top.append([number_to_string(level[0]), number_to_string(level[1])])
+            self._top = top
+            self._top_depth = depth
+            self._boundary = self._index[depth - 1] if len(self._index) >= depth else float('inf')
+        return self._top
+
+    def export(self, prices, amounts, count, cumulative=False):
+        # see OrderBookSide.export, the columns are copied without creating the levels
+        memoryview(prices)[:count] = memoryview(self._index)[:count]
+        memoryview(amounts)[:count] = memoryview(self._amounts)[:count]
+        if self.side:
+            for i in range(count):
+                prices[i] = -prices[i]
+        if cumulative:
+            total = 0.0
+            for i in range(count):
+                total += amounts[i]
+                amounts[i] = total
+
+    def level(self, index):
+        price = self._index[index]
+        return (-price if self.side else price, self._amounts[index])
+
+    def __len__(self):
+        return len(self._index)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self.level(i) for i in range(*item.indices(len(self._index)))]
+        return self.level(item)
+
+    def __iter__(self):
+        for i in range(len(self._index)):
+            yield self.level(i)
+
+    def __eq__(self, other):
+        # the levels are equal to the lists of the other sides
+        if isinstance(other, (list, CompactOrderBookSide)):
+            return [list(level) for level in self] == [list(level) for level in other]
+        return NotImplemented
+
+    def __repr__(self):
+        return str(list(self))
+
+# -----------------------------------------------------------------------------
+# deletes price levels based on order counts (3rd value in a bidask delta)
+
+
+class CompactCountedOrderBookSide(CompactOrderBookSide):
+    def __init__(self, deltas=[], depth=None):
+        self._counts = array('q')
+        super(CompactCountedOrderBookSide, self).__init__(deltas, depth)
+
+    def storeArray(self, delta):
+        self.store(delta[0], delta[1], delta[2])
+
+    def store(self, price, size, count, delta=None):
+        index_price = -price if self.side else price
+        index = bisect.bisect_left(self._index, index_price)
+        if index < len(self._index) and self._index[index] == index_price:
+            if size and count:
+                self._amounts[index] = size
+                self._counts[index] = count
+                if self._strings is not None:
+                    self._strings[index] = delta
+            else:
+                self.remove_index(index)
+        elif size and count:
+            self._index.insert(index, index_price)
+            self._amounts.insert(index, size)
+            self._counts.insert(index, count)
+            if self._strings is not None:
+                self._strings.insert(index, delta)
+        else:
+            return
+        if index_price <= self._boundary:
+            self._top = None
+
+    def remove_index(self, index):
+        del self._counts[index]
+        super(CompactCountedOrderBookSide, self).remove_index(index)
+
+    def apply_deltas(self, deltas, price_index=0, amount_index=1, count_index=2):
+        self.set_string_indexes(price_index, amount_index)
+        for delta in deltas:
+            self.store(float(delta[price_index]), float(delta[amount_index]), int(float(delta[count_index])), delta)
+
+    def limit(self):
+        if len(self._index) > self._depth:
+            del self._counts[self._depth:]
+        super(CompactCountedOrderBookSide, self).limit()
+
+    def clear(self):
+        del self._counts[:]
+        super(CompactCountedOrderBookSide, self).clear()
+
+    def level(self, index):
+        price = self._index[index]
+        return (-price if self.side else price, self._amounts[index], self._counts[index])
+
+# -----------------------------------------------------------------------------
+
+
+class CompactAsks(CompactOrderBookSide): side = False                       # noqa
+class CompactBids(CompactOrderBookSide): side = True                        # noqa
+class CompactCountedAsks(CompactCountedOrderBookSide): side = False         # noqa
+class CompactCountedBids(CompactCountedOrderBookSide): side = True          # noqa
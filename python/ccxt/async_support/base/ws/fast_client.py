@@ -8,6 +8,9 @@ from ccxt.async_support.base.ws.aiohttp_client import AiohttpClient
 
 class FastClient(AiohttpClient):
     transport = None
+    # how many messages to handle per event loop iteration, 0 handles one message per iteration
+    # in batches, futures are resolved once with the last result after the whole batch was handled
+    batchSize = 0
 
     def __init__(self, url, on_message_callback, on_error_callback, on_close_callback, on_connected_callback, config={}):
         super(FastClient, self).__init__(url, on_message_callback, on_error_callback, on_close_callback, on_connected_callback, config)
@@ -15,25 +18,62 @@ class FastClient(AiohttpClient):
         # https://github.com/aio-libs/aiohttp/blob/1d296d549050aa335ef542421b8b7dad788246d5/aiohttp/streams.py#L534
         self.stack = collections.deque()
         self.callback_scheduled = False
+        self.batching = False
+        self.resolved = {}
 
-    def receive_loop(self):
-        def handler():
-            if not self.stack:
-                self.callback_scheduled = False
-                return
+    def handler(self):
+        if not self.stack:
+            self.callback_scheduled = False
+            return
+        if self.batchSize:
+            self.batching = True
+            try:
+                for i in range(min(self.batchSize, len(self.stack))):
+                    message = self.stack.popleft()
+                    try:
+                        self.handle_message(message)
+                    except Exception as error:
+                        self.reject(error)
+            finally:
+                self.batching = False
+                self.flush()
+        else:
             message = self.stack.popleft()
             try:
                 self.handle_message(message)
             except Exception as error:
                 self.reject(error)
-            self.asyncio_loop.call_soon(handler)
+        self.asyncio_loop.call_soon(self.handler)
+
+    def feed_data(self, message, size):
+        if not self.callback_scheduled:
+            self.callback_scheduled = True
+            self.asyncio_loop.call_soon(self.handler)
+        self.stack.append(message)
 
-        def feed_data(message, size):
-            if not self.callback_scheduled:
-                self.callback_scheduled = True
-                self.asyncio_loop.call_soon(handler)
-            self.stack.append(message)
+    def resolve(self, result, message_hash):
+        if self.batching:
+            # the last result wins, the future is resolved at the end of the batch
+            self.resolved[message_hash] = result
+            return result
+        return super(FastClient, self).resolve(result, message_hash)
 
+    def reject(self, result, message_hash=None):
+        if self.batching:
+            # the results handled before the error reach their futures first, like without batching
+            if message_hash is None:
+                self.flush()
+            elif message_hash in self.resolved:
+                super(FastClient, self).resolve(self.resolved.pop(message_hash), message_hash)
+        return super(FastClient, self).reject(result, message_hash)
+
+    def flush(self):
+        resolved = self.resolved
+        self.resolved = {}
+        for message_hash in resolved:
+            super(FastClient, self).resolve(resolved[message_hash], message_hash)
+
+    def receive_loop(self):
         def feed_eof():
             if self._close_code == 1000:  # OK close
                 self.on_close(1000)
@@ -83,7 +123,7 @@ class FastClient(AiohttpClient):
 
         ws_reader = connection.protocol._payload_parser
         ws_reader.parse_frame = wrapper(ws_reader.parse_frame)
-        ws_reader.queue.feed_data = feed_data
+        ws_reader.queue.feed_data = self.feed_data
         ws_reader.queue.feed_eof = feed_eof
         self.connection.close = close
         # return a future so super class won't complain
@@ -92,5 +132,6 @@ class FastClient(AiohttpClient):
     def reset(self, error):
         super(FastClient, self).reset(error)
         self.stack.clear()
+        self.resolved = {}
         if self.transport:
             self.transport.abort()
@@ -1,13 +1,26 @@
 # -*- coding: utf-8 -*-
 
 from ccxt.async_support.base.ws import order_book_side
+from ccxt.async_support.base.ws import compact_order_book_side
 from ccxt import Exchange
+from array import array
 import sys
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class OrderBook(dict):
-    def __init__(self, snapshot={}, depth=None):
+    # with strings=True the levels keep the price and amount strings sent by the exchange
+    # with compact=True the levels are kept in arrays of floats, see CompactOrderBookSide
+    def __init__(self, snapshot={}, depth=None, strings=False, compact=False):
         self.cache = []
+        self._checksum = None
+        self._checksum_key = None
+        # the float arrays of to_arrays by side
+        self._buffers = {}
         depth = depth or sys.maxsize
         defaults = {
             'bids': [],
@@ -19,10 +32,13 @@ class OrderBook(dict):
         }
         # do not mutate snapshot
         defaults.update(snapshot)
-        if not isinstance(defaults['asks'], order_book_side.OrderBookSide):
-            defaults['asks'] = order_book_side.Asks(defaults['asks'], depth)
-        if not isinstance(defaults['bids'], order_book_side.OrderBookSide):
-            defaults['bids'] = order_book_side.Bids(defaults['bids'], depth)
+        sides = (order_book_side.OrderBookSide, compact_order_book_side.CompactOrderBookSide)
+        if not isinstance(defaults['asks'], sides):
+            asks = order_book_side.StringAsks if strings else compact_order_book_side.CompactAsks if compact else order_book_side.Asks
+            defaults['asks'] = asks(defaults['asks'], depth)
+        if not isinstance(defaults['bids'], sides):
+            bids = order_book_side.StringBids if strings else compact_order_book_side.CompactBids if compact else order_book_side.Bids
+            defaults['bids'] = bids(defaults['bids'], depth)
         defaults['datetime'] = Exchange.iso8601(defaults.get('timestamp'))
         # merge to self
         super(OrderBook, self).__init__(defaults)
@@ -33,11 +49,9 @@ class OrderBook(dict):
         return self
 
     def reset(self, snapshot={}):
-        self['asks']._index.clear()
         self['asks'].clear()
         for ask in snapshot.get('asks', []):
             self['asks'].storeArray(ask)
-        self['bids']._index.clear()
         self['bids'].clear()
         for bid in snapshot.get('bids', []):
             self['bids'].storeArray(bid)
@@ -46,6 +60,57 @@ class OrderBook(dict):
         self['datetime'] = Exchange.iso8601(self['timestamp'])
         self['symbol'] = snapshot.get('symbol')
 
+    def keep_strings(self):
+        # see OrderBookSide.keep_strings
+        self['asks'].keep_strings()
+        self['bids'].keep_strings()
+        return self
+
+    def checksum(self, depth, payload, signed=True):
+        # the crc32 of payload(bids, asks), bids and asks are the [price, amount] strings of the first depth levels
+        # of the sides, see OrderBookSide.top_strings, it is only computed again after these levels have changed
+        bids = self['bids']
+        asks = self['asks']
+        key = (depth, payload, signed)
+        if key != self._checksum_key or bids.top_changed(depth) or asks.top_changed(depth):
+            self._checksum = Exchange.crc32(payload(bids.top_strings(depth), asks.top_strings(depth)), signed)
+            self._checksum_key = key
+        return self._checksum
+
+    def to_arrays(self, depth=None, cumulative=False):
+        # the prices and the amounts of the first depth levels of the sides as contiguous float64 arrays
+        # bid_prices, bid_amounts, ask_prices, ask_amounts, with cumulative=True the amounts are summed from the top
+        # they are numpy arrays if numpy is installed or memoryviews otherwise, of buffers that are kept
+        # by the order book and overwritten by the next call, copy them to keep them
+        result = []
+        for key in ('bids', 'asks'):
+            side = self[key]
+            count = len(side) if depth is None else min(depth, len(side))
+            prices, amounts = self.get_buffers(key, count)
+            side.export(prices[0], amounts[0], count, cumulative)
+            result.append(prices[1][:count])
+            result.append(amounts[1][:count])
+        return tuple(result)
+
+    def get_buffers(self, key, count):
+        # [array, view] pairs for the prices and the amounts of a side with room for count levels
+        # the arrays are replaced when they are too small because they can not be resized while they are viewed
+        buffers = self._buffers.get(key)
+        if buffers is None or len(buffers[0][0]) < count:
+            capacity = max(16, count, 2 * len(buffers[0][0]) if buffers else 0)
+            buffers = []
+            for i in range(2):
+                buffer = array('d', bytes(8 * capacity))
+                buffers.append([buffer, numpy.frombuffer(buffer, dtype=numpy.float64) if numpy is not None else memoryview(buffer)])
+            self._buffers[key] = buffers
+        return buffers
+
+    def apply_deltas(self, bids, asks, *indexes):
+        # stores raw price levels of both sides, see OrderBookSide.apply_deltas for the indexes
+        self['bids'].apply_deltas(bids, *indexes)
+        self['asks'].apply_deltas(asks, *indexes)
+        return self
+
     def update(self, snapshot):
         nonce = snapshot.get('nonce')
         if nonce is not None and self['nonce'] is not None and nonce < self['nonce']:
@@ -58,21 +123,25 @@ class OrderBook(dict):
 
 
 class CountedOrderBook(OrderBook):
-    def __init__(self, snapshot={}, depth=None):
+    def __init__(self, snapshot={}, depth=None, strings=False, compact=False):
+        asks = order_book_side.StringCountedAsks if strings else compact_order_book_side.CompactCountedAsks if compact else order_book_side.CountedAsks
+        bids = order_book_side.StringCountedBids if strings else compact_order_book_side.CompactCountedBids if compact else order_book_side.CountedBids
         copy = Exchange.extend(snapshot, {
-            'asks': order_book_side.CountedAsks(snapshot.get('asks', []), depth),
-            'bids': order_book_side.CountedBids(snapshot.get('bids', []), depth),
+            'asks': asks(snapshot.get('asks', []), depth),
+            'bids': bids(snapshot.get('bids', []), depth),
         })
         super(CountedOrderBook, self).__init__(copy, depth)
 
 # -----------------------------------------------------------------------------
-# indexed by order ids (3rd value in a bidask delta)
+# indexed by order ids (3rd value in a bidask delta), the levels of the orders are always lists
 
 
 class IndexedOrderBook(OrderBook):
-    def __init__(self, snapshot={}, depth=None):
+    def __init__(self, snapshot={}, depth=None, strings=False):
+        asks = order_book_side.StringIndexedAsks if strings else order_book_side.IndexedAsks
+        bids = order_book_side.StringIndexedBids if strings else order_book_side.IndexedBids
         copy = Exchange.extend(snapshot, {
-            'asks': order_book_side.IndexedAsks(snapshot.get('asks', []), depth),
-            'bids': order_book_side.IndexedBids(snapshot.get('bids', []), depth),
+            'asks': asks(snapshot.get('asks', []), depth),
+            'bids': bids(snapshot.get('bids', []), depth),
         })
         super(IndexedOrderBook, self).__init__(copy, depth)
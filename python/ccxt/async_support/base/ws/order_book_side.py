@@ -2,6 +2,7 @@
 
 import sys
 import bisect
+from ccxt.base.decimal_to_precision import number_to_string
 
 """Author: Carlo Revelli"""
 """Fast bisect bindings"""
@@ -18,6 +19,19 @@ class OrderBookSide(list):
         self._n = sys.maxsize
         # parallel to self
         self._index = []
+        # price levels by price, most deltas change the size of an existing level
+        # and only the levels that are inserted or deleted are searched in the index
+        self._levels = {}
+        # the deltas with the strings of the levels by price, filled by top_strings
+        self._strings = None
+        # whether apply_deltas keeps the strings of the deltas, see keep_strings
+        self._keep = False
+        self._string_indexes = (0, 1)
+        # the last result of top_strings, None after one of its levels has changed
+        self._top = None
+        self._top_depth = None
+        # changes at index prices after the boundary do not change the result of top_strings
+        self._boundary = float('inf')
         for delta in deltas:
             self.storeArray(list(delta))
 
@@ -27,21 +41,147 @@ class OrderBookSide(list):
     def storeArray(self, delta):
         price = delta[0]
         size = delta[1]
+        level = self._levels.get(price)
+        if level is not None:
+            if size:
+                level[1] = size
+                if self._strings is not None:
+                    self.update_strings(price, None)
+            else:
+                self.delete_level(price)
+        elif size:
+            self.insert_level(price, delta)
+
+    def insert_level(self, price, delta):
         index_price = -price if self.side else price
         index = bisect.bisect_left(self._index, index_price)
-        if size:
-            if index < len(self._index) and self._index[index] == index_price:
-                self[index][1] = size
-            else:
-                self._index.insert(index, index_price)
-                self.insert(index, delta)
-        elif index < len(self._index) and self._index[index] == index_price:
-            del self._index[index]
-            del self[index]
+        self._index.insert(index, index_price)
+        self.insert(index, delta)
+        self._levels[price] = delta
+        if index_price <= self._boundary:
+            self._top = None
+
+    def delete_level(self, price):
+        index_price = -price if self.side else price
+        index = bisect.bisect_left(self._index, index_price)
+        del self._index[index]
+        del self[index]
+        del self._levels[price]
+        if self._strings is not None:
+            self._strings.pop(price, None)
+        if index_price <= self._boundary:
+            self._top = None
+
+    def update_strings(self, price, delta):
+        if delta is None:
+            self._strings.pop(price, None)
+        else:
+            self._strings[price] = delta
+        if (-price if self.side else price) <= self._boundary:
+            self._top = None
 
     def store(self, price, size):
         self.storeArray([price, size])
 
+    def applyDeltas(self, deltas, *indexes):
+        # the name used by the exchange classes transpiled from javascript
+        return self.apply_deltas(deltas, *indexes)
+
+    def apply_deltas(self, deltas, price_index=0, amount_index=1):
+        # stores raw price levels like [["31738.3", "0.05973179"], ...] in one call
+        # prices and amounts can be strings or numbers
+        if self._strings is not None:
+            return self.apply_string_deltas(deltas, price_index, amount_index)
+        levels = self._levels
+        for delta in deltas:
+            price = float(delta[price_index])
+            size = float(delta[amount_index])
+            level = levels.get(price)
+            if level is not None:
+                if size:
+                    level[1] = size
+                else:
+                    self.delete_level(price)
+            elif size:
+                self.insert_level(price, [price, size])
+
+    def apply_string_deltas(self, deltas, price_index, amount_index):
+        levels = self._levels
+        strings = self._keep and self.string_deltas(deltas, price_index, amount_index)
+        for delta in deltas:
+            price = float(delta[price_index])
+            size = float(delta[amount_index])
+            level = levels.get(price)
+            if level is not None:
+                if size:
+                    level[1] = size
+                    self.update_strings(price, delta if strings else None)
+                else:
+                    self.delete_level(price)
+            elif size:
+                self.insert_level(price, [price, size])
+                if strings:
+                    self._strings[price] = delta
+
+    def keep_strings(self):
+        # keeps the strings sent by the exchange for the levels stored with apply_deltas,
+        # instead of the strings that top_strings formats from the numbers
+        self._keep = True
+        if self._strings is None:
+            self._strings = {}
+        self._top = None
+
+    def string_deltas(self, deltas, price_index, amount_index):
+        # whether the prices and amounts of the deltas are strings that can be kept
+        if not deltas or not isinstance(deltas[0][amount_index], str):
+            return False
+        if self._string_indexes != (price_index, amount_index):
+            self._strings.clear()
+            self._string_indexes = (price_index, amount_index)
+            self._top = None
+        return True
+
+    def top_changed(self, depth):
+        return self._top is None or depth != self._top_depth
+
+    def topStrings(self, depth):
+        # the name used by the exchange classes transpiled from javascript
+        return self.top_strings(depth)
+
+    def top_strings(self, depth):
+        # the [price, amount] strings of the first depth levels, they are
+        # only collected again after one of these levels has changed
+        if self._strings is None:
+            self._strings = {}
+        if self.top_changed(depth):
+            strings = self._strings
+            price_index, amount_index = self._string_indexes
+            top = []
+            for level in super(OrderBookSide, self).__getitem__(slice(0, depth)):
+                price = level[0]
+                delta = strings.get(price)
+                if delta is None:
+                    delta = [None] * (max(price_index, amount_index) + 1)
+                    delta[price_index] = number_to_string(price)
+                    delta[amount_index] = number_to_string(level[1])
+                    strings[price] = delta
+                top.append([delta[price_index], delta[amount_index]])
+            self._top = top
+            self._top_depth = depth
+            self._boundary = self._index[depth - 1] if len(self._index) >= depth else float('inf')
+        return self._top
+
+    def export(self, prices, amounts, count, cumulative=False):
+        # writes the prices and the amounts of the first count levels to the float arrays, see OrderBook.to_arrays
+        total = 0.0
+        for i, level in zip(range(count), self):
+            amount = float(level[1])
+            if cumulative:
+                total += amount
+                amount = total
+            prices[i] = float(level[0])
+            amounts[i] = amount
+
     def limit(self):
         difference = len(self) - self._depth
         for _ in range(difference):
@@ -49,7 +189,19 @@ class OrderBookSide(list):
             self._index.pop()
 
     def remove_index(self, order):
-        pass
+        price = order[0]
+        del self._levels[price]
+        if self._strings is not None:
+            self.update_strings(price, None)
+
+    def clear(self):
+        super(OrderBookSide, self).clear()
+        self._index.clear()
+        self._levels.clear()
+        if self._strings is not None:
+            self._strings.clear()
+        self._top = None
+        self._boundary = float('inf')
 
     def __len__(self):
         length = super(OrderBookSide, self).__len__()
@@ -84,22 +236,42 @@ class CountedOrderBookSide(OrderBookSide):
         price = delta[0]
         size = delta[1]
         count = delta[2]
-        index_price = -price if self.side else price
-        index = bisect.bisect_left(self._index, index_price)
-        if size and count:
-            if index < len(self._index) and self._index[index] == index_price:
-                self[index][1] = size
-                self[index][2] = count
+        level = self._levels.get(price)
+        if level is not None:
+            if size and count:
+                level[1] = size
+                level[2] = count
+                if self._strings is not None:
+                    self.update_strings(price, None)
             else:
-                self._index.insert(index, index_price)
-                self.insert(index, delta)
-        elif index < len(self._index) and self._index[index] == index_price:
-            del self._index[index]
-            del self[index]
+                self.delete_level(price)
+        elif size and count:
+            self.insert_level(price, delta)
 
     def store(self, price, size, count):
         self.storeArray([price, size, count])
 
+    def apply_deltas(self, deltas, price_index=0, amount_index=1, count_index=2):
+        levels = self._levels
+        strings = self._keep and self._strings is not None and self.string_deltas(deltas, price_index, amount_index)
+        for delta in deltas:
+            price = float(delta[price_index])
+            size = float(delta[amount_index])
+            count = int(float(delta[count_index]))
+            level = levels.get(price)
+            if level is not None:
+                if size and count:
+                    level[1] = size
+                    level[2] = count
+                    if self._strings is not None:
+                        self.update_strings(price, delta if strings else None)
+                else:
+                    self.delete_level(price)
+            elif size and count:
+                self.insert_level(price, [price, size, count])
+                if strings:
+                    self._strings[price] = delta
+
 # -----------------------------------------------------------------------------
 # indexed by order ids (3rd value in a bidask delta)
 
@@ -160,9 +332,171 @@ class IndexedOrderBookSide(OrderBookSide):
         if order_id in self._hashmap:
             del self._hashmap[order_id]
 
+    def clear(self):
+        super(IndexedOrderBookSide, self).clear()
+        self._hashmap.clear()
+
+    def top_changed(self, depth):
+        return True
+
+    def top_strings(self, depth):
+        # several orders can have the same price, the strings are not kept by price
+        return [[number_to_string(level[0]), number_to_string(level[1])] for level in super(IndexedOrderBookSide, self).__getitem__(slice(0, depth))]
+
     def store(self, price, size, order_id):
         self.storeArray([price, size, order_id])
 
+    def apply_deltas(self, deltas, price_index=0, amount_index=1, id_index=2):
+        # the price can be missing when an order is changed or deleted
+        for delta in deltas:
+            price = delta[price_index]
+            self.storeArray([None if price is None else float(price), float(delta[amount_index]), delta[id_index]])
+
+# -----------------------------------------------------------------------------
+# keeps the price and amount strings sent by the exchange in the levels
+# the levels are found and sorted by the numeric value of the price
+# numbers are stored as the strings returned by number_to_string
+
+
+def to_string(value):
+    return value if value is None or isinstance(value, str) else number_to_string(value)
+
+
+class StringOrderBookSide(OrderBookSide):
+    def storeArray(self, delta):
+        delta[0] = to_string(delta[0])
+        delta[1] = to_string(delta[1])
+        price = float(delta[0])
+        level = self._levels.get(price)
+        if level is not None:
+            if float(delta[1]):
+                level[1] = delta[1]
+                self.touch(price)
+            else:
+                self.delete_level(price)
+        elif float(delta[1]):
+            self.insert_level(price, delta)
+
+    def apply_deltas(self, deltas, price_index=0, amount_index=1):
+        levels = self._levels
+        for delta in deltas:
+            price_string = to_string(delta[price_index])
+            amount_string = to_string(delta[amount_index])
+            price = float(price_string)
+            level = levels.get(price)
+            if level is not None:
+                if float(amount_string):
+                    level[1] = amount_string
+                    self.touch(price)
+                else:
+                    self.delete_level(price)
+            elif float(amount_string):
+                self.insert_level(price, [price_string, amount_string])
+
+    def touch(self, price):
+        if (-price if self.side else price) <= self._boundary:
+            self._top = None
+
+    def keep_strings(self):
+        pass
+
+    def top_strings(self, depth):
+        if self.top_changed(depth):
+            self._top = [[level[0], level[1]] for level in super(OrderBookSide, self).__getitem__(slice(0, depth))]
+            self._top_depth = depth
+            self._boundary = self._index[depth - 1] if len(self._index) >= depth else float('inf')
+        return self._top
+
+    def remove_index(self, order):
+        price = float(order[0])
+        del self._levels[price]
+        self.touch(price)
+
+
+class StringCountedOrderBookSide(StringOrderBookSide, CountedOrderBookSide):
+    def storeArray(self, delta):
+        delta[0] = to_string(delta[0])
+        delta[1] = to_string(delta[1])
+        price = float(delta[0])
+        count = delta[2]
+        level = self._levels.get(price)
+        if level is not None:
+            if float(delta[1]) and count:
+                level[1] = delta[1]
+                level[2] = count
+                self.touch(price)
+            else:
+                self.delete_level(price)
+        elif float(delta[1]) and count:
+            self.insert_level(price, delta)
+
+    def apply_deltas(self, deltas, price_index=0, amount_index=1, count_index=2):
+        levels = self._levels
+        for delta in deltas:
+            price_string = to_string(delta[price_index])
+            amount_string = to_string(delta[amount_index])
+            price = float(price_string)
+            count = int(float(delta[count_index]))
+            level = levels.get(price)
+            if level is not None:
+                if float(amount_string) and count:
+                    level[1] = amount_string
+                    level[2] = count
+                    self.touch(price)
+                else:
+                    self.delete_level(price)
+            elif float(amount_string) and count:
+                self.insert_level(price, [price_string, amount_string, count])
+
+
+class StringIndexedOrderBookSide(StringOrderBookSide, IndexedOrderBookSide):
+    def storeArray(self, delta):
+        delta[0] = to_string(delta[0])
+        delta[1] = to_string(delta[1])
+        price = delta[0]
+        index_price = None if price is None else (-float(price) if self.side else float(price))
+        size = delta[1]
+        order_id = delta[2]
+        if size is not None and float(size):
+            if order_id in self._hashmap:
+                old_price = self._hashmap[order_id]
+                old_index = self.find_order(old_price, order_id)
+                if index_price is None:
+                    # the price is not defined
+                    index_price = old_price
+                    delta[0] = self[old_index][0]
+                if index_price == old_price:
+                    self[old_index] = delta
+                    return
+                # remove old price level
+                del self._index[old_index]
+                del self[old_index]
+            # insert new price level
+            self._hashmap[order_id] = index_price
+            index = bisect.bisect_left(self._index, index_price)
+            while index < len(self._index) and self._index[index] == index_price and self[index][2] < order_id:
+                index += 1
+            self._index.insert(index, index_price)
+            self.insert(index, delta)
+        elif order_id in self._hashmap:
+            index = self.find_order(self._hashmap[order_id], order_id)
+            del self._index[index]
+            del self[index]
+            del self._hashmap[order_id]
+
+    def find_order(self, index_price, order_id):
+        index = bisect.bisect_left(self._index, index_price)
+        while self[index][2] != order_id:
+            index += 1
+        return index
+
+    def apply_deltas(self, deltas, price_index=0, amount_index=1, id_index=2):
+        for delta in deltas:
+            self.storeArray([delta[price_index], delta[amount_index], delta[id_index]])
+
+    def remove_index(self, order):
+        IndexedOrderBookSide.remove_index(self, order)
+
 # -----------------------------------------------------------------------------
 # a more elegant syntax is possible here, but native inheritance is portable
 
@@ -172,3 +506,9 @@ class CountedAsks(CountedOrderBookSide): side = False                       # no
 class CountedBids(CountedOrderBookSide): side = True                        # noqa
 class IndexedAsks(IndexedOrderBookSide): side = False                       # noqa
 class IndexedBids(IndexedOrderBookSide): side = True                        # noqa
+class StringAsks(StringOrderBookSide): side = False                         # noqa
+class StringBids(StringOrderBookSide): side = True                          # noqa
+class StringCountedAsks(StringCountedOrderBookSide): side = False           # noqa
+class StringCountedBids(StringCountedOrderBookSide): side = True            # noqa
+class StringIndexedAsks(StringIndexedOrderBookSide): side = False           # noqa
+class StringIndexedBids(StringIndexedOrderBookSide): side = True            # noqa
@@ -205,6 +205,7 @@ class cex(Exchange, ImplicitAPI):
                 },
             },
             'options': {
+                'loadCurrenciesBeforeMarkets': True,
                 'fetchOHLCVWarning': True,
                 'createMarketBuyOrderRequiresPrice': True,
                 'order': {
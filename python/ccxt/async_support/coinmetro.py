@@ -218,6 +218,7 @@ class coinmetro(Exchange, ImplicitAPI):
             'precisionMode': DECIMAL_PLACES,
             # exchange-specific options
             'options': {
+                'loadCurrenciesBeforeMarkets': True,
                 'currenciesByIdForParseMarket': None,
                 'currencyIdsListForParseMarket': None,
             },
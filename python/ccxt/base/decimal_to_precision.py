@@ -1,4 +1,5 @@
 import decimal
+import functools
 import numbers
 import itertools
 import re
@@ -14,6 +15,7 @@ __all__ = [
     'NO_PADDING',
     'PAD_WITH_ZERO',
     'decimal_to_precision',
+    'decimals_to_precision',
 ]
 
 
@@ -165,6 +167,112 @@ def decimal_to_precision(n, rounding_mode=ROUND, precision=None, counting_mode=D
             return precise
 
 
+class PrecisionPlan:
+    """decimal_to_precision with the arguments checked and the tick size and the quantizer computed once
+
+    The plan is used for the batches of decimals_to_precision, the results are the same as decimal_to_precision,
+    negative precisions, negative tick sizes and significant digits are passed to decimal_to_precision"""
+
+    def __init__(self, rounding_mode=ROUND, precision=None, counting_mode=DECIMAL_PLACES, padding_mode=NO_PADDING):
+        assert precision is not None
+        if counting_mode == TICK_SIZE:
+            assert(isinstance(precision, float) or isinstance(precision, decimal.Decimal) or isinstance(precision, numbers.Integral) or isinstance(precision, str))
+        else:
+            assert(isinstance(precision, numbers.Integral))
+        assert rounding_mode in [TRUNCATE, ROUND]
+        assert counting_mode in [DECIMAL_PLACES, SIGNIFICANT_DIGITS, TICK_SIZE]
+        assert padding_mode in [NO_PADDING, PAD_WITH_ZERO]
+        self.arguments = (rounding_mode, precision, counting_mode, padding_mode)
+        self.round = None  # rounds a decimal, None if decimal_to_precision is used
+        if isinstance(precision, str):
+            precision = float(precision)
+        if counting_mode == DECIMAL_PLACES:
+            if 0 <= precision <= decimal.getcontext().prec - 2:
+                self.round = self.decimal_places(rounding_mode, precision, padding_mode)
+        elif counting_mode == TICK_SIZE and precision > 0:
+            # see the TICK_SIZE branch of decimal_to_precision
+            # the trailing zeros are removed so the decimals of the tick size are never negative
+            parts = re.sub(r'0+$', '', '{:f}'.format(decimal.Decimal(str(precision)))).split('.')
+            new_precision = len(parts[1]) if len(parts) > 1 else 0
+            if new_precision <= decimal.getcontext().prec - 2:
+                self.round = self.tick_size(rounding_mode, precision, self.decimal_places(ROUND, new_precision, padding_mode))
+
+    @staticmethod
+    def decimal_places(rounding_mode, precision, padding_mode):
+        quantizer = decimal.Decimal('10') ** (-precision)
+
+        def round_decimal(dec):
+            if rounding_mode == ROUND:
+                precise = '{:f}'.format(dec.quantize(quantizer))
+                if precise == '-0':
+                    precise = precise[1:]
+            else:
+                string = '{:f}'.format(dec)
+                before, after = string.split('.') if '.' in string else (string, '')
+                precise = before + '.' + after[:precision]
+                if precise == '-0.' or precise == '-0':
+                    precise = precise[1:]
+                precise = precise.rstrip('.')
+            if padding_mode == NO_PADDING:
+                return precise.rstrip('0').rstrip('.') if '.' in precise else precise
+            if '.' in precise:
+                before, after = precise.split('.')
+                return before + '.' + after.ljust(precision, '0')
+            if precision > 0:
+                return precise + '.' + precision * '0'
+            return precise
+        return round_decimal
+
+    @staticmethod
+    def tick_size(rounding_mode, precision, round_places):
+        tick = decimal.Decimal(str(precision))
+        half = precision / 2
+
+        def round_decimal(dec):
+            # python modulo with negative numbers behaves different than js/php, so use abs first
+            missing = abs(dec) % tick
+            if missing != 0:
+                if rounding_mode == ROUND:
+                    if dec > 0:
+                        dec = dec - missing + tick if missing >= half else dec - missing
+                    else:
+                        dec = dec + missing - tick if missing >= half else dec + missing
+                elif dec < 0:
+                    dec = dec + missing
+                else:
+                    dec = dec - missing
+            return round_places(decimal.Decimal('{:f}'.format(dec)))
+        return round_decimal
+
+    def __call__(self, values):
+        if self.round is None:
+            return [decimal_to_precision(value, *self.arguments) for value in values]
+        context = decimal.getcontext()
+        # the same context as decimal_to_precision
+        context.traps[decimal.Underflow] = True
+        context.rounding = decimal.ROUND_HALF_UP
+        round_decimal = self.round
+        return [round_decimal(decimal.Decimal(str(value))) for value in values]
+
+    def one(self, value):
+        if self.round is None:
+            return decimal_to_precision(value, *self.arguments)
+        context = decimal.getcontext()
+        context.traps[decimal.Underflow] = True
+        context.rounding = decimal.ROUND_HALF_UP
+        return self.round(decimal.Decimal(str(value)))
+
+
+@functools.lru_cache(maxsize=1024, typed=True)
+def precision_plan(rounding_mode=ROUND, precision=None, counting_mode=DECIMAL_PLACES, padding_mode=NO_PADDING):
+    return PrecisionPlan(rounding_mode, precision, counting_mode, padding_mode)
+
+
+def decimals_to_precision(values, rounding_mode=ROUND, precision=None, counting_mode=DECIMAL_PLACES, padding_mode=NO_PADDING):
+    # decimal_to_precision of every value of a list or an array, the plans are kept by the arguments
+    return precision_plan(rounding_mode, precision, counting_mode, padding_mode)(values)
+
+
 def number_to_string(x):
     # avoids scientific notation for too large and too small numbers
     if x is None:
@@ -28,9 +28,13 @@ from ccxt.base.errors import ProxyError
 # -----------------------------------------------------------------------------
 
 from ccxt.base.decimal_to_precision import decimal_to_precision
+from ccxt.base.decimal_to_precision import decimals_to_precision
 from ccxt.base.decimal_to_precision import DECIMAL_PLACES, TICK_SIZE, NO_PADDING, TRUNCATE, ROUND, ROUND_UP, ROUND_DOWN, SIGNIFICANT_DIGITS
 from ccxt.base.decimal_to_precision import number_to_string
+from ccxt.base.market_rules import MarketRules
 from ccxt.base.precise import Precise
+from ccxt.base.json_decoders import get_json_decoder
+from ccxt.base.market_cache import market_cache_path, read_market_cache, write_market_cache
 from ccxt.base.types import BalanceAccount, Currency, IndexType, OrderSide, OrderType, Trade, OrderRequest, Market, MarketType, Str, Num, Strings, CancellationRequest, Bool
 
 # -----------------------------------------------------------------------------
@@ -54,9 +58,7 @@ try:
 except ImportError:
     eddsa = None
 
-# eth signing
-from ccxt.static_dependencies.ethereum import abi
-from ccxt.static_dependencies.ethereum import account
+# eth signing, ccxt.static_dependencies.ethereum is imported by the methods that use it
 from ccxt.static_dependencies.msgpack import packb
 
 
@@ -122,6 +124,10 @@ class Exchange(object):
     ssl_context = None
     trust_env = False
     aiohttp_trust_env = False
+    # keyword arguments of aiohttp.TCPConnector, like limit, limit_per_host, keepalive_timeout, ttl_dns_cache or happy_eyeballs_delay
+    aiohttp_connector = None
+    # connections opened to every api host by open() before the first request
+    aiohttp_prewarm = 0
     requests_trust_env = False
     session = None  # Session () by default
     socks_proxy_sessions = None
@@ -205,6 +211,8 @@ class Exchange(object):
     token = ''  # reserved for HTTP auth in some cases
     twofa = None
     markets_by_id = None
+    market_rules_by_symbol = None  # compiled by market_rules
+    markets_with_derived_currencies = None  # the markets update_markets derived the currencies from
     currencies_by_id = None
     precision = None
     exceptions = None
@@ -403,6 +411,9 @@ class Exchange(object):
     minFundingAddressLength = 1  # used in check_address
     substituteCommonCurrencyCodes = True
     quoteJsonNumbers = True
+    jsonDecoder = 'json'  # json, orjson, msgspec or auto for websocket messages and responses with quoteJsonNumbers = False, see ccxt.base.json_decoders
+    marketsCache = None  # a directory where load_markets saves the markets, see ccxt.base.market_cache
+    marketsCacheTTL = 3600000  # milliseconds, older saved markets are fetched again
     number: Num = float  # or str (a pointer to a class)
     handleContentTypeApplicationZip = False
     # whether fees should be summed by currency code
@@ -436,6 +447,8 @@ class Exchange(object):
         'BCHSV': 'BSV',
     }
     synchronous = True
+    _describe_cache = {}  # see describe_defaults
+    _camelcase_cache = {}  # see camelcase_names
 
     def __init__(self, config={}):
         self.aiohttp_trust_env = self.aiohttp_trust_env or self.trust_env
@@ -453,6 +466,7 @@ class Exchange(object):
         self.trades = dict() if self.trades is None else self.trades
         self.transactions = dict() if self.transactions is None else self.transactions
         self.ohlcvs = dict() if self.ohlcvs is None else self.ohlcvs
+        self.market_rules_by_symbol = dict() if self.market_rules_by_symbol is None else self.market_rules_by_symbol
         self.currencies = dict() if self.currencies is None else self.currencies
         self.options = self.get_default_options() if self.options is None else self.options  # Python does not allow to define properties in run-time with setattr
         self.decimal_to_precision = decimal_to_precision
@@ -466,13 +480,20 @@ class Exchange(object):
         self.origin = self.uuid()
         self.userAgent = default_user_agent()
 
-        settings = self.deep_extend(self.describe(), config)
-
-        for key in settings:
+        # describe() merged with the defaults is computed once per class, every instance gets its own copy
+        defaults = self.describe_defaults()
+        for key in defaults:
+            if key in config:
+                setattr(self, key, self.deep_extend(self.deep_copy(defaults[key]), config[key]))
+            else:
+                setattr(self, key, self.deep_copy(defaults[key]))
+        for key in config:
+            if key in defaults:
+                continue
             if hasattr(self, key) and isinstance(getattr(self, key), dict):
-                setattr(self, key, self.deep_extend(getattr(self, key), settings[key]))
+                setattr(self, key, self.deep_extend(getattr(self, key), config[key]))
             else:
-                setattr(self, key, settings[key])
+                setattr(self, key, self.deep_extend(config[key]))
 
         if self.markets:
             self.set_markets(self.markets)
@@ -484,22 +505,27 @@ class Exchange(object):
             self.set_sandbox_mode(is_sandbox)
 
         # convert all properties from underscore notation foo_bar to camelcase notation fooBar
+        # the methods are converted on the class by the first instance, the other properties on every instance
         cls = type(self)
-        for name in dir(self):
-            if name[0] != '_' and name[-1] != '_' and '_' in name:
-                parts = name.split('_')
-                # fetch_ohlcv → fetchOHLCV (not fetchOhlcv!)
-                exceptions = {'ohlcv': 'OHLCV', 'le': 'LE', 'be': 'BE'}
-                camelcase = parts[0] + ''.join(exceptions.get(i, self.capitalize(i)) for i in parts[1:])
-                attr = getattr(self, name)
-                if isinstance(attr, types.MethodType):
-                    setattr(cls, camelcase, getattr(cls, name))
-                else:
-                    if hasattr(self, camelcase):
-                        if attr is not None:
-                            setattr(self, camelcase, attr)
-                    else:
+        class_methods, class_properties = self.camelcase_names()
+        names = list(class_properties.items())
+        for name in list(self.__dict__):
+            if name in class_properties:
+                continue
+            if name in class_methods:
+                names.append((name, class_methods[name]))
+            elif name[0] != '_' and name[-1] != '_' and '_' in name:
+                names.append((name, self.camelcase(name)))
+        for name, camelcase in names:
+            attr = getattr(self, name)
+            if isinstance(attr, types.MethodType):
+                setattr(cls, camelcase, getattr(cls, name))
+            else:
+                if hasattr(self, camelcase):
+                    if attr is not None:
                         setattr(self, camelcase, attr)
+                else:
+                    setattr(self, camelcase, attr)
 
         self.tokenBucket = self.extend({
             'refillRate': 1.0 / self.rateLimit if self.rateLimit > 0 else float('inf'),
@@ -508,11 +534,55 @@ class Exchange(object):
             'defaultCost': 1.0,
         }, getattr(self, 'tokenBucket', {}))
 
+        self.json_decoder = get_json_decoder(self.jsonDecoder)
+
         if not self.session and self.synchronous:
             self.session = Session()
             self.session.trust_env = self.requests_trust_env
         self.logger = self.logger if self.logger else logging.getLogger(__name__)
 
+    def describe_defaults(self):
+        # the settings of describe() merged with the dict properties of the class, computed once per class
+        # the number type is part of the key because describe() parses the fees with it
+        key = (type(self), self.number)
+        defaults = Exchange._describe_cache.get(key)
+        if defaults is None:
+            described = self.describe()
+            defaults = {}
+            for name in described:
+                if hasattr(self, name) and isinstance(getattr(self, name), dict):
+                    defaults[name] = self.deep_extend(getattr(self, name), described[name])
+                else:
+                    defaults[name] = described[name]
+            Exchange._describe_cache[key] = defaults
+        return defaults
+
+    def camelcase_names(self):
+        # the camelcase names of the methods and the other properties of the class, computed once per class
+        # the camelcase names of the methods are set on the class right away
+        cls = type(self)
+        names = Exchange._camelcase_cache.get(cls)
+        if names is None:
+            methods = {}
+            properties = {}
+            for name in dir(cls):
+                if name[0] != '_' and name[-1] != '_' and '_' in name:
+                    camelcase = self.camelcase(name)
+                    if name not in self.__dict__ and isinstance(getattr(self, name), types.MethodType):
+                        setattr(cls, camelcase, getattr(cls, name))
+                        methods[name] = camelcase
+                    else:
+                        properties[name] = camelcase
+            names = Exchange._camelcase_cache[cls] = (methods, properties)
+        return names
+
+    @staticmethod
+    def camelcase(name):
+        parts = name.split('_')
+        # fetch_ohlcv → fetchOHLCV (not fetchOhlcv!)
+        exceptions = {'ohlcv': 'OHLCV', 'le': 'LE', 'be': 'BE'}
+        return parts[0] + ''.join(exceptions.get(i, Exchange.capitalize(i)) for i in parts[1:])
+
     def __del__(self):
         if self.session:
             try:
@@ -538,6 +608,25 @@ class Exchange(object):
             delay = sleep_time - elapsed
             time.sleep(delay / 1000.0)
 
+    def calculate_rate_limiter_priority(self, api, method, path, params, config={}):
+        #
+        # the lane of the rate limiter queue, can be set per call with params['rateLimitPriority']
+        # or per endpoint with a 'priority' key next to the 'cost' in the api definition
+        #
+        priority = self.safe_string(params, 'rateLimitPriority', self.safe_string(config, 'priority'))
+        if priority is not None:
+            return priority
+        apiName = '_'.join(api) if isinstance(api, list) else api
+        if apiName.lower().find('public') >= 0:
+            return 'marketData'
+        return 'account' if (method == 'GET') else 'trading'
+
+    def call_endpoint(self, path, api='public', method='GET', params={}, config={}):
+        # the implicit api methods call this, the sync throttler has no lanes so the priority is dropped
+        if 'rateLimitPriority' in params:
+            params = self.omit(params, 'rateLimitPriority')
+        return self.request(path, api, method, params, config=config)
+
     @staticmethod
     def gzip_deflate(response, text):
         encoding = response.info().get('Content-Encoding')
@@ -572,7 +661,7 @@ class Exchange(object):
         if self.quoteJsonNumbers:
             return json.loads(response_body, parse_float=str, parse_int=str)
         else:
-            return json.loads(response_body)
+            return self.json_decoder.loads(response_body)
 
     def fetch(self, url, method='GET', headers=None, body=None):
         """Perform a HTTP request and return decoded JSON data"""
@@ -999,6 +1088,32 @@ class Exchange(object):
                 result = arg
         return result
 
+    @staticmethod
+    def deep_copy(value):
+        # a copy of the nested dicts and lists
+        if isinstance(value, dict):
+            return {key: Exchange.deep_copy(value[key]) for key in value}
+        if isinstance(value, list):
+            return [Exchange.deep_copy(item) for item in value]
+        return value
+
+    @staticmethod
+    def deep_merge(defaults, value):
+        # deep_extend(defaults, value) of two dicts in one pass, the nested dicts are copied and the lists are not
+        result = {}
+        for key, item in defaults.items():
+            if isinstance(item, dict):
+                override = value.get(key)
+                result[key] = Exchange.deep_merge(item, override if isinstance(override, dict) else {})
+            else:
+                result[key] = item
+        for key, item in value.items():
+            if not isinstance(item, dict):
+                result[key] = item
+            elif not isinstance(defaults.get(key), dict):
+                result[key] = Exchange.deep_merge({}, item)
+        return result
+
     @staticmethod
     def filter_by(array, key, value=None):
         array = Exchange.to_array(array)
@@ -1381,10 +1496,12 @@ class Exchange(object):
 
     @staticmethod
     def eth_abi_encode(types, args):
+        from ccxt.static_dependencies.ethereum import abi
         return abi.encode(types, args)
 
     @staticmethod
     def eth_encode_structured_data(domain, messageTypes, message):
+        from ccxt.static_dependencies.ethereum import account
         encodedData = account.messages.encode_typed_data(domain, messageTypes, message)
         return Exchange.binary_concat(b"\x19\x01", encodedData.header, encodedData.body)
 
@@ -1534,11 +1651,164 @@ class Exchange(object):
                 if not self.markets_by_id:
                     return self.set_markets(self.markets)
                 return self.markets
-        currencies = None
-        if self.has['fetchCurrencies'] is True:
-            currencies = self.fetch_currencies()
-        markets = self.fetch_markets(params)
-        return self.set_markets(markets, currencies)
+            cache = self.read_markets_cache(params)
+            if cache is not None and self.milliseconds() - cache['timestamp'] <= self.marketsCacheTTL:
+                return self.apply_markets(cache['markets'], cache['currencies'])
+        markets, currencies = self.fetch_markets_and_currencies(params)
+        self.write_markets_cache(params, markets, currencies)
+        return self.apply_markets(markets, currencies)
+
+    def markets_cache_path(self, params={}):
+        # everything the fetched markets depend on, the sandbox mode changes the api urls
+        key = [__version__, self.id, (self.urls or {}).get('api'), getattr(self, 'hostname', None), self.safe_string(self.options, 'defaultType'), self.safe_string(self.options, 'defaultSubType'), params]
+        return market_cache_path(self.marketsCache, self.id, key)
+
+    def read_markets_cache(self, params={}):
+        if self.marketsCache is None:
+            return None
+        return read_market_cache(self.markets_cache_path(params))
+
+    def write_markets_cache(self, params, markets, currencies):
+        if self.marketsCache is None:
+            return
+        try:
+            write_market_cache(self.markets_cache_path(params), self.milliseconds(), markets, currencies)
+        except (OSError, TypeError, ValueError) as e:
+            # the markets are used anyway, they are fetched again by the next instance
+            self.logger.warning(self.id + ' could not save the markets to ' + str(self.marketsCache) + ': ' + str(e))
+
+    def apply_markets(self, markets, currencies=None):
+        # set_markets for the markets loaded by load_markets, only the markets that differ from the loaded ones are processed
+        if type(self).set_markets is not Exchange.set_markets:
+            return self.set_markets(markets, currencies)
+        return self.update_markets(markets, currencies)
+
+    def update_markets(self, markets, currencies=None):
+        # the same as set_markets, the markets that equal the loaded ones keep their structures and only the currencies
+        # of the other markets are derived again, set_markets is used if several markets share a symbol
+        values = self.sort_by(self.to_array(markets), 'spot', True, True)
+        symbols = [value['symbol'] for value in values]
+        if None in symbols or len(set(symbols)) < len(symbols):
+            return self.set_markets(markets, currencies)
+        # the loaded markets as they were passed to set_markets by symbol, markets_by_id keeps them
+        loaded = {}
+        if self.markets:
+            for entries in (self.markets_by_id or {}).values():
+                for value in entries:
+                    loaded[value['symbol']] = value
+            if None in loaded or len(loaded) != len(self.markets) or not all(symbol in self.markets for symbol in loaded):
+                return self.set_markets(markets, currencies)
+        positions = {symbol: position for position, symbol in enumerate(self.markets)} if loaded else {}
+        defaults = self.deep_extend(self.safe_market_structure(), {
+            'precision': self.precision,
+            'limits': self.limits,
+        }, self.fees['trading'])
+        codes = set()
+        entries = []
+        ordered = True
+        last = -1
+        for value in values:
+            symbol = value['symbol']
+            if symbol in loaded and loaded[symbol] == value:
+                market = self.markets[symbol]
+                # the highest precision of a currency goes to the first of its markets like in set_markets
+                ordered = ordered and positions[symbol] > last
+                last = positions[symbol]
+            else:
+                market = self.deep_merge(defaults, value)
+                if market['linear']:
+                    market['subType'] = 'linear'
+                elif market['inverse']:
+                    market['subType'] = 'inverse'
+                else:
+                    market['subType'] = None
+                codes.update((self.safe_string(market, 'base'), self.safe_string(market, 'quote')))
+                if symbol in loaded:
+                    codes.update((self.safe_string(self.markets[symbol], 'base'), self.safe_string(self.markets[symbol], 'quote')))
+            entries.append((value, market))
+        fetched = set(symbols)
+        for symbol in loaded:
+            if symbol not in fetched:
+                codes.update((self.safe_string(self.markets[symbol], 'base'), self.safe_string(self.markets[symbol], 'quote')))
+        # the currencies of the loaded markets are kept if update_markets derived them from these markets
+        derived = loaded and self.markets_with_derived_currencies is self.markets
+        if not ordered or not derived:
+            for value, market in entries:
+                codes.update((self.safe_string(market, 'base'), self.safe_string(market, 'quote')))
+        self.markets_by_id = {}
+        for value, market in entries:
+            if value['id'] in self.markets_by_id:
+                self.markets_by_id[value['id']].append(value)
+            else:
+                self.markets_by_id[value['id']] = [value]
+        self.markets = {market['symbol']: market for value, market in entries}
+        self.symbols = sorted(self.markets)
+        self.ids = sorted(self.markets_by_id)
+        if currencies is not None:
+            self.currencies = self.deep_extend(self.currencies, currencies)
+        else:
+            codes.discard(None)
+            defaultCurrencyPrecision = 8 if (self.precisionMode == DECIMAL_PLACES) else self.parse_number('1e-8')
+            # the markets of every currency that changed, the structures are only made for the markets that win
+            baseMarkets = {}
+            quoteMarkets = {}
+            for value, market in entries:
+                base = self.safe_string(market, 'base')
+                if base in codes:
+                    baseMarkets.setdefault(base, []).append(market)
+                quote = self.safe_string(market, 'quote')
+                if quote in codes:
+                    quoteMarkets.setdefault(quote, []).append(market)
+            baseCurrencies = dict(self.baseCurrencies) if derived else {}
+            quoteCurrencies = dict(self.quoteCurrencies) if derived else {}
+            self.currencies = dict(self.currencies or {})
+            for code in sorted(codes):
+                if code in baseMarkets:
+                    baseCurrencies[code] = self.market_currency_structure(baseMarkets[code][-1], 'base', defaultCurrencyPrecision)
+                else:
+                    baseCurrencies.pop(code, None)
+                if code in quoteMarkets:
+                    quoteCurrencies[code] = self.market_currency_structure(quoteMarkets[code][-1], 'quote', defaultCurrencyPrecision)
+                else:
+                    quoteCurrencies.pop(code, None)
+                if code not in baseMarkets and code not in quoteMarkets:
+                    # set_markets keeps the currencies of the removed markets too
+                    continue
+                highestPrecision = None
+                highestPrecisionMarket = None
+                highestPrecisionSide = None
+                for side, keys, sideMarkets in (('base', ('base', 'amount'), baseMarkets.get(code, [])), ('quote', ('quote', 'price'), quoteMarkets.get(code, []))):
+                    for market in sideMarkets:
+                        precision = self.safe_value_2(self.safe_dict(market, 'precision', {}), keys[0], keys[1], defaultCurrencyPrecision)
+                        if highestPrecisionMarket is None or ((precision < highestPrecision) if self.precisionMode == TICK_SIZE else (precision > highestPrecision)):
+                            highestPrecision = precision
+                            highestPrecisionMarket = market
+                            highestPrecisionSide = side
+                currency = self.market_currency_structure(highestPrecisionMarket, highestPrecisionSide, defaultCurrencyPrecision)
+                self.currencies[code] = self.deep_extend(self.currencies.get(code), currency)
+            self.baseCurrencies = dict(sorted(baseCurrencies.items()))
+            self.quoteCurrencies = dict(sorted(quoteCurrencies.items()))
+        self.markets_with_derived_currencies = self.markets if currencies is None else None
+        self.currencies_by_id = self.index_by(self.currencies, 'id')
+        self.codes = sorted(self.currencies)
+        return self.markets
+
+    def market_currency_structure(self, market, side, defaultCurrencyPrecision):
+        # the base or the quote currency of a market the way set_markets makes it
+        marketPrecision = self.safe_dict(market, 'precision', {})
+        if side == 'base':
+            return self.safe_currency_structure({
+                'id': self.safe_string_2(market, 'baseId', 'base'),
+                'numericId': self.safe_integer(market, 'baseNumericId'),
+                'code': self.safe_string(market, 'base'),
+                'precision': self.safe_value_2(marketPrecision, 'base', 'amount', defaultCurrencyPrecision),
+            })
+        return self.safe_currency_structure({
+            'id': self.safe_string_2(market, 'quoteId', 'quote'),
+            'numericId': self.safe_integer(market, 'quoteNumericId'),
+            'code': self.safe_string(market, 'quote'),
+            'precision': self.safe_value_2(marketPrecision, 'quote', 'price', defaultCurrencyPrecision),
+        })
 
     def fetch_markets(self, params={}):
         # markets are returned as a list
@@ -1554,6 +1824,14 @@ class Exchange(object):
         # and may be changed for consistency later
         return self.currencies
 
+    def fetch_markets_and_currencies(self, params={}):
+        # what load_markets passes to set_markets, the async exchanges fetch both at once
+        currencies = None
+        if self.has['fetchCurrencies'] is True:
+            currencies = self.fetch_currencies()
+        markets = self.fetch_markets(params)
+        return markets, currencies
+
     def fetch_fees(self):
         trading = {}
         funding = {}
@@ -1717,6 +1995,36 @@ class Exchange(object):
             ErrorClass = self.httpExceptions[codeAsString]
             raise ErrorClass(self.id + ' ' + method + ' ' + url + ' ' + codeAsString + ' ' + reason + ' ' + body)
 
+    def prices_to_precision(self, symbol: str, prices):
+        # price_to_precision of every price of a list or an array, the rounding of the market is prepared once
+        if type(self).price_to_precision is not Exchange.price_to_precision:
+            return [self.price_to_precision(symbol, price) for price in prices]
+        market = self.market(symbol)
+        results = decimals_to_precision(prices, ROUND, market['precision']['price'], self.precisionMode, self.paddingMode)
+        if '0' in results:
+            raise InvalidOrder(self.id + ' price of ' + market['symbol'] + ' must be greater than minimum price precision of ' + self.number_to_string(market['precision']['price']))
+        return results
+
+    def amounts_to_precision(self, symbol: str, amounts):
+        # amount_to_precision of every amount of a list or an array, the rounding of the market is prepared once
+        if type(self).amount_to_precision is not Exchange.amount_to_precision:
+            return [self.amount_to_precision(symbol, amount) for amount in amounts]
+        market = self.market(symbol)
+        results = decimals_to_precision(amounts, TRUNCATE, market['precision']['amount'], self.precisionMode, self.paddingMode)
+        if '0' in results:
+            raise InvalidOrder(self.id + ' amount of ' + market['symbol'] + ' must be greater than minimum amount precision of ' + self.number_to_string(market['precision']['amount']))
+        return results
+
+    def market_rules(self, symbol: str):
+        # the precision and the limits of a market compiled for checking many orders with round_price, round_amount and validate
+        # compiled on the first use and again after the markets are reloaded or the precision mode is changed
+        market = self.market(symbol)
+        rules = self.market_rules_by_symbol.get(market['symbol'])
+        if rules is None or rules.market is not market or rules.modes != (self.precisionMode, self.paddingMode):
+            overridden = [name for name in ['price_to_precision', 'amount_to_precision', 'cost_to_precision'] if getattr(type(self), name) is not getattr(Exchange, name)]
+            rules = self.market_rules_by_symbol[market['symbol']] = MarketRules(self, market, overridden)
+        return rules
+
     @staticmethod
     def crc32(string, signed=False):
         unsigned = binascii.crc32(string.encode('utf8'))
@@ -2535,6 +2843,7 @@ class Exchange(object):
         return cleanStructure
 
     def set_markets(self, markets, currencies=None):
+        self.markets_with_derived_currencies = None
         values = []
         self.markets_by_id = {}
         # handle marketId conflicts
@@ -3896,10 +4205,7 @@ class Exchange(object):
         })
 
     def safe_market(self, marketId: Str, market: Market = None, delimiter: Str = None, marketType: Str = None):
-        result = self.safe_market_structure({
-            'symbol': marketId,
-            'marketId': marketId,
-        })
+        # the markets of markets_by_id are returned as they are, the structure is only made for the unknown ids
         if marketId is not None:
             if (self.markets_by_id is not None) and (marketId in self.markets_by_id):
                 markets = self.markets_by_id[marketId]
@@ -3917,6 +4223,10 @@ class Exchange(object):
                         if currentMarket[marketType]:
                             return currentMarket
             elif delimiter is not None and delimiter != '':
+                result = self.safe_market_structure({
+                    'symbol': marketId,
+                    'marketId': marketId,
+                })
                 parts = marketId.split(delimiter)
                 partsLength = len(parts)
                 if partsLength == 2:
@@ -3930,7 +4240,10 @@ class Exchange(object):
                     return result
         if market is not None:
             return market
-        return result
+        return self.safe_market_structure({
+            'symbol': marketId,
+            'marketId': marketId,
+        })
 
     def check_required_credentials(self, error=True):
         """
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+"""JSON decoders for the responses and the websocket messages of an exchange
+
+The decoder is selected with the jsonDecoder property of the exchange:
+
+    exchange = ccxt.binance({'jsonDecoder': 'orjson'})
+
+'json' is the json module of the standard library, 'orjson' and 'msgspec' are used if those
+packages are installed, 'auto' picks the fastest of them that is installed.
+
+It decodes the websocket messages and the REST responses of the exchanges that set quoteJsonNumbers
+to False. With quoteJsonNumbers (the default) the numbers of the responses are kept as the strings they
+are written with, neither orjson nor msgspec can keep the text of the numbers, so those responses are
+always decoded by the json module.
+"""
+
+import json
+
+from ccxt.base.errors import NotSupported
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'JsonDecoder',
+    'OrjsonDecoder',
+    'MsgspecDecoder',
+    'get_json_decoder',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class JsonDecoder:
+    """The json module of the standard library"""
+
+    name = 'json'
+
+    def loads(self, data):
+        # data is a str or utf-8 encoded bytes, the json module would decode
+        # bytes to a str too but only after it detects their encoding
+        if isinstance(data, bytes):
+            data = data.decode()
+        return json.loads(data)
+
+
+class OrjsonDecoder(JsonDecoder):
+    """orjson, it decodes integers that do not fit into 64 bits as floats"""
+
+    name = 'orjson'
+
+    def loads(self, data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # the json module also accepts NaN, Infinity and lone surrogates
+            return json.loads(data)
+
+
+class MsgspecDecoder(JsonDecoder):
+    """msgspec"""
+
+    name = 'msgspec'
+
+    def __init__(self):
+        self.decoder = msgspec.json.Decoder()
+
+    def loads(self, data):
+        try:
+            return self.decoder.decode(data)
+        except msgspec.DecodeError:
+            return json.loads(data)
+
+
+decoders = {
+    'json': (JsonDecoder, True),
+    'orjson': (OrjsonDecoder, orjson is not None),
+    'msgspec': (MsgspecDecoder, msgspec is not None),
+}
+
+
+def get_json_decoder(name='json'):
+    if name == 'auto':
+        name = 'orjson' if orjson is not None else 'msgspec' if msgspec is not None else 'json'
+    if name not in decoders:
+        raise NotSupported('jsonDecoder must be one of ' + ', '.join(list(decoders) + ['auto']) + ', got ' + str(name))
+    decoder, installed = decoders[name]
+    if not installed:
+        raise NotSupported('jsonDecoder ' + name + ' requires the "' + name + '" module that can be installed by "pip install ' + name + '"')
+    return decoder()
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+import importlib
+import sys
+import types
+
+__all__ = [
+    'lazy_exchanges',
+]
+
+
+class ExchangesPackage(types.ModuleType):
+    """A package of exchanges that imports the module of an exchange on the first use of its class
+
+    ccxt, ccxt.async_support and ccxt.pro list their exchanges in exchanges, getattr(ccxt, id)
+    and from ccxt import id import the exchange then, see PEP 562"""
+
+    def __getattr__(self, name):
+        if name in self.__dict__.get('exchanges', ()):
+            exchange = getattr(importlib.import_module(self.__name__ + '.' + name), name)
+            self.__dict__[name] = exchange
+            return exchange
+        raise AttributeError('module ' + repr(self.__name__) + ' has no attribute ' + repr(name))
+
+    def __setattr__(self, name, value):
+        # importing ccxt.binance sets the module as an attribute of ccxt, the name is kept for the class
+        if isinstance(value, types.ModuleType) and name in self.__dict__.get('exchanges', ()):
+            return
+        super().__setattr__(name, value)
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self.__dict__.get('exchanges', ())))
+
+
+def lazy_exchanges(name):
+    # called at the end of the __init__ of a package of exchanges
+    sys.modules[name].__class__ = ExchangesPackage
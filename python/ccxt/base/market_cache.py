@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+"""On-disk cache of the markets and the currencies that load_markets fetches
+
+The cache is a directory set with the marketsCache property of the exchange:
+
+    exchange = ccxt.async_support.binance({'marketsCache': '~/.cache/ccxt', 'marketsCacheTTL': 3600000})
+    await exchange.load_markets()
+
+load_markets saves what fetch_markets and fetch_currencies return and the next instances run
+set_markets on the saved markets instead of fetching them. The files are kept by the exchange id,
+its api urls (sandbox mode), hostname, default market type, the params of load_markets and the
+version of ccxt. Markets older than marketsCacheTTL milliseconds are fetched again, the async
+exchanges use the saved markets meanwhile and swap the fetched ones in when they arrive.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'market_cache_path',
+    'read_market_cache',
+    'write_market_cache',
+]
+
+# -----------------------------------------------------------------------------
+
+VERSION = 1  # of the format of the files
+
+
+def market_cache_path(directory, exchange_id, key):
+    # key is a json-serializable list of everything the fetched markets depend on
+    digest = hashlib.sha1(json.dumps(key, sort_keys=True, default=str).encode()).hexdigest()[:16]
+    return os.path.join(os.path.expanduser(directory), exchange_id + '-' + digest + '.json.gz')
+
+
+def read_market_cache(path):
+    # {'timestamp': milliseconds, 'markets': list, 'currencies': dict or None}, None if the file is missing or damaged
+    try:
+        with gzip.open(path, 'rb') as file:
+            cache = json.loads(file.read())
+    except (OSError, EOFError, ValueError):
+        return None
+    if not isinstance(cache, dict) or cache.get('version') != VERSION:
+        return None
+    return cache
+
+
+def write_market_cache(path, timestamp, markets, currencies):
+    # the file is written under a temporary name and renamed, so the readers never see it half-written
+    data = json.dumps({
+        'version': VERSION,
+        'timestamp': timestamp,
+        'markets': markets,
+        'currencies': currencies,
+    }, separators=(',', ':')).encode()
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    descriptor, temporary = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(descriptor, 'wb') as file:
+            file.write(gzip.compress(data, compresslevel=1))
+        os.replace(temporary, path)
+    except BaseException:
+        os.remove(temporary)
+        raise
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+from ccxt.base.decimal_to_precision import decimal_to_precision
+from ccxt.base.decimal_to_precision import precision_plan
+from ccxt.base.decimal_to_precision import number_to_string
+from ccxt.base.decimal_to_precision import TRUNCATE, ROUND
+from ccxt.base.errors import InvalidOrder
+
+__all__ = [
+    'MarketRules',
+]
+
+
+class MarketRules:
+    """The precision and the limits of a market compiled for checking many orders
+
+    round_price, round_amount and round_cost return the same strings as price_to_precision,
+    amount_to_precision and cost_to_precision of the exchange, validate also checks the rounded
+    amount, price and cost against the limits of the market, the rules are made by exchange.market_rules"""
+
+    def __init__(self, exchange, market, overridden=()):
+        self.market = market
+        self.modes = (exchange.precisionMode, exchange.paddingMode)
+        self.id = exchange.id
+        self.symbol = market['symbol']
+        precision = market.get('precision') or {}
+        limits = market.get('limits') or {}
+        self.price_precision = precision.get('price')
+        self.amount_precision = precision.get('amount')
+        self.amount_min, self.amount_max = self.limit(limits, 'amount')
+        self.price_min, self.price_max = self.limit(limits, 'price')
+        self.cost_min, self.cost_max = self.limit(limits, 'cost')
+        # the cost of an order in the quote currency, the cost of inverse contracts is in the base currency
+        self.contract_size = float(market.get('contractSize') or 1)
+        self.inverse = bool(market.get('inverse'))
+        # the methods of the exchanges that round differently are used as they are
+        self.price_method = exchange.price_to_precision if 'price_to_precision' in overridden else None
+        self.amount_method = exchange.amount_to_precision if 'amount_to_precision' in overridden else None
+        self.cost_method = exchange.cost_to_precision if 'cost_to_precision' in overridden else None
+        self.price_plan = self.plan(ROUND, self.price_precision)
+        self.amount_plan = self.plan(TRUNCATE, self.amount_precision)
+        self.cost_plan = self.plan(TRUNCATE, self.price_precision)
+
+    @staticmethod
+    def limit(limits, key):
+        values = limits.get(key) or {}
+        minimum = values.get('min')
+        maximum = values.get('max')
+        return (None if minimum is None else float(minimum)), (None if maximum is None else float(maximum))
+
+    def plan(self, rounding_mode, precision):
+        # None if the arguments are not valid, decimal_to_precision raises the same errors as the exchange then
+        try:
+            return precision_plan(rounding_mode, precision, *self.modes)
+        except (AssertionError, TypeError):
+            return None
+
+    def round(self, plan, value, rounding_mode, precision):
+        if plan is None:
+            return decimal_to_precision(value, rounding_mode, precision, *self.modes)
+        return plan.one(value)
+
+    def round_price(self, price):
+        if self.price_method is not None:
+            return self.price_method(self.symbol, price)
+        result = self.round(self.price_plan, price, ROUND, self.price_precision)
+        if result == '0':
+            raise InvalidOrder(self.id + ' price of ' + self.symbol + ' must be greater than minimum price precision of ' + number_to_string(self.price_precision))
+        return result
+
+    def round_amount(self, amount):
+        if self.amount_method is not None:
+            return self.amount_method(self.symbol, amount)
+        result = self.round(self.amount_plan, amount, TRUNCATE, self.amount_precision)
+        if result == '0':
+            raise InvalidOrder(self.id + ' amount of ' + self.symbol + ' must be greater than minimum amount precision of ' + number_to_string(self.amount_precision))
+        return result
+
+    def round_cost(self, cost):
+        if self.cost_method is not None:
+            return self.cost_method(self.symbol, cost)
+        return self.round(self.cost_plan, cost, TRUNCATE, self.price_precision)
+
+    def check(self, name, value, minimum, maximum):
+        if minimum is not None and value < minimum:
+            raise InvalidOrder(self.id + ' ' + name + ' of ' + self.symbol + ' must be greater than or equal to minimum ' + name + ' of ' + number_to_string(minimum) + ', got ' + number_to_string(value))
+        if maximum is not None and value > maximum:
+            raise InvalidOrder(self.id + ' ' + name + ' of ' + self.symbol + ' must be less than or equal to maximum ' + name + ' of ' + number_to_string(maximum) + ', got ' + number_to_string(value))
+
+    def validate(self, amount, price=None):
+        """rounds the amount and the price of an order and checks them and the cost against the limits
+
+        returns the rounded amount and price as strings, the price is None for market orders,
+        raises InvalidOrder if the order does not fit the market"""
+        amount_string = self.round_amount(amount)
+        amount_value = float(amount_string)
+        self.check('amount', amount_value, self.amount_min, self.amount_max)
+        if price is None:
+            return amount_string, None
+        price_string = self.round_price(price)
+        price_value = float(price_string)
+        self.check('price', price_value, self.price_min, self.price_max)
+        if self.cost_min is not None or self.cost_max is not None:
+            if self.inverse:
+                cost = amount_value * self.contract_size / price_value
+            else:
+                cost = amount_value * self.contract_size * price_value
+            self.check('cost', cost, self.cost_min, self.cost_max)
+        return amount_string, price_string
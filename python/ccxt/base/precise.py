@@ -10,23 +10,147 @@
 #
 # (╯°□°）╯︵ ┻━┻
 
+import ast
+from functools import lru_cache
+
+
+@lru_cache(maxsize=8192)
+def parse(number):
+    # the integer and the decimals of a number string, the same prices and amounts are parsed again and again
+    modifier = 0
+    number = number.lower()
+    if 'e' in number:
+        number, modifier = number.split('e')
+        modifier = int(modifier)
+    decimal_index = number.find('.')
+    if decimal_index > -1:
+        decimals = len(number) - decimal_index - 1
+        integer = int(number.replace('.', ''))
+    else:
+        decimals = 0
+        integer = int(number)
+    return integer, decimals - modifier
+
+
+def to_string(integer, decimals):
+    # str(Precise(integer, decimals))
+    if integer == 0:
+        return '0'
+    sign = '-' if integer < 0 else ''
+    string = str(abs(integer))
+    digits = string.rstrip('0')
+    decimals -= len(string) - len(digits)
+    if decimals <= 0:
+        return sign + digits + '0' * -decimals
+    if len(digits) > decimals:
+        return sign + digits[:-decimals] + '.' + digits[-decimals:]
+    return sign + '0.' + digits.rjust(decimals, '0')
+
+
+# the arithmetic of the string_ methods and of expr on (integer, decimals) pairs
+
+
+def add(a, b):
+    if a[1] == b[1]:
+        return a[0] + b[0], a[1]
+    if a[1] > b[1]:
+        return a[0] + b[0] * 10 ** (a[1] - b[1]), a[1]
+    return a[0] * 10 ** (b[1] - a[1]) + b[0], b[1]
+
+
+def sub(a, b):
+    return add(a, (-b[0], b[1]))
+
+
+def mul(a, b):
+    return a[0] * b[0], a[1] + b[1]
+
+
+def div(a, b, precision=18):
+    # None when dividing by zero
+    if b[0] == 0:
+        return None
+    distance = precision - a[1] + b[1]
+    if distance == 0:
+        numerator = a[0]
+    elif distance < 0:
+        numerator = a[0] // 10 ** -distance
+    else:
+        numerator = a[0] * 10 ** distance
+    result, remainder = divmod(numerator, b[0])
+    # python floors negative numbers down instead of truncating
+    return result + 1 if result < 0 and remainder else result, precision
+
+
+def mod(a, b):
+    numerator = a[0] * 10 ** max(b[1] - a[1], 0)
+    rationizer = max(a[1] - b[1], 0)
+    return numerator % (b[0] * 10 ** rationizer), rationizer + b[1]
+
+
+def compare(a, b):
+    # the sign of a - b
+    difference = sub(a, b)[0]
+    return (difference > 0) - (difference < 0)
+
+
+operators = {
+    ast.Add: add,
+    ast.Sub: sub,
+    ast.Mult: mul,
+    ast.Div: div,
+    ast.Mod: mod,
+}
+
+
+def compile_node(node):
+    if isinstance(node, ast.BinOp) and type(node.op) in operators:
+        operator = operators[type(node.op)]
+        left = compile_node(node.left)
+        right = compile_node(node.right)
+
+        def evaluate(values):
+            a = left(values)
+            if a is None:
+                return None
+            b = right(values)
+            if b is None:
+                return None
+            return operator(a, b)
+        return evaluate
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        operand = compile_node(node.operand)
+        if isinstance(node.op, ast.UAdd):
+            return operand
+
+        def negate(values):
+            a = operand(values)
+            return None if a is None else (-a[0], a[1])
+        return negate
+    if isinstance(node, ast.Name):
+        name = node.id
+
+        def value(values):
+            string = values[name]
+            if string is None:
+                return None
+            return parse(string if isinstance(string, str) else str(string))
+        return value
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        constant = parse(str(node.value))
+        return lambda values: constant
+    raise ValueError('Precise.expr() supports numbers, names, parentheses and the + - * / % operators, got ' + ast.dump(node))
+
+
+@lru_cache(maxsize=256)
+def compile_expression(expression):
+    return compile_node(ast.parse(expression.strip(), mode='eval').body)
+
 
 class Precise:
     def __init__(self, number, decimals=None):
         if decimals is None:
-            modifier = 0
-            number = number.lower()
-            if 'e' in number:
-                number, modifier = number.split('e')
-                modifier = int(modifier)
-            decimal_index = number.find('.')
-            if decimal_index > -1:
-                self.decimals = len(number) - decimal_index - 1
-                self.integer = int(number.replace('.', ''))
-            else:
-                self.decimals = 0
-                self.integer = int(number)
-            self.decimals = self.decimals - modifier
+            self.integer, self.decimals = parse(number)
         else:
             self.integer = number
             self.decimals = decimals
@@ -148,19 +272,15 @@ class Precise:
 
     def reduce(self):
         string = str(self.integer)
-        start = len(string) - 1
-        if start == 0:
-            if string == "0":
-                self.decimals = 0
+        if string == '0':
+            self.decimals = 0
             return self
-        for i in range(start, -1, -1):
-            if string[i] != '0':
-                break
-        difference = start - i
+        digits = string.rstrip('0')
+        difference = len(string) - len(digits)
         if difference == 0:
             return self
         self.decimals -= difference
-        self.integer = int(string[:i + 1])
+        self.integer = int(digits)
 
     def equals(self, other):
         self.reduce()
@@ -169,19 +289,7 @@ class Precise:
 
     def __str__(self):
         self.reduce()
-        sign = '-' if self.integer < 0 else ''
-        integer_array = list(str(abs(self.integer)).rjust(self.decimals, '0'))
-        index = len(integer_array) - self.decimals
-        if index == 0:
-            item = '0.'
-        elif self.decimals < 0:
-            item = '0' * (-self.decimals)
-        elif self.decimals == 0:
-            item = ''
-        else:
-            item = '.'
-        integer_array.insert(index, item)
-        return sign + ''.join(integer_array)
+        return to_string(self.integer, self.decimals)
 
     def __repr__(self):
         return "Precise(" + str(self) + ")"
@@ -189,20 +297,27 @@ class Precise:
     def __float__(self):
         return float(str(self))
 
+    @staticmethod
+    def expr(expression, **values):
+        # evaluates an expression of number strings without formatting the intermediate results
+        # Precise.expr('price * amount - fee', price='0.1', amount='3', fee='0.001') == '0.299'
+        # the result is None if one of the values that are used is None, / divides with 18 decimals
+        # like string_div and the result is also None for a division by zero
+        result = compile_expression(expression)(values)
+        return None if result is None else to_string(result[0], result[1])
+
     @staticmethod
     def string_mul(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).mul(Precise(string2)))
+        return to_string(*mul(parse(string1), parse(string2)))
 
     @staticmethod
     def string_div(string1, string2, precision=18):
         if string1 is None or string2 is None:
             return None
-        string2_precise = Precise(string2)
-        if string2_precise.integer == 0:
-            return None
-        return str(Precise(string1).div(string2_precise, precision))
+        result = div(parse(string1), parse(string2), precision)
+        return None if result is None else to_string(*result)
 
     @staticmethod
     def string_add(string1, string2):
@@ -212,76 +327,82 @@ class Precise:
             return string2
         elif string2 is None:
             return string1
-        return str(Precise(string1).add(Precise(string2)))
+        return to_string(*add(parse(string1), parse(string2)))
 
     @staticmethod
     def string_sub(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).sub(Precise(string2)))
+        return to_string(*sub(parse(string1), parse(string2)))
 
     @staticmethod
     def string_abs(string):
         if string is None:
             return None
-        return str(Precise(string).abs())
+        integer, decimals = parse(string)
+        return to_string(abs(integer), decimals)
 
     @staticmethod
     def string_neg(string):
         if string is None:
             return None
-        return str(Precise(string).neg())
+        integer, decimals = parse(string)
+        return to_string(-integer, decimals)
 
     @staticmethod
     def string_mod(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).mod(Precise(string2)))
+        return to_string(*mod(parse(string1), parse(string2)))
 
     @staticmethod
     def string_equals(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).equals(Precise(string2))
+        return compare(parse(string1), parse(string2)) == 0
 
     @staticmethod
     def string_eq(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).equals(Precise(string2))
+        return compare(parse(string1), parse(string2)) == 0
 
     @staticmethod
     def string_min(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).min(Precise(string2)))
+        a = parse(string1)
+        b = parse(string2)
+        return to_string(*(a if compare(a, b) < 0 else b))
 
     @staticmethod
     def string_max(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).max(Precise(string2)))
+        a = parse(string1)
+        b = parse(string2)
+        return to_string(*(a if compare(a, b) > 0 else b))
 
     @staticmethod
     def string_gt(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).gt(Precise(string2))
+        return compare(parse(string1), parse(string2)) > 0
 
     @staticmethod
     def string_ge(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).ge(Precise(string2))
+        return compare(parse(string1), parse(string2)) >= 0
 
     @staticmethod
     def string_lt(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).lt(Precise(string2))
+        return compare(parse(string1), parse(string2)) < 0
 
     @staticmethod
     def string_le(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).le(Precise(string2))
+        return compare(parse(string1), parse(string2)) <= 0
@@ -32,7 +32,7 @@ class Entry:
         self.config = config
 
         def unbound_method(_self, params={}):
-            return _self.request(self.path, self.api, self.method, params, config=self.config)
+            return _self.call_endpoint(self.path, self.api, self.method, params, self.config)
 
         self.unbound_method = unbound_method
 
@@ -228,6 +228,7 @@ class latoken(Exchange, ImplicitAPI):
                 },
             },
             'options': {
+                'loadCurrenciesBeforeMarkets': True,
                 'defaultType': 'spot',
                 'types': {
                     'wallet': 'ACCOUNT_TYPE_WALLET',
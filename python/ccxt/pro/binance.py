@@ -729,8 +729,7 @@ class binance(ccxt.async_support.binance):
         bookside.store(price, amount)
 
     def handle_deltas(self, bookside, deltas):
-        for i in range(0, len(deltas)):
-            self.handle_delta(bookside, deltas[i])
+        bookside.applyDeltas(deltas)
 
     def handle_order_book_message(self, client: Client, message, orderbook):
         u = self.safe_integer(message, 'u')
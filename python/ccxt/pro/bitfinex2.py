@@ -625,18 +625,28 @@ class bitfinex2(ccxt.async_support.bitfinex2):
         asks = book['asks']
         prec = self.safe_string(subscription, 'prec', 'P0')
         isRaw = (prec == 'R0')
-        idToCheck = 2 if isRaw else 0
-        # pepperoni pizza from bitfinex
-        for i in range(0, depth):
-            bid = self.safe_value(bids, i)
-            ask = self.safe_value(asks, i)
-            if bid is not None:
-                stringArray.append(self.number_to_string(bids[i][idToCheck]))
-                stringArray.append(self.number_to_string(bids[i][1]))
-            if ask is not None:
-                stringArray.append(self.number_to_string(asks[i][idToCheck]))
-                aski1 = asks[i][1]
-                stringArray.append(self.number_to_string(-aski1))
+        if isRaw:
+            # the raw books are checked with the order ids instead of the prices
+            # pepperoni pizza from bitfinex
+            for i in range(0, depth):
+                bid = self.safe_value(bids, i)
+                ask = self.safe_value(asks, i)
+                if bid is not None:
+                    stringArray.append(self.number_to_string(bids[i][2]))
+                    stringArray.append(self.number_to_string(bids[i][1]))
+                if ask is not None:
+                    stringArray.append(self.number_to_string(asks[i][2]))
+                    stringArray.append(Precise.string_neg(self.number_to_string(asks[i][1])))
+        else:
+            bidStrings = bids.topStrings(depth)
+            askStrings = asks.topStrings(depth)
+            for i in range(0, depth):
+                if i < len(bidStrings):
+                    stringArray.append(bidStrings[i][0])
+                    stringArray.append(bidStrings[i][1])
+                if i < len(askStrings):
+                    stringArray.append(askStrings[i][0])
+                    stringArray.append(Precise.string_neg(askStrings[i][1]))
         payload = ':'.join(stringArray)
         localChecksum = self.crc32(payload, True)
         responseChecksum = self.safe_integer(message, 2)
@@ -220,7 +220,7 @@ class independentreserve(ccxt.async_support.independentreserve):
             client.resolve(orderbook, messageHash)
 
     def value_to_checksum(self, value):
-        result = format(value, '.8f')
+        result = format(float(value), '.8f')
         result = result.replace('.', '')
         # remove leading zeros
         result = self.parse_number(result)
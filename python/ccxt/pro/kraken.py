@@ -725,11 +725,13 @@ class kraken(ccxt.async_support.kraken):
                 amountLength = len(amountParts[1]) - 0
                 payloadArray = []
                 if c is not None:
-                    for i in range(0, 10):
-                        formatted = self.format_number(storedAsks[i][0], priceLength) + self.format_number(storedAsks[i][1], amountLength)
+                    askStrings = storedAsks.topStrings(10)
+                    bidStrings = storedBids.topStrings(10)
+                    for i in range(0, len(askStrings)):
+                        formatted = self.format_number(askStrings[i][0], priceLength) + self.format_number(askStrings[i][1], amountLength)
                         payloadArray.append(formatted)
-                    for i in range(0, 10):
-                        formatted = self.format_number(storedBids[i][0], priceLength) + self.format_number(storedBids[i][1], amountLength)
+                    for i in range(0, len(bidStrings)):
+                        formatted = self.format_number(bidStrings[i][0], priceLength) + self.format_number(bidStrings[i][1], amountLength)
                         payloadArray.append(formatted)
                 payload = ''.join(payloadArray)
                 localChecksum = self.crc32(payload, False)
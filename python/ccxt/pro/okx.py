@@ -833,8 +833,7 @@ class okx(ccxt.async_support.okx):
         bookside.store(price, amount)
 
     def handle_deltas(self, bookside, deltas):
-        for i in range(0, len(deltas)):
-            self.handle_delta(bookside, deltas[i])
+        bookside.applyDeltas(deltas)
 
     def handle_order_book_message(self, client: Client, message, orderbook, messageHash):
         #
@@ -863,16 +862,18 @@ class okx(ccxt.async_support.okx):
         symbol = self.safe_symbol(marketId)
         checksum = self.safe_bool(self.options, 'checksum', True)
         if checksum:
-            asksLength = len(storedAsks)
-            bidsLength = len(storedBids)
+            bidStrings = storedBids.topStrings(25)
+            askStrings = storedAsks.topStrings(25)
+            asksLength = len(askStrings)
+            bidsLength = len(bidStrings)
             payloadArray = []
             for i in range(0, 25):
                 if i < bidsLength:
-                    payloadArray.append(self.number_to_string(storedBids[i][0]))
-                    payloadArray.append(self.number_to_string(storedBids[i][1]))
+                    payloadArray.append(bidStrings[i][0])
+                    payloadArray.append(bidStrings[i][1])
                 if i < asksLength:
-                    payloadArray.append(self.number_to_string(storedAsks[i][0]))
-                    payloadArray.append(self.number_to_string(storedAsks[i][1]))
+                    payloadArray.append(askStrings[i][0])
+                    payloadArray.append(askStrings[i][1])
             payload = ':'.join(payloadArray)
             responseChecksum = self.safe_integer(message, 'checksum')
             localChecksum = self.crc32(payload, True)
@@ -0,0 +1,263 @@
+import asyncio
+import os
+import random
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.base.exchange import Exchange as BaseExchange  # noqa: E402
+from ccxt.async_support.base.exchange import Exchange  # noqa: E402
+import ccxt.pro  # noqa: E402
+from ccxt.async_support.base.ws.cache import RingBuffer, KeyedDeque, CandleColumns, ArrayCache, ArrayCacheByTimestamp, ColumnarCacheByTimestamp, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide, columnar_ohlcv  # noqa: E402
+
+
+def test_keyed_deque():
+    print('test_keyed_deque')
+    deque = KeyedDeque(3)
+    assert deque.set('a', 1) is None
+    assert deque.set('b', 2) is None
+    assert deque.set('c', 3) is None
+    # a known key is moved to the end without dropping anything
+    assert deque.set('a', 4) is None
+    assert list(deque) == [2, 3, 4]
+    # the first value is dropped when the deque is full
+    assert deque.set('d', 5) == 2
+    assert list(deque) == [3, 4, 5] and len(deque) == 3
+    assert list(reversed(deque)) == [5, 4, 3]
+    assert 4 in deque and 2 not in deque
+    assert [deque[0], deque[1], deque[2], deque[-1], deque[-3]] == [3, 4, 5, 5, 3]
+    assert deque[0:2] == [3, 4] and deque[1:] == [4, 5] and deque[-2:] == [4, 5] and deque[::2] == [3, 5] and deque[2:1] == []
+    for index in [3, -4]:
+        try:
+            deque[index]
+            assert False, 'an index out of range should raise IndexError'
+        except IndexError:
+            pass
+    deque[1] = 6
+    assert list(deque) == [3, 6, 5]
+    assert deque.set('a', 7) is None, 'the key of a value that was replaced by index is kept'
+    assert list(deque) == [3, 5, 7]
+    del deque[0]
+    assert list(deque) == [5, 7]
+    assert deque.popleft() == 5
+    deque.clear()
+    assert len(deque) == 0
+    # without maxlen nothing is dropped
+    unbounded = KeyedDeque()
+    for i in range(1000):
+        assert unbounded.set(i % 100, i) is None
+    assert len(unbounded) == 100 and unbounded[0] == 900 and unbounded[-1] == 999
+
+
+def test_cache_by_symbol_by_id():
+    print('test_cache_by_symbol_by_id')
+    cache = ArrayCacheBySymbolById(3)
+    for i in range(3):
+        cache.append({'symbol': 'BTC/USDT', 'id': str(i), 'status': 'open'})
+    # an update of a cached order changes it in place and moves it to the end
+    first = cache[0]
+    cache.append({'symbol': 'BTC/USDT', 'id': '0', 'status': 'closed'})
+    assert [order['id'] for order in cache] == ['1', '2', '0']
+    assert cache[-1] is first and first['status'] == 'closed'
+    # the evicted orders are removed from the hashmap too
+    cache.append({'symbol': 'ETH/USDT', 'id': '3', 'status': 'open'})
+    cache.append({'symbol': 'ETH/USDT', 'id': '4', 'status': 'open'})
+    assert [order['id'] for order in cache] == ['0', '3', '4']
+    assert sorted(cache.hashmap['BTC/USDT']) == ['0'] and sorted(cache.hashmap['ETH/USDT']) == ['3', '4']
+    cache.append({'symbol': 'BTC/USDT', 'id': '1', 'status': 'open'})
+    assert [order['id'] for order in cache] == ['3', '4', '1']
+    assert list(cache.hashmap['BTC/USDT']) == ['1']
+    assert len(cache) == 3
+    # a deleted key does not stop the later evictions
+    for i in range(5, 50):
+        cache.append({'symbol': 'LTC/USDT', 'id': str(i), 'status': 'open'})
+        assert len(cache) == 3 and sum(len(orders) for orders in cache.hashmap.values()) == 3
+
+
+def test_cache_by_symbol_by_side():
+    print('test_cache_by_symbol_by_side')
+    cache = ArrayCacheBySymbolBySide(2)
+    cache.append({'symbol': 'BTC/USDT:USDT', 'side': 'long', 'contracts': 1})
+    cache.append({'symbol': 'BTC/USDT:USDT', 'side': 'short', 'contracts': 2})
+    cache.append({'symbol': 'BTC/USDT:USDT', 'side': 'long', 'contracts': 3})
+    assert [(position['side'], position['contracts']) for position in cache] == [('short', 2), ('long', 3)]
+    assert cache.getLimit('BTC/USDT:USDT', None) == 2
+    cache.append({'symbol': 'ETH/USDT:USDT', 'side': 'long', 'contracts': 4})
+    assert [position['symbol'] for position in cache] == ['BTC/USDT:USDT', 'ETH/USDT:USDT']
+    assert list(cache.hashmap['BTC/USDT:USDT']) == ['long']
+    assert cache.getLimit('ETH/USDT:USDT', None) == 1
+
+
+def test_ring_buffer():
+    print('test_ring_buffer')
+    for maxlen in [None, 0, 1, 5, 16, 40]:
+        ring = RingBuffer(maxlen)
+        expected = []
+        for i in range(100):
+            ring.append(i)
+            expected.append(i)
+            if maxlen is not None:
+                expected = expected[max(len(expected) - maxlen, 0):] if maxlen else []
+            if i % 9 == 0 and len(expected) > 2:
+                assert ring.popleft() == expected.pop(0)
+            assert len(ring) == len(expected), maxlen
+            assert list(ring) == expected and list(reversed(ring)) == expected[::-1]
+            for start, stop, step in [(None, None, None), (1, None, None), (-3, None, None), (2, -1, None), (None, None, 2), (3, 1, None), (-50, 50, None)]:
+                assert ring[start:stop:step] == expected[start:stop:step], (maxlen, i, start, stop, step)
+            if expected:
+                assert ring[0] == expected[0] and ring[-1] == expected[-1] and ring[len(expected) // 2] == expected[len(expected) // 2]
+        for index in [len(expected), -len(expected) - 1]:
+            try:
+                ring[index]
+                assert False, 'an index out of range should raise IndexError'
+            except IndexError:
+                pass
+    ring = RingBuffer(4)
+    for i in range(6):
+        ring.append(i)
+    ring[0] = 'a'
+    ring[-1] = 'b'
+    del ring[1]
+    assert list(ring) == ['a', 4, 'b'] and 4 in ring and 3 not in ring
+    ring.append(6)
+    ring.append(7)
+    assert list(ring) == [4, 'b', 6, 7]
+    ring.clear()
+    assert len(ring) == 0 and ring[:] == []
+    try:
+        ring.popleft()
+        assert False, 'popleft from an empty deque should raise IndexError'
+    except IndexError:
+        pass
+
+
+def test_sorted_by():
+    print('test_sorted_by')
+    cache = ArrayCache(10)
+    for i in range(20):
+        cache.append({'symbol': 'BTC/USDT', 'timestamp': 1000 + 10 * (i // 2), 'id': str(i)})
+    assert cache.sorted_by('timestamp') and not cache.sorted_by('id')
+    # the first entry at or after a time
+    assert [cache.bisect(value) for value in [0, 1050, 1051, 1060, 1095, 2000]] == [0, 0, 2, 2, 10, 10]
+    cache.append({'symbol': 'BTC/USDT', 'timestamp': 1000, 'id': 'late'})
+    assert not cache.sorted_by('timestamp'), 'a decreasing timestamp turns the flag off'
+    cache = ArrayCache()
+    cache.append({'symbol': 'BTC/USDT', 'timestamp': None, 'id': '1'})
+    assert not cache.sorted_by('timestamp'), 'a missing timestamp turns the flag off'
+    ohlcv = ArrayCacheByTimestamp(5)
+    for i in range(1, 9):
+        ohlcv.append([60000 * i, 1.0, 2.0, 0.5, 1.5, 10.0])
+    # an update of the last candle keeps the order
+    ohlcv.append([60000 * 8, 1.0, 3.0, 0.5, 1.5, 11.0])
+    assert ohlcv.sorted_by(0) and ohlcv.bisect(60000 * 5) == 1 and len(ohlcv) == 5
+    ohlcv.append([60000 * 2, 1.0, 2.0, 0.5, 1.5, 10.0])
+    assert not ohlcv.sorted_by(0)
+
+
+def test_filter_by_since_limit():
+    print('test_filter_by_since_limit')
+    # the bisected caches return what the transpiled filters return for the same entries in a list
+    exchange = Exchange()
+    base = BaseExchange()
+    rng = random.Random(3)
+    cache = ArrayCache(200)
+    timestamp = 1000
+    for i in range(500):
+        timestamp += rng.randint(0, 3)
+        cache.append({'symbol': rng.choice(['BTC/USDT', 'ETH/USDT']), 'timestamp': timestamp, 'id': str(i)})
+    ohlcv = ArrayCacheByTimestamp(100)
+    for i in range(300):
+        ohlcv.append([1000 + 7 * i, 1.0, 2.0, 0.5, 1.5, float(i)])
+    assert cache.sorted_by('timestamp') and ohlcv.sorted_by(0)
+    entries = list(cache)
+    candles = list(ohlcv)
+    for since in [None, 0, 1, entries[0]['timestamp'], entries[77]['timestamp'], entries[-1]['timestamp'], timestamp + 1]:
+        for limit in [None, 0, 1, 10, 1000]:
+            for tail in [False, True]:
+                assert exchange.filter_by_since_limit(cache, since, limit, 'timestamp', tail) == base.filter_by_since_limit(entries, since, limit, 'timestamp', tail), (since, limit, tail)
+                for symbol in [None, 'BTC/USDT']:
+                    assert exchange.filter_by_symbol_since_limit(cache, symbol, since, limit, tail) == base.filter_by_symbol_since_limit(entries, symbol, since, limit, tail), (symbol, since, limit, tail)
+                candle_since = None if since is None else candles[since % len(candles)][0] + since % 2
+                assert exchange.filter_by_since_limit(ohlcv, candle_since, limit, 0, tail) == base.filter_by_since_limit(candles, candle_since, limit, 0, tail), (candle_since, limit, tail)
+
+
+def test_candle_columns():
+    print('test_candle_columns')
+    # the columnar caches hold and count the same candles as the list caches
+    rng = random.Random(5)
+    for maxlen in [None, 1, 10, 16, 100]:
+        lists = ArrayCacheByTimestamp(maxlen)
+        columns = ColumnarCacheByTimestamp(maxlen)
+        for i in range(400):
+            # mostly updates of the last candle, some older candles and some out of order
+            timestamp = 60000 * (i // 3 + 1) - (60000 * rng.randint(1, 5) if rng.random() < 0.05 else 0)
+            candle = [timestamp] + [float(rng.randint(1, 100)) for j in range(5)]
+            if rng.random() < 0.1:
+                candle[5] = None
+            lists.append(list(candle))
+            columns.append(list(candle))
+            if i % 7 == 0:
+                assert columns.getLimit(None, None) == lists.getLimit(None, None)
+            assert list(columns) == list(lists), (maxlen, i)
+        assert len(columns) == len(lists) and columns[-1] == lists[-1] and columns[0:3] == lists[0:3]
+        assert columns.sorted_by(0) == lists.sorted_by(0)
+    columns = ColumnarCacheByTimestamp(4)
+    for i in range(1, 7):
+        columns.append([60000 * i, 1.0, 2.0, 0.5, 1.5 * i, 10.0])
+    timestamps, opens, highs, lows, closes, volumes = columns.to_arrays()
+    assert list(timestamps) == [180000, 240000, 300000, 360000] and list(closes) == [4.5, 6.0, 7.5, 9.0]
+    assert columns.sorted_by(0) and columns.bisect(240001) == 2 and columns.bisect(0) == 0
+    # a candle that was read does not change with the later updates of that candle
+    last = columns[-1]
+    columns.append([360000, 1.0, 2.0, 0.5, 9.5, 11.0])
+    assert last[4] == 9.0 and columns[-1][4] == 9.5
+    # shorter candles keep their width
+    deque = CandleColumns(3)
+    assert deque.set([1000, 1.0, 2.0]) and not deque.set([1000, 1.5, 2.5])
+    deque.set([2000, 1.0, 2.0, 3.0, 4.0, 5.0])
+    assert deque[:] == [[1000, 1.5, 2.5], [2000, 1.0, 2.0, 3.0, 4.0, 5.0]]
+    deque[0] = [1000, 7.0, 8.0]
+    del deque[1]
+    assert list(deque) == [[1000, 7.0, 8.0]] and [1000, 7.0, 8.0] in deque
+    try:
+        deque[1]
+        assert False, 'an index out of range should raise IndexError'
+    except IndexError:
+        pass
+    deque.clear()
+    assert len(deque) == 0
+    assert CandleColumns(0).set([1000, 1.0]) and len(CandleColumns(0)) == 0
+
+
+async def test_columnar_selection():
+    print('test_columnar_selection')
+    assert type(ArrayCacheByTimestamp(5)) is ArrayCacheByTimestamp
+    token = columnar_ohlcv.set(True)
+    try:
+        cache = ArrayCacheByTimestamp(5)
+        assert type(cache) is ColumnarCacheByTimestamp and cache.max_size == 5 and cache._deque.maxlen == 5
+    finally:
+        columnar_ohlcv.reset(token)
+    kline = {'e': 'kline', 'E': 1700000000000, 's': 'BTCUSDT', 'k': {'t': 1700000000000, 'T': 1700000059999, 's': 'BTCUSDT', 'i': '1m', 'o': '1.0', 'c': '2.0', 'h': '3.0', 'l': '0.5', 'v': '10', 'x': False}}
+    for columnar in [False, True]:
+        # the handlers of the exchanges create the caches as they are transpiled
+        exchange = ccxt.pro.binance({'ohlcvColumnar': columnar})
+        client = exchange.client('wss://stream.binance.com:9443/ws')
+        client.resolve = lambda result, message_hash: None
+        client.on_message_callback(client, kline)
+        cache = exchange.ohlcvs['BTCUSDT']['1m']
+        assert type(cache) is (ColumnarCacheByTimestamp if columnar else ArrayCacheByTimestamp)
+        assert list(cache) == [[1700000000000, 1.0, 3.0, 0.5, 2.0, 10.0]]
+        assert not columnar_ohlcv.get()
+        await exchange.close()
+
+
+test_ring_buffer()
+test_sorted_by()
+test_filter_by_since_limit()
+test_candle_columns()
+asyncio.run(test_columnar_selection())
+test_keyed_deque()
+test_cache_by_symbol_by_id()
+test_cache_by_symbol_by_side()
@@ -0,0 +1,160 @@
+import asyncio
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from aiohttp import WSMessage, WSMsgType  # noqa: E402
+from ccxt.async_support.base.ws.fast_client import FastClient  # noqa: E402
+
+
+class Counter:
+    # counts how many times the futures are settled
+    def __init__(self):
+        self.resolved = 0
+        self.rejected = 0
+
+
+def on_message(client, message):
+    if message['type'] == 'error':
+        client.reject(Exception(message['error']), message['hash'])
+    elif message['type'] == 'throw':
+        raise Exception(message['error'])
+    else:
+        client.resolve(message['data'], message['hash'])
+
+
+def create_client(batch_size, counter):
+    client = FastClient('wss://example.com', on_message, None, None, None, {'asyncio_loop': asyncio.get_running_loop(), 'batchSize': batch_size})
+    future = client.future
+
+    def counted_future(message_hash):
+        result = future(message_hash)
+        if not getattr(result, 'counted', False):
+            result.counted = True
+            resolve = result.resolve
+            reject = result.reject
+
+            def counted_resolve(value=None):
+                counter.resolved += 1
+                resolve(value)
+
+            def counted_reject(error=None):
+                counter.rejected += 1
+                reject(error)
+
+            result.resolve = counted_resolve
+            result.reject = counted_reject
+        return result
+
+    client.future = counted_future
+    return client
+
+
+def feed(client, messages):
+    for message in messages:
+        client.feed_data(WSMessage(WSMsgType.TEXT, message, None), 0)
+
+
+async def drain(client):
+    while client.callback_scheduled:
+        await asyncio.sleep(0)
+
+
+async def test_batch_resolves_once():
+    print('test_batch_resolves_once')
+    counter = Counter()
+    client = create_client(10, counter)
+    future = client.future('ticker')
+    feed(client, ['{"type":"data","hash":"ticker","data":' + str(i) + '}' for i in range(5)])
+    await drain(client)
+    assert future.result() == 4, 'the future resolves with the last result of the batch'
+    assert counter.resolved == 1, f'the future is resolved once, resolved {counter.resolved} times'
+    assert client.resolved == {}, 'the results of the batch are flushed'
+    # the next future only gets the results of the next batch
+    following = client.future('ticker')
+    await asyncio.sleep(0)
+    assert not following.done()
+    feed(client, ['{"type":"data","hash":"ticker","data":5}'])
+    await drain(client)
+    assert following.result() == 5
+
+
+async def test_batch_size():
+    print('test_batch_size')
+    counter = Counter()
+    client = create_client(2, counter)
+    futures = [client.future('trades' + str(i)) for i in range(3)]
+    feed(client, ['{"type":"data","hash":"trades' + str(i) + '","data":' + str(i) + '}' for i in range(3)])
+    await asyncio.sleep(0)
+    # the first batch holds two messages, the third one is handled in the next iteration
+    assert [future.done() for future in futures] == [True, True, False]
+    await drain(client)
+    assert [future.result() for future in futures] == [0, 1, 2]
+    assert counter.resolved == 3
+
+
+async def test_reject_after_resolve():
+    print('test_reject_after_resolve')
+    # without batching the future gets the data and the error is kept for the next future of the message hash
+    for batch_size in [0, 10]:
+        counter = Counter()
+        client = create_client(batch_size, counter)
+        future = client.future('orders')
+        feed(client, [
+            '{"type":"data","hash":"orders","data":1}',
+            '{"type":"error","hash":"orders","error":"failed"}',
+        ])
+        await drain(client)
+        assert future.result() == 1, f'batch size {batch_size}'
+        assert counter.resolved == 1 and counter.rejected == 0
+        following = client.future('orders')
+        assert str(following.exception()) == 'failed', f'batch size {batch_size}'
+
+
+async def test_resolve_after_reject():
+    print('test_resolve_after_reject')
+    # the error reaches the future right away and the deferred result of the batch is dropped
+    for batch_size in [0, 10]:
+        counter = Counter()
+        client = create_client(batch_size, counter)
+        future = client.future('orders')
+        feed(client, [
+            '{"type":"error","hash":"orders","error":"failed"}',
+            '{"type":"data","hash":"orders","data":1}',
+        ])
+        await drain(client)
+        assert str(future.exception()) == 'failed', f'batch size {batch_size}'
+        assert counter.rejected == 1 and counter.resolved == 0
+        assert client.resolved == {}
+
+
+async def test_throw_in_batch():
+    print('test_throw_in_batch')
+    # an exception of the handler rejects all futures after the results handled before it were delivered
+    counter = Counter()
+    client = create_client(10, counter)
+    ticker = client.future('ticker')
+    trades = client.future('trades')
+    feed(client, [
+        '{"type":"data","hash":"ticker","data":1}',
+        '{"type":"throw","error":"broken"}',
+        '{"type":"data","hash":"trades","data":2}',
+    ])
+    await drain(client)
+    assert ticker.result() == 1
+    assert str(trades.exception()) == 'broken'
+    assert counter.resolved == 1 and counter.rejected == 1
+
+
+async def test_fast_client():
+    await test_batch_resolves_once()
+    await test_batch_size()
+    await test_reject_after_resolve()
+    await test_resolve_after_reject()
+    await test_throw_in_batch()
+
+
+if __name__ == '__main__':
+    asyncio.run(test_fast_client())
@@ -526,3 +526,65 @@ reset_book.limit()
 
 
 assert equals(reset_book, order_book_target)
+# --------------------------------------------------------------------------------------------------------------------
+deltas_order_book = OrderBook({}, 3)
+
+
+deltas_bids = deltas_order_book['bids']
+
+
+deltas_bids.apply_deltas([['10.0', '1.5'], ['9.5', '2'], ['9.0', '3'], ['8.5', '4']])
+
+
+assert equals(deltas_bids, [[10.0, 1.5], [9.5, 2], [9.0, 3], [8.5, 4]])
+
+
+deltas_bids.apply_deltas([['9.5', '2.5'], ['9.0', '0'], ['7.0', '0']])  # update, delete, delete a missing level
+
+
+assert equals(deltas_bids, [[10.0, 1.5], [9.5, 2.5], [8.5, 4]])
+
+
+deltas_bids.apply_deltas([[11, 1]])
+
+
+deltas_order_book.limit()
+
+
+assert equals(deltas_bids, [[11, 1], [10.0, 1.5], [9.5, 2.5]])
+
+
+deltas_counted_order_book = CountedOrderBook({})
+
+
+deltas_counted_asks = deltas_counted_order_book['asks']
+
+
+deltas_counted_asks.apply_deltas([['12', '2', '0', '1'], ['11', '1', '0', '2']], 0, 1, 3)
+
+
+assert equals(deltas_counted_asks, [[11, 1, 2], [12, 2, 1]])
+
+
+deltas_counted_asks.apply_deltas([['11', '0', '0', '0'], ['12', '3', '0', '4']], 0, 1, 3)
+
+
+assert equals(deltas_counted_asks, [[12, 3, 4]])
+
+
+deltas_indexed_order_book = IndexedOrderBook({})
+
+
+deltas_indexed_bids = deltas_indexed_order_book['bids']
+
+
+deltas_indexed_bids.apply_deltas([['10', '1', 'a'], ['9', '2', 'b']])
+
+
+assert equals(deltas_indexed_bids, [[10, 1, 'a'], [9, 2, 'b']])
+
+
+deltas_indexed_bids.apply_deltas([[None, '3', 'a'], ['9', '0', 'b']])  # the price is missing when an order is changed
+
+
+assert equals(deltas_indexed_bids, [[10, 3, 'a']])
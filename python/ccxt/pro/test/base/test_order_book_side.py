@@ -0,0 +1,317 @@
+import asyncio
+import os
+import random
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+import ccxt.pro  # noqa: E402
+from ccxt.base.exchange import Exchange  # noqa: E402
+from ccxt.async_support.base.ws.order_book import OrderBook, CountedOrderBook, IndexedOrderBook  # noqa: E402
+
+snapshot = {
+    'bids': [[100.5, 1.0], [100.0, 2.5], [99.0, 0.1], [98.0, 3.0]],
+    'asks': [[101.0, 0.5], [101.5, 1.25], [102.0, 4.0]],
+}
+
+
+def interleave(bids, asks):
+    payload = []
+    for i in range(max(len(bids), len(asks))):
+        if i < len(bids):
+            payload.extend(bids[i])
+        if i < len(asks):
+            payload.extend(asks[i])
+    return ':'.join(payload)
+
+
+def test_top_strings():
+    print('test_top_strings')
+    for compact in [False, True]:
+        orderbook = OrderBook(snapshot, compact=compact)
+        bids = orderbook['bids']
+        top = bids.top_strings(2)
+        assert top == [['100.5', '1'], ['100', '2.5']], compact
+        assert bids.topStrings(2) is top, 'the strings are cached until the first levels change'
+        bids.store(98.0, 1.0)
+        assert bids.top_strings(2) is top, 'a change below the first levels keeps the strings'
+        bids.store(100.0, 3.0)
+        assert bids.top_strings(2) == [['100.5', '1'], ['100', '3']]
+        bids.store(100.7, 0.2)
+        assert bids.top_strings(2) == [['100.7', '0.2'], ['100.5', '1']]
+        bids.store(100.7, 0)
+        assert bids.top_strings(2) == [['100.5', '1'], ['100', '3']]
+        assert bids.top_strings(10) == [['100.5', '1'], ['100', '3'], ['99', '0.1'], ['98', '1']]
+        assert orderbook['asks'].top_strings(0) == []
+
+
+def test_keep_strings():
+    print('test_keep_strings')
+    deltas = [['100.50', '1.000'], ['100.00', '2.500']]
+    for compact in [False, True]:
+        # the numbers are formatted unless the strings of the exchange are kept
+        orderbook = OrderBook({}, compact=compact)
+        orderbook['bids'].top_strings(2)
+        orderbook['bids'].apply_deltas(deltas)
+        assert orderbook['bids'].top_strings(2) == [['100.5', '1'], ['100', '2.5']], compact
+        orderbook = OrderBook({}, compact=compact).keep_strings()
+        orderbook['bids'].apply_deltas(deltas)
+        assert orderbook['bids'].top_strings(2) == [['100.50', '1.000'], ['100.00', '2.500']], compact
+        orderbook['bids'].apply_deltas([['100.00', '3.100']])
+        assert orderbook['bids'].top_strings(2) == [['100.50', '1.000'], ['100.00', '3.100']], compact
+        # a level stored from numbers is formatted
+        orderbook['bids'].store(100.0, 3.2)
+        assert orderbook['bids'].top_strings(2) == [['100.50', '1.000'], ['100', '3.2']], compact
+    orderbook = CountedOrderBook({}).keep_strings()
+    orderbook['asks'].apply_deltas([['5.10', '1.0', '2'], ['5.20', '2.0', '1']])
+    orderbook['asks'].apply_deltas([['5.10', '1.5', '3']])
+    assert orderbook['asks'].top_strings(2) == [['5.10', '1.5'], ['5.20', '2.0']]
+    orderbook['asks'].apply_deltas([['5.10', '1.5', '0']])
+    assert orderbook['asks'].top_strings(2) == [['5.20', '2.0']]
+    # several orders can have the same price, their levels are formatted
+    orderbook = IndexedOrderBook({}).keep_strings()
+    orderbook['bids'].apply_deltas([['7.50', '1.0', 'a'], ['7.50', '2.0', 'b']])
+    assert orderbook['bids'].top_strings(2) == [['7.5', '1'], ['7.5', '2']]
+
+
+def test_checksum():
+    print('test_checksum')
+    for compact in [False, True]:
+        calls = []
+
+        def payload(bids, asks):
+            calls.append(1)
+            return interleave(bids, asks)
+
+        orderbook = OrderBook(snapshot, compact=compact)
+        expected = Exchange.crc32('100.5:1:101:0.5:100:2.5:101.5:1.25', True)
+        assert orderbook.checksum(2, payload) == expected, compact
+        assert orderbook.checksum(2, payload) == expected
+        assert len(calls) == 1, 'the checksum is cached until the first levels change'
+        orderbook['bids'].store(98.0, 1.0)
+        orderbook['asks'].store(102.0, 1.0)
+        assert orderbook.checksum(2, payload) == expected
+        assert len(calls) == 1
+        orderbook['asks'].store(101.0, 0.75)
+        assert orderbook.checksum(2, payload) == Exchange.crc32('100.5:1:101:0.75:100:2.5:101.5:1.25', True)
+        assert len(calls) == 2
+        assert orderbook.checksum(2, payload, False) == Exchange.crc32('100.5:1:101:0.75:100:2.5:101.5:1.25', False)
+        assert len(calls) == 3, 'the checksum is computed again for other arguments'
+        orderbook.reset({'bids': [[1.0, 1.0]], 'asks': []})
+        assert orderbook.checksum(2, payload) == Exchange.crc32('1:1', True)
+
+
+def test_to_arrays():
+    print('test_to_arrays')
+    for compact in [False, True]:
+        orderbook = OrderBook(snapshot, compact=compact)
+        bid_prices, bid_amounts, ask_prices, ask_amounts = orderbook.to_arrays()
+        assert list(bid_prices) == [100.5, 100.0, 99.0, 98.0], compact
+        assert list(bid_amounts) == [1.0, 2.5, 0.1, 3.0]
+        assert list(ask_prices) == [101.0, 101.5, 102.0]
+        assert list(ask_amounts) == [0.5, 1.25, 4.0]
+        bid_prices, bid_amounts, ask_prices, ask_amounts = orderbook.to_arrays(2, cumulative=True)
+        assert list(bid_prices) == [100.5, 100.0]
+        assert list(bid_amounts) == [1.0, 3.5]
+        assert list(ask_amounts) == [0.5, 1.75]
+        assert len(orderbook.to_arrays(0)[0]) == 0
+    # the counted, indexed and string levels are exported as floats too
+    for compact in [False, True]:
+        counted = CountedOrderBook({'bids': [[10.0, 1.0, 2], [9.0, 2.0, 1]]}, compact=compact)
+        assert [list(values) for values in counted.to_arrays(5)] == [[10.0, 9.0], [1.0, 2.0], [], []], compact
+    indexed = IndexedOrderBook({'asks': [[5.0, 1.0, 'a'], [5.0, 0.5, 'b'], [6.0, 2.0, 'c']]})
+    assert [list(values) for values in indexed.to_arrays(None, True)[2:]] == [[5.0, 5.0, 6.0], [1.0, 1.5, 3.5]]
+    strings = OrderBook({}, strings=True)
+    strings['bids'].apply_deltas([['100.10', '1.5'], ['99.9', '2']])
+    assert [list(values) for values in strings.to_arrays()[0:2]] == [[100.1, 99.9], [1.5, 2.0]]
+    arrays = strings.to_arrays()
+    assert len(arrays) == 4
+    for values in arrays:
+        # numpy arrays or memoryviews of doubles
+        assert getattr(values, 'dtype', None) == 'float64' or values.format == 'd'
+
+
+def test_get_buffers():
+    print('test_get_buffers')
+    orderbook = OrderBook({})
+    prices, amounts = orderbook.get_buffers('bids', 3)
+    assert len(prices[0]) == 16 and len(amounts[0]) == 16, 'the buffers have room for 16 levels at least'
+    assert orderbook.get_buffers('bids', 16)[0] is prices, 'the buffers are reused while they are large enough'
+    assert orderbook.get_buffers('asks', 3)[0] is not prices, 'each side has its own buffers'
+    grown, _ = orderbook.get_buffers('bids', 17)
+    assert grown is not prices and len(grown[0]) == 32, 'the buffers double when they are too small'
+    assert len(orderbook.get_buffers('bids', 100)[0][0]) == 100
+    # the arrays are overwritten by the next call
+    orderbook = OrderBook(snapshot)
+    first = orderbook.to_arrays()[0]
+    orderbook['bids'].store(100.5, 0)
+    orderbook.to_arrays()
+    assert first[0] == 100.0
+
+
+def numbers(side):
+    return [[float(level[0]), float(level[1])] + list(level[2:]) for level in side]
+
+
+def test_string_sides():
+    print('test_string_sides')
+    orderbook = OrderBook({}, strings=True)
+    bids = orderbook['bids']
+    bids.apply_deltas([['100.10', '1.500'], ['99.9', '2'], ['100.2', '0.1']])
+    # the levels are sorted by the value of the price and keep the strings
+    assert list(bids) == [['100.2', '0.1'], ['100.10', '1.500'], ['99.9', '2']]
+    bids.apply_deltas([['100.1', '1.6'], ['99.90', '0.000']])
+    assert list(bids) == [['100.2', '0.1'], ['100.10', '1.6']], 'the first price string of a level is kept'
+    # numbers are stored as strings
+    bids.store(101.0, 0.25)
+    bids.storeArray([100.2, 0])
+    assert list(bids) == [['101', '0.25'], ['100.10', '1.6']]
+    orderbook.keep_strings()
+    assert bids.top_strings(1) == [['101', '0.25']]
+    assert orderbook.checksum(2, interleave) == Exchange.crc32('101:0.25:100.10:1.6', True)
+    counted = CountedOrderBook({}, strings=True)
+    counted['asks'].apply_deltas([['5.10', '1.0', '2'], ['5.05', '2.0', '1']])
+    counted['asks'].storeArray([5.05, 3.0, 4])
+    assert list(counted['asks']) == [['5.05', '3', 4], ['5.10', '1.0', 2]]
+    counted['asks'].apply_deltas([['5.1', '1.0', '0']])
+    assert list(counted['asks']) == [['5.05', '3', 4]]
+    indexed = IndexedOrderBook({}, strings=True)
+    indexed['bids'].apply_deltas([['7.50', '1.0', 'b'], ['7.50', '2.0', 'a'], ['8', '1', 'c']])
+    assert list(indexed['bids']) == [['8', '1', 'c'], ['7.50', '2.0', 'a'], ['7.50', '1.0', 'b']]
+    # an order without a price keeps its price
+    indexed['bids'].storeArray([None, 3.0, 'a'])
+    indexed['bids'].apply_deltas([['9', '0', 'c']])
+    assert list(indexed['bids']) == [['7.50', '3', 'a'], ['7.50', '1.0', 'b']]
+
+
+def test_string_replay():
+    print('test_string_replay')
+    # the string books hold the same levels as the numeric books
+    rng = random.Random(7)
+    for book in [OrderBook, CountedOrderBook, IndexedOrderBook]:
+        numeric = book({}, 50)
+        strings = book({}, 50, True)
+        for i in range(2000):
+            deltas = []
+            for j in range(rng.randint(1, 5)):
+                price = str(rng.randint(900, 1100) / 10)
+                amount = '0' if rng.random() < 0.3 else str(rng.randint(1, 1000) / 100)
+                deltas.append([price, amount, str(rng.randint(0, 3)) if book is CountedOrderBook else 'id' + str(rng.randint(0, 40))])
+            side = 'bids' if i % 2 else 'asks'
+            numeric[side].apply_deltas(deltas)
+            strings[side].apply_deltas(deltas)
+            numeric.limit()
+            strings.limit()
+            assert numbers(strings[side]) == numbers(numeric[side]), (book.__name__, i)
+        for side in ['bids', 'asks']:
+            assert strings[side].top_strings(10) == [[level[0], level[1]] for level in strings[side][:10]]
+            assert [[float(value) for value in level] for level in strings[side].top_strings(10)] == [level[0:2] for level in numeric[side][:10]]
+
+
+async def test_exchange_strings():
+    print('test_exchange_strings')
+    exchange = ccxt.pro.bitfinex2({'orderBookStrings': True})
+    for orderbook in [exchange.order_book(), exchange.counted_order_book(), exchange.indexed_order_book()]:
+        assert type(orderbook['bids']).__name__.startswith('String'), type(orderbook).__name__
+    # the raw book checksums take the order ids and the amount strings
+    book = exchange.indexed_order_book({})
+    book['bids'].apply_deltas([['100.5', '1.5', 11]])
+    book['asks'].apply_deltas([['101', '2.25', 12]])
+    exchange.orderbooks['BTC/USD'] = book
+    exchange.safe_symbol = lambda market_id, *args: 'BTC/USD'
+
+    class Client:
+        subscriptions = {}
+        rejected = []
+
+        def reject(self, error, message_hash):
+            self.rejected.append(error)
+
+    client = Client()
+    exchange.handle_checksum(client, [1, 'cs', Exchange.crc32('11:1.5:12:-2.25', True)], {'symbol': 'tBTCUSD', 'prec': 'R0'})
+    assert client.rejected == [] and 'BTC/USD' in exchange.orderbooks
+    independentreserve = ccxt.pro.independentreserve()
+    assert independentreserve.value_to_checksum('0.01500000') == independentreserve.value_to_checksum(0.015) == '1500000'
+    await exchange.close()
+    await independentreserve.close()
+
+
+def test_compact_sides():
+    print('test_compact_sides')
+    # the compact books hold the same levels as the list books
+    rng = random.Random(11)
+    for book in [OrderBook, CountedOrderBook]:
+        lists = book({}, 30)
+        compact = book({}, 30, compact=True)
+        for i in range(3000):
+            deltas = [[str(rng.randint(900, 1100) / 10), '0' if rng.random() < 0.3 else str(rng.randint(1, 1000) / 100), str(rng.randint(0, 3))] for j in range(rng.randint(1, 5))]
+            side = 'bids' if i % 2 else 'asks'
+            if i % 7:
+                lists[side].apply_deltas(deltas)
+                compact[side].applyDeltas(deltas)
+            else:
+                for delta in deltas:
+                    level = [float(delta[0]), float(delta[1]), int(delta[2])][0:3 if book is CountedOrderBook else 2]
+                    lists[side].storeArray(list(level))
+                    compact[side].storeArray(list(level))
+            if i % 50 == 0:
+                lists.limit()
+                compact.limit()
+            assert compact[side] == list(lists[side]), (book.__name__, i)
+            assert compact[side].top_strings(5) == lists[side].top_strings(5)
+        for side in ['bids', 'asks']:
+            assert len(compact[side]) == len(lists[side])
+            assert [list(level) for level in compact[side][1:4]] == lists[side][1:4] and list(compact[side][-1]) == lists[side][-1]
+            assert [list(level) for level in compact[side]] == list(lists[side])
+        arrays = lists.to_arrays(10, True)
+        assert all(list(a) == list(b) for a, b in zip(compact.to_arrays(10, True), arrays))
+        compact['bids'].clear()
+        assert len(compact['bids']) == 0 and compact['bids'].top_strings(5) == []
+
+
+def test_compact_keep_strings():
+    print('test_compact_keep_strings')
+    orderbook = CountedOrderBook({}, compact=True).keep_strings()
+    asks = orderbook['asks']
+    asks.apply_deltas([['5.10', '1.0', '2'], ['5.20', '2.0', '1']])
+    assert asks.top_strings(2) == [['5.10', '1.0'], ['5.20', '2.0']]
+    # the kept deltas are dropped when the deltas are read with other indexes
+    asks.apply_deltas([['x', '3', '5.30', '3.0']], 2, 3, 1)
+    assert asks.top_strings(3) == [['5.1', '1'], ['5.2', '2'], ['5.30', '3.0']]
+    asks.apply_deltas([['x', '1', '5.10', '1.50']], 2, 3, 1)
+    assert asks.top_strings(3) == [['5.10', '1.50'], ['5.2', '2'], ['5.30', '3.0']]
+    asks.limit()
+    orderbook = OrderBook({}, 2, compact=True).keep_strings()
+    orderbook['bids'].apply_deltas([['1.0', '1'], ['2.0', '1'], ['3.0', '1']])
+    orderbook.limit()
+    assert orderbook['bids'].top_strings(5) == [['3.0', '1'], ['2.0', '1']]
+    orderbook['bids'].apply_deltas([['3.00', '0'], ['1.50', '2']])
+    assert orderbook['bids'].top_strings(5) == [['2.0', '1'], ['1.50', '2']]
+
+
+def test_compact_read_only():
+    print('test_compact_read_only')
+    # the levels of the compact sides can not be changed
+    for book, levels in [(OrderBook, [[10.0, 1.0], [9.0, 2.0]]), (CountedOrderBook, [[10.0, 1.0, 2], [9.0, 2.0, 1]])]:
+        bids = book({'bids': levels}, compact=True)['bids']
+        for level in [bids[0], bids[0:1][0], next(iter(bids))]:
+            try:
+                level[1] = 5.0
+                assert False, 'a level should not be writable'
+            except TypeError:
+                pass
+        assert bids == levels
+
+
+test_top_strings()
+test_keep_strings()
+test_checksum()
+test_to_arrays()
+test_get_buffers()
+test_string_sides()
+test_string_replay()
+test_compact_sides()
+test_compact_keep_strings()
+test_compact_read_only()
+asyncio.run(test_exchange_strings())
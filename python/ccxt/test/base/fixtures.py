@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+
+# the markets passed to set_markets by the tests of the base exchange
+
+
+def market(symbol='BTC/USDT', id=None, price=2, amount=4, precision=None, limits=None, **extra):
+    # a spot market, or a linear swap for the symbols with a settle currency
+    base, quote = symbol.split(':')[0].split('/')
+    spot = ':' not in symbol
+    result = {
+        'id': id or base + quote,
+        'symbol': symbol,
+        'base': base,
+        'quote': quote,
+        'baseId': base,
+        'quoteId': quote,
+        'spot': spot,
+        'swap': not spot,
+        'type': 'spot' if spot else 'swap',
+        'linear': None if spot else True,
+        'inverse': None if spot else False,
+        'precision': precision or {'price': price, 'amount': amount},
+        'limits': limits or {},
+    }
+    result.update(extra)
+    return result
@@ -0,0 +1,174 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import time  # noqa: E402
+from aiohttp import web  # noqa: E402
+import ccxt.async_support as ccxt  # noqa: E402
+
+# the requests the local server received by method
+received = {'GET': 0, 'HEAD': 0}
+delays = {'GET': 0, 'HEAD': 0}
+
+
+async def handle(request):
+    received[request.method] += 1
+    await asyncio.sleep(delays[request.method])
+    return web.json_response({'path': request.path})
+
+
+async def serve():
+    app = web.Application()
+    app.router.add_route('*', '/{tail:.*}', handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, 'http://127.0.0.1:' + str(port) + '/'
+
+
+def local(url, config={}):
+    return ccxt.Exchange(ccxt.Exchange.extend({'id': 'local', 'urls': {'api': {'public': url, 'private': url + 'private'}}}, config))
+
+
+def reset():
+    for method in received:
+        received[method] = 0
+        delays[method] = 0
+
+
+async def test_connector():
+    # the aiohttp_connector settings reach the connector of the session
+    exchange = ccxt.Exchange({'id': 'local', 'aiohttp_connector': {'limit': 3, 'limit_per_host': 2, 'ttl_dns_cache': 60, 'keepalive_timeout': 30}})
+    stats = exchange.connection_pool_stats()
+    assert stats['limit'] is None and stats['limitPerHost'] is None and stats['requests'] == 0
+    exchange.open()
+    connector = exchange.session.connector
+    assert connector.limit == 3 and connector.limit_per_host == 2
+    assert connector._cached_hosts._ttl == 60 and connector._keepalive_timeout == 30
+    stats = exchange.connection_pool_stats()
+    assert stats['limit'] == 3 and stats['limitPerHost'] == 2
+    await exchange.close()
+    default = ccxt.Exchange({'id': 'local'})
+    default.open()
+    assert default.session.connector.limit == 100 and default.prewarming is None
+    await default.close()
+
+
+async def test_stats(url):
+    # one connection for the queued requests
+    reset()
+    delays['GET'] = 0.05
+    exchange = local(url, {'aiohttp_connector': {'limit': 1}})
+    results = await asyncio.gather(*[exchange.fetch(url + 'depth?symbol=' + str(i)) for i in range(5)])
+    assert [result['path'] for result in results] == ['/depth'] * 5
+    stats = exchange.connection_pool_stats()
+    assert stats['requests'] == 5 and stats['active'] == 0
+    assert stats['created'] == 1 and stats['reused'] == 4
+    assert stats['queued'] == 4 and stats['waiting'] == 0
+    # the last request waits for the four before it
+    assert stats['queuedTime'] >= 4 * 40, stats['queuedTime']
+    assert stats['limit'] == 1
+    # the counters are kept by the exchange
+    exchange.connection_counters['requests'] = 0
+    assert exchange.connection_pool_stats()['requests'] == 0
+    await exchange.close()
+    # a failed request is not active anymore
+    failing = local(url)
+    try:
+        await failing.fetch('http://127.0.0.1:1/')
+        assert False, 'the request should fail'
+    except ccxt.NetworkError:
+        pass
+    stats = failing.connection_pool_stats()
+    assert stats['requests'] == 1 and stats['active'] == 0 and stats['created'] == 0
+    await failing.close()
+
+
+async def test_prewarm(url):
+    reset()
+    exchange = local(url, {'aiohttp_prewarm': 2})
+    assert exchange.api_origins() == [url]
+    exchange.open()
+    prewarming = exchange.prewarming
+    assert prewarming is not None
+    assert await prewarming == 2
+    assert exchange.prewarming is None
+    assert received['HEAD'] == 2
+    stats = exchange.connection_pool_stats()
+    assert stats['created'] == 2 and stats['requests'] == 2
+    # the next requests use the open connections
+    await asyncio.gather(exchange.fetch(url + 'time'), exchange.fetch(url + 'time'))
+    stats = exchange.connection_pool_stats()
+    assert stats['created'] == 2 and stats['reused'] == 2
+    await exchange.close()
+    # the hosts behind a proxy are not prewarmed
+    reset()
+    proxied = local(url, {'aiohttp_prewarm': 1, 'httpProxy': 'http://127.0.0.1:1'})
+    proxied.open()
+    assert await proxied.prewarming == 0
+    assert received['HEAD'] == 0
+    await proxied.close()
+    # the failed connections are not counted
+    unreachable = local('http://127.0.0.1:1/', {'aiohttp_prewarm': 1})
+    unreachable.open()
+    assert await unreachable.prewarming == 0
+    await unreachable.close()
+
+
+async def test_prewarm_close(url):
+    # close cancels the connections that are still opening
+    reset()
+    delays['HEAD'] = 10
+    exchange = local(url, {'aiohttp_prewarm': 3})
+    exchange.open()
+    prewarming = exchange.prewarming
+    while received['HEAD'] < 3:
+        await asyncio.sleep(0.01)
+    start = time.monotonic()
+    await exchange.close()
+    assert time.monotonic() - start < 5
+    assert exchange.prewarming is None and exchange.session is None
+    await asyncio.wait([prewarming])
+    assert prewarming.cancelled()
+
+
+def test_api_origins():
+    exchange = ccxt.Exchange({
+        'id': 'local',
+        'hostname': 'example.com',
+        'urls': {
+            'api': {
+                'public': 'https://api.{hostname}/v1',
+                'private': 'https://api.{hostname}/v2',
+                'futures': {
+                    'public': 'https://futures.example.com:8443/api',
+                    'ws': 'wss://stream.example.com',
+                },
+                'sandbox': 'https://{region}.example.com',
+            },
+        },
+    })
+    assert exchange.api_origins() == ['https://api.example.com/', 'https://futures.example.com:8443/']
+
+
+async def main():
+    runner, url = await serve()
+    try:
+        await test_connector()
+        await test_stats(url)
+        await test_prewarm(url)
+        await test_prewarm_close(url)
+    finally:
+        await runner.cleanup()
+
+
+test_api_origins()
+asyncio.run(main())
+print('connection pool succeeded')
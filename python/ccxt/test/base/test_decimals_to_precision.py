@@ -0,0 +1,133 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import random  # noqa: E402
+import ccxt  # noqa: E402
+from ccxt.base.errors import InvalidOrder  # noqa: E402
+from ccxt.base.decimal_to_precision import decimal_to_precision, decimals_to_precision, precision_plan  # noqa: E402
+from ccxt.base.decimal_to_precision import TRUNCATE, ROUND, DECIMAL_PLACES, SIGNIFICANT_DIGITS, TICK_SIZE, NO_PADDING, PAD_WITH_ZERO  # noqa: E402
+from ccxt.test.base.fixtures import market  # noqa: E402
+
+values = [
+    0, 1, -1, 0.5, -0.5, 1.5, 2.5, 0.000001, 1e-10, -1e-10, 123456.789, -123456.789, 1e20, 7.8e-7,
+    '0', '0.00', '-0', '1.23456789', '-1.23456789', '0.0000001', '64000.10', '1e-8', '99999.999999', '0.49999999',
+]
+
+precisions = {
+    DECIMAL_PLACES: [0, 1, 2, 8, 18, -1, -2],
+    SIGNIFICANT_DIGITS: [0, 1, 3, 8],
+    TICK_SIZE: [0.01, 0.5, 1, 10, 0.00001, '0.001', '0.25', 5],
+}
+
+
+def random_value():
+    value = round(random.uniform(-1000, 1000), random.randint(0, 12))
+    return value if random.random() < 0.5 else str(value)
+
+
+def scalar(value, *arguments):
+    try:
+        return decimal_to_precision(value, *arguments)
+    except Exception as e:
+        return type(e)
+
+
+def batch(values, *arguments):
+    try:
+        return decimals_to_precision(values, *arguments)
+    except Exception as e:
+        return type(e)
+
+
+def test_same_results():
+    # every value of the batch is rounded like decimal_to_precision, exceptions included
+    random.seed(3)
+    for counting_mode in precisions:
+        for precision in precisions[counting_mode]:
+            for rounding_mode in [TRUNCATE, ROUND]:
+                for padding_mode in [NO_PADDING, PAD_WITH_ZERO]:
+                    arguments = (rounding_mode, precision, counting_mode, padding_mode)
+                    for value in values + [random_value() for i in range(50)]:
+                        expected = scalar(value, *arguments)
+                        assert batch([value], *arguments) == ([expected] if isinstance(expected, str) else expected), (value, arguments)
+                        if isinstance(expected, str):
+                            assert precision_plan(*arguments).one(value) == expected, (value, arguments)
+                    expected = [scalar(value, *arguments) for value in values]
+                    if all(isinstance(result, str) for result in expected):
+                        assert batch(values, *arguments) == expected, arguments
+
+
+def test_iterables():
+    # any iterable of values is accepted
+    expected = [decimal_to_precision(value, ROUND, 2) for value in values]
+    assert decimals_to_precision(tuple(values), ROUND, 2) == expected
+    assert decimals_to_precision((value for value in values), ROUND, 2) == expected
+    assert decimals_to_precision([], ROUND, 2) == []
+
+
+def test_errors():
+    # the same exceptions as the scalar path
+    for arguments in [(ROUND, None), (5, 2), (ROUND, 2, 1), (ROUND, 2, DECIMAL_PLACES, 0), (ROUND, 0.5, DECIMAL_PLACES)]:
+        assert batch([1], *arguments) is AssertionError, arguments
+        assert scalar(1, *arguments) is AssertionError, arguments
+    assert batch([1e-30], TRUNCATE, -1, TICK_SIZE) is ValueError
+    assert batch(['abc'], ROUND, 2) == scalar('abc', ROUND, 2)
+    assert batch(['abc'], ROUND, 0.01, TICK_SIZE) == scalar('abc', ROUND, 0.01, TICK_SIZE)
+
+
+def test_plans():
+    # the plans are kept by the arguments
+    precision_plan.cache_clear()
+    for i in range(5):
+        decimals_to_precision([1.2345], ROUND, 2)
+        decimals_to_precision([1.2345], ROUND, 0.01, TICK_SIZE)
+    info = precision_plan.cache_info()
+    assert info.misses == 2 and info.hits == 8
+    # 2 and 2.0 are different ticks
+    assert precision_plan(ROUND, 2, TICK_SIZE) is not precision_plan(ROUND, 2.0, TICK_SIZE)
+
+
+def test_exchange():
+    # prices_to_precision and amounts_to_precision are the batches of price_to_precision and amount_to_precision
+    random.seed(4)
+    for precision_mode, precision in [(DECIMAL_PLACES, {'price': 2, 'amount': 5}), (TICK_SIZE, {'price': 0.5, 'amount': 0.001}), (SIGNIFICANT_DIGITS, {'price': 5, 'amount': 4})]:
+        exchange = ccxt.Exchange({'id': 'test', 'precisionMode': precision_mode})
+        exchange.set_markets([market(precision=precision)])
+        prices = [abs(float(random_value())) + 1 for i in range(200)]
+        assert exchange.prices_to_precision('BTC/USDT', prices) == [exchange.price_to_precision('BTC/USDT', price) for price in prices]
+        assert exchange.amounts_to_precision('BTC/USDT', prices) == [exchange.amount_to_precision('BTC/USDT', amount) for amount in prices]
+        tiny = 0 if precision_mode == SIGNIFICANT_DIGITS else 0.0000001
+        for method in [exchange.prices_to_precision, exchange.amounts_to_precision]:
+            try:
+                method('BTC/USDT', [100, tiny])
+                assert False, 'rounding a value to zero should raise InvalidOrder'
+            except InvalidOrder as e:
+                assert 'must be greater than minimum' in str(e)
+
+
+def test_overridden():
+    # the exchanges that override the scalar methods keep their rounding
+    class Exchange(ccxt.Exchange):
+        def price_to_precision(self, symbol, price):
+            return 'price ' + str(price)
+
+        def amount_to_precision(self, symbol, amount):
+            return 'amount ' + str(amount)
+
+    exchange = Exchange({'id': 'test'})
+    assert exchange.prices_to_precision('BTC/USDT', [1, 2]) == ['price 1', 'price 2']
+    assert exchange.amounts_to_precision('BTC/USDT', [3]) == ['amount 3']
+
+
+test_same_results()
+test_iterables()
+test_errors()
+test_plans()
+test_exchange()
+test_overridden()
+print('decimals_to_precision succeeded')
@@ -0,0 +1,83 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import copy  # noqa: E402
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+
+
+def mutate(exchange):
+    # changes the nested dicts the instance got from describe()
+    exchange.options['defaultType'] = 'mutated'
+    exchange.options['recvWindow'] = -1
+    exchange.options.setdefault('networks', {})['MUTATED'] = 'mutated'
+    exchange.fees['trading']['taker'] = 0.5
+    exchange.fees['trading']['mutated'] = True
+    exchange.urls['api'] = 'https://mutated.example.com'
+    exchange.has['fetchTicker'] = 'mutated'
+    exchange.timeframes['mutated'] = 'mutated'
+    exchange.precision['mutated'] = 1
+
+
+def state(exchange):
+    return copy.deepcopy({name: getattr(exchange, name) for name in ['options', 'fees', 'urls', 'has', 'timeframes', 'precision', 'api']})
+
+
+def test_isolation():
+    # the instances of a class share the cached describe() but not the dicts made from it
+    for module in [ccxt, ccxt.async_support]:
+        for id in ['binance', 'kraken']:
+            first = getattr(module, id)()
+            second = getattr(module, id)()
+            expected = state(second)
+            mutate(first)
+            assert state(second) == expected, (module.__name__, id)
+            third = getattr(module, id)()
+            assert state(third) == expected, (module.__name__, id)
+            assert first.options['defaultType'] == 'mutated' and first.fees['trading']['taker'] == 0.5
+            assert third.fees is not first.fees and third.options is not first.options
+
+
+def test_config():
+    # the config of an instance is merged into its own copy of the defaults
+    first = ccxt.binance({'options': {'defaultType': 'future'}, 'fees': {'trading': {'taker': 0.01}}, 'rateLimit': 100})
+    second = ccxt.binance()
+    assert first.options['defaultType'] == 'future' and first.fees['trading']['taker'] == 0.01 and first.rateLimit == 100
+    assert second.options['defaultType'] == 'spot' and second.fees['trading']['taker'] != 0.01 and second.rateLimit == 50
+    # the options that are not in the config are still the defaults
+    assert first.options['recvWindow'] == second.options['recvWindow']
+
+
+def test_cache():
+    # describe() is called and the methods are renamed once per class
+    class Exchange(ccxt.Exchange):
+        calls = 0
+
+        def describe(self):
+            Exchange.calls += 1
+            return self.deep_extend(super(Exchange, self).describe(), {'id': 'test', 'options': {'nested': {'value': 1}}})
+
+        def fetch_something_new(self):
+            return 'new'
+
+    first = Exchange()
+    second = Exchange()
+    assert Exchange.calls == 1
+    assert first.describe_defaults() is second.describe_defaults()
+    assert first.camelcase_names() is second.camelcase_names()
+    assert second.fetchSomethingNew() == 'new'
+    first.options['nested']['value'] = 2
+    assert second.options['nested']['value'] == 1 and Exchange().options['nested']['value'] == 1
+    # the classes of the same exchange do not share the cache
+    assert ccxt.binance().describe_defaults() is not ccxt.async_support.binance().describe_defaults()
+
+
+test_isolation()
+test_config()
+test_cache()
+print('describe cache succeeded')
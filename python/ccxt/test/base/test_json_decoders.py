@@ -0,0 +1,77 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import json  # noqa: E402
+import ccxt  # noqa: E402
+from ccxt.base.errors import NotSupported  # noqa: E402
+from ccxt.base.json_decoders import JsonDecoder, get_json_decoder  # noqa: E402
+
+documents = [
+    '{"symbol":"BTC/USDT","price":"64000.10","amount":0.00012,"id":1234567890123,"active":true,"info":null}',
+    '[[1700000000000,"1.5","2"],[1700000060000,"1.6","3"]]',
+    '{"text":"\\u00e9\\u4e2d","nested":{"list":[1,2.5,-3e-8,{"a":[]}]}}',
+    '{"big":123456789012345678901234567890}',
+    '[]',
+]
+
+# the json module accepts these, the other decoders fall back to it
+lenient = [
+    '{"value":NaN}',
+    '{"value":Infinity}',
+]
+
+installed = []
+for name in ['json', 'orjson', 'msgspec']:
+    try:
+        installed.append(get_json_decoder(name))
+    except NotSupported:
+        print(f'{name} is not installed')
+
+
+def test_loads():
+    for decoder in installed:
+        for document in documents + lenient:
+            expected = json.loads(document)
+            for data in [document, document.encode()]:
+                result = decoder.loads(data)
+                if document == documents[3] and decoder.name == 'orjson':
+                    # orjson decodes integers that do not fit into 64 bits as floats
+                    assert result == {'big': float(expected['big'])}, decoder.name
+                else:
+                    assert json.dumps(result) == json.dumps(expected), (decoder.name, document)
+
+
+def test_get_json_decoder():
+    assert isinstance(get_json_decoder(), JsonDecoder)
+    assert get_json_decoder().name == 'json'
+    names = [decoder.name for decoder in installed]
+    # auto picks the fastest installed decoder
+    assert get_json_decoder('auto').name == ('orjson' if 'orjson' in names else 'msgspec' if 'msgspec' in names else 'json')
+    try:
+        get_json_decoder('simdjson')
+        assert False, 'an unknown decoder should raise NotSupported'
+    except NotSupported as e:
+        assert 'jsonDecoder must be one of' in str(e)
+
+
+def test_exchange():
+    # the responses keep the numbers as they are written with quoteJsonNumbers, whatever the decoder
+    for decoder in installed:
+        exchange = ccxt.Exchange({'jsonDecoder': decoder.name})
+        assert exchange.json_decoder.name == decoder.name
+        quoted = exchange.on_json_response(documents[0])
+        assert quoted['price'] == '64000.10' and quoted['amount'] == '0.00012' and quoted['id'] == '1234567890123'
+        exchange.quoteJsonNumbers = False
+        unquoted = exchange.on_json_response(documents[0])
+        assert unquoted['amount'] == 0.00012 and unquoted['id'] == 1234567890123
+
+
+test_loads()
+test_get_json_decoder()
+test_exchange()
+print('json decoders', [decoder.name for decoder in installed], 'succeeded')
@@ -0,0 +1,60 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import importlib  # noqa: E402
+import subprocess  # noqa: E402
+
+packages = ['ccxt', 'ccxt.async_support', 'ccxt.pro']
+
+# run in a new interpreter so that nothing is imported before the package
+imports = """
+import sys
+sys.path.insert(0, {root!r})
+import {package} as package
+loaded = [id for id in package.exchanges if '{package}.' + id in sys.modules]
+assert package.exchanges and not loaded, loaded
+print(len(package.exchanges))
+"""
+
+
+def test_imports():
+    # importing a package imports no exchange modules
+    for package in packages:
+        result = subprocess.run([sys.executable, '-c', imports.format(root=root, package=package)], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+        assert int(result.stdout) > 50, (package, result.stdout)
+
+
+def test_exchanges():
+    # every id resolves to its class with getattr, hasattr and from import
+    from ccxt.base.exchange import Exchange
+    for name in packages:
+        package = importlib.import_module(name)
+        assert 'binance' in package.exchanges and 'binance' in dir(package)
+        for id in package.exchanges:
+            assert hasattr(package, id), (name, id)
+            exchange = getattr(package, id)
+            assert isinstance(exchange, type) and issubclass(exchange, Exchange), (name, id)
+            assert exchange.__module__ == name + '.' + id, (name, id)
+            scope = {}
+            exec('from ' + name + ' import ' + id, scope)
+            assert scope[id] is exchange, (name, id)
+            # importing the module of the exchange keeps the class
+            importlib.import_module(name + '.' + id)
+            assert getattr(package, id) is exchange, (name, id)
+        assert not hasattr(package, 'not_an_exchange')
+        try:
+            exec('from ' + name + ' import not_an_exchange', {})
+            assert False, 'an unknown name should not be imported'
+        except ImportError:
+            pass
+
+
+test_imports()
+test_exchanges()
+print('lazy exchanges succeeded')
@@ -0,0 +1,257 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import gzip  # noqa: E402
+import json  # noqa: E402
+import tempfile  # noqa: E402
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+from ccxt.base.market_cache import market_cache_path, read_market_cache, write_market_cache  # noqa: E402
+from ccxt.test.base.fixtures import market  # noqa: E402
+
+
+currencies = {
+    'BTC': {'id': 'BTC', 'code': 'BTC', 'precision': 8},
+    'USDT': {'id': 'USDT', 'code': 'USDT', 'precision': 6},
+}
+
+
+class Exchange(ccxt.Exchange):
+    def __init__(self, config={}):
+        super(Exchange, self).__init__(dict({'id': 'test'}, **config))
+        self.has = dict(self.has, fetchCurrencies=True)
+        self.fetched = 0
+        self.served = [market('BTC/USDT'), market('ETH/USDT')]
+
+    def fetch_markets(self, params={}):
+        self.fetched += 1
+        return self.served
+
+    def fetch_currencies(self, params={}):
+        return currencies
+
+
+class AsyncExchange(ccxt.async_support.Exchange):
+    def __init__(self, config={}):
+        super(AsyncExchange, self).__init__(dict({'id': 'test'}, **config))
+        self.has = dict(self.has, fetchCurrencies=True)
+        self.fetched = 0
+        self.served = [market('BTC/USDT'), market('ETH/USDT')]
+        self.delay = 0
+        self.error = None
+        self.events = []
+
+    async def fetch_markets(self, params={}):
+        self.fetched += 1
+        self.events.append('markets')
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return self.served
+
+    async def fetch_currencies(self, params={}):
+        self.events.append('currencies')
+        await asyncio.sleep(0)
+        self.events.append('currencies done')
+        return currencies
+
+
+def age(path, milliseconds):
+    # makes the saved markets older
+    cache = read_market_cache(path)
+    cache['timestamp'] -= milliseconds
+    with gzip.open(path, 'wb') as file:
+        file.write(json.dumps(cache).encode())
+
+
+def test_files():
+    with tempfile.TemporaryDirectory() as directory:
+        path = market_cache_path(directory, 'test', ['1.0', 'test', {'a': 1, 'b': 2}])
+        # the same key gives the same file whatever the order of the dicts
+        assert path == market_cache_path(directory, 'test', ['1.0', 'test', {'b': 2, 'a': 1}])
+        assert path != market_cache_path(directory, 'test', ['1.0', 'test', {'a': 1, 'b': 3}])
+        assert os.path.basename(path).startswith('test-') and path.endswith('.json.gz')
+        assert market_cache_path('~/cache', 'test', []).startswith(os.path.expanduser('~'))
+        assert read_market_cache(path) is None
+        markets = [market('BTC/USDT'), market('ETH/USDT')]
+        write_market_cache(path, 1700000000000, markets, currencies)
+        assert read_market_cache(path) == {'version': 1, 'timestamp': 1700000000000, 'markets': markets, 'currencies': currencies}
+        # the directories are made and no temporary files are left
+        nested = os.path.join(directory, 'a', 'b', 'markets.json.gz')
+        write_market_cache(nested, 1, markets, None)
+        assert read_market_cache(nested)['currencies'] is None
+        assert os.listdir(os.path.dirname(nested)) == ['markets.json.gz']
+        # damaged files are ignored
+        with open(path, 'wb') as file:
+            file.write(b'not gzip')
+        assert read_market_cache(path) is None
+        with gzip.open(path, 'wb') as file:
+            file.write(b'{"version": 1, "timestamp"')
+        assert read_market_cache(path) is None
+        with gzip.open(path, 'wb') as file:
+            file.write(b'{"version": 0, "timestamp": 1, "markets": [], "currencies": null}')
+        assert read_market_cache(path) is None
+        with gzip.open(path, 'wb') as file:
+            file.write(b'[]')
+        assert read_market_cache(path) is None
+        # the values that json can not keep raise and leave nothing behind
+        try:
+            write_market_cache(path, 1, [{'value': object()}], None)
+            assert False, 'a market that can not be saved should raise'
+        except TypeError:
+            pass
+        assert sorted(os.listdir(directory)) == ['a', os.path.basename(path)]
+
+
+def test_sync():
+    with tempfile.TemporaryDirectory() as directory:
+        exchange = Exchange({'marketsCache': directory})
+        exchange.load_markets()
+        assert exchange.fetched == 1
+        path = exchange.markets_cache_path()
+        assert os.path.exists(path)
+        # the next instances set the saved markets
+        cached = Exchange({'marketsCache': directory})
+        cached.load_markets()
+        assert cached.fetched == 0
+        assert cached.markets == exchange.markets
+        assert cached.markets_by_id == exchange.markets_by_id
+        assert cached.currencies == exchange.currencies
+        assert cached.symbols == ['BTC/USDT', 'ETH/USDT']
+        # the params, the sandbox mode and the default type use other files
+        assert exchange.markets_cache_path({'type': 'swap'}) != path
+        exchange.options['defaultType'] = 'swap'
+        assert exchange.markets_cache_path() != path
+        exchange.options['defaultType'] = None
+        exchange.urls = {'api': 'https://testnet.example.com'}
+        assert exchange.markets_cache_path() != path
+        # the sync exchanges fetch the expired markets before returning
+        age(path, exchange.marketsCacheTTL + 1000)
+        expired = Exchange({'marketsCache': directory})
+        expired.served = [market('BTC/USDT', price=3)]
+        expired.load_markets()
+        assert expired.fetched == 1
+        assert expired.symbols == ['BTC/USDT'] and expired.markets['BTC/USDT']['precision']['price'] == 3
+        assert read_market_cache(path)['markets'] == expired.served
+        # reload fetches the markets whatever the age
+        expired.load_markets(True)
+        assert expired.fetched == 2
+        # without marketsCache nothing is saved
+        plain = Exchange()
+        plain.load_markets()
+        assert plain.fetched == 1 and plain.read_markets_cache() is None
+
+
+def test_sync_unwritable():
+    # the markets are used if they can not be saved
+    with tempfile.TemporaryDirectory() as directory:
+        blocked = os.path.join(directory, 'file')
+        open(blocked, 'w').close()
+        exchange = Exchange({'marketsCache': blocked})
+        exchange.load_markets()
+        assert exchange.symbols == ['BTC/USDT', 'ETH/USDT']
+
+
+async def test_async():
+    with tempfile.TemporaryDirectory() as directory:
+        exchange = AsyncExchange({'marketsCache': directory})
+        await exchange.load_markets()
+        assert exchange.fetched == 1
+        await exchange.close()
+        path = exchange.markets_cache_path()
+        # fresh markets are not fetched
+        cached = AsyncExchange({'marketsCache': directory})
+        await cached.load_markets()
+        assert cached.fetched == 0 and cached.markets_refreshing is None
+        assert cached.markets == exchange.markets
+        await cached.close()
+        # the expired markets are returned at once and fetched in the background
+        age(path, exchange.marketsCacheTTL + 1000)
+        stale = AsyncExchange({'marketsCache': directory})
+        stale.served = [market('BTC/USDT', price=3)]
+        stale.delay = 0.05
+        markets = await stale.load_markets()
+        assert sorted(markets) == ['BTC/USDT', 'ETH/USDT']
+        refreshing = stale.markets_refreshing
+        assert refreshing is not None and not refreshing.done()
+        assert refreshing.get_loop() is stale.asyncio_loop
+        result = await refreshing
+        assert stale.markets_refreshing is None
+        assert sorted(result) == ['BTC/USDT'] and stale.symbols == ['BTC/USDT']
+        assert stale.markets['BTC/USDT']['precision']['price'] == 3
+        # load_markets returns the refreshed markets and the file has them
+        assert await stale.load_markets() is result
+        assert read_market_cache(path)['markets'] == stale.served
+        assert stale.fetched == 1
+        await stale.close()
+
+
+async def test_async_refresh_fails():
+    # the saved markets are kept if the refresh fails
+    with tempfile.TemporaryDirectory() as directory:
+        exchange = AsyncExchange({'marketsCache': directory})
+        await exchange.load_markets()
+        await exchange.close()
+        path = exchange.markets_cache_path()
+        timestamp = read_market_cache(path)['timestamp']
+        age(path, exchange.marketsCacheTTL + 1000)
+        failing = AsyncExchange({'marketsCache': directory})
+        failing.error = ccxt.NetworkError('down')
+        markets = await failing.load_markets()
+        result = await failing.markets_refreshing
+        assert result is markets and failing.markets is markets
+        assert sorted(failing.markets) == ['BTC/USDT', 'ETH/USDT']
+        assert failing.markets_refreshing is None
+        assert read_market_cache(path)['timestamp'] < timestamp
+        await failing.close()
+
+
+async def test_async_close():
+    # close cancels the refresh
+    with tempfile.TemporaryDirectory() as directory:
+        exchange = AsyncExchange({'marketsCache': directory})
+        await exchange.load_markets()
+        await exchange.close()
+        path = exchange.markets_cache_path()
+        age(path, exchange.marketsCacheTTL + 1000)
+        closing = AsyncExchange({'marketsCache': directory})
+        closing.served = [market('BTC/USDT', price=3)]
+        closing.delay = 10
+        await closing.load_markets()
+        refreshing = closing.markets_refreshing
+        await asyncio.sleep(0)
+        await closing.close()
+        assert closing.markets_refreshing is None
+        await asyncio.wait([refreshing])
+        assert refreshing.cancelled()
+        assert sorted(closing.markets) == ['BTC/USDT', 'ETH/USDT']
+        assert read_market_cache(path)['markets'] == exchange.served
+
+
+async def test_async_currencies_first():
+    # the currencies and the markets are fetched at the same time unless the exchange fetches the currencies first
+    concurrent = AsyncExchange()
+    await concurrent.load_markets()
+    assert concurrent.events == ['currencies', 'markets', 'currencies done']
+    sequential = AsyncExchange({'options': {'loadCurrenciesBeforeMarkets': True}})
+    await sequential.load_markets()
+    assert sequential.events == ['currencies', 'currencies done', 'markets']
+    assert sequential.currencies == concurrent.currencies and sequential.markets == concurrent.markets
+    for id in ['cex', 'latoken', 'coinmetro']:
+        assert getattr(ccxt.async_support, id)().options['loadCurrenciesBeforeMarkets'] is True
+
+
+test_files()
+test_sync()
+test_sync_unwritable()
+asyncio.run(test_async())
+asyncio.run(test_async_refresh_fails())
+asyncio.run(test_async_close())
+asyncio.run(test_async_currencies_first())
+print('market cache succeeded')
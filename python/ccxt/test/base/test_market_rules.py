@@ -0,0 +1,129 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import random  # noqa: E402
+import ccxt  # noqa: E402
+from ccxt.base.errors import InvalidOrder  # noqa: E402
+from ccxt.base.decimal_to_precision import DECIMAL_PLACES, SIGNIFICANT_DIGITS, TICK_SIZE, PAD_WITH_ZERO  # noqa: E402
+from ccxt.test.base.fixtures import market  # noqa: E402
+
+
+def exchange_with(*markets, **config):
+    exchange = ccxt.Exchange(dict({'id': 'test'}, **config))
+    exchange.set_markets(list(markets))
+    return exchange
+
+
+def raises(method, *args):
+    try:
+        method(*args)
+    except InvalidOrder as e:
+        return str(e)
+    assert False, 'InvalidOrder expected'
+
+
+def test_rounding():
+    # the same strings and errors as price_to_precision, amount_to_precision and cost_to_precision
+    random.seed(5)
+    cases = [
+        (DECIMAL_PLACES, {'price': 2, 'amount': 4}),
+        (DECIMAL_PLACES, {'price': 0, 'amount': -1}),
+        (TICK_SIZE, {'price': 0.5, 'amount': 0.001}),
+        (TICK_SIZE, {'price': 10, 'amount': 1}),
+        (SIGNIFICANT_DIGITS, {'price': 5, 'amount': 3}),
+    ]
+    for precision_mode, precision in cases:
+        for padding_mode in [5, PAD_WITH_ZERO]:
+            exchange = exchange_with(market(precision=precision), precisionMode=precision_mode, paddingMode=padding_mode)
+            rules = exchange.market_rules('BTC/USDT')
+            for i in range(300):
+                value = round(random.uniform(0, 2000), random.randint(0, 10))
+                for round_value, scalar in [(rules.round_price, exchange.price_to_precision), (rules.round_amount, exchange.amount_to_precision), (rules.round_cost, exchange.cost_to_precision)]:
+                    try:
+                        expected = scalar('BTC/USDT', value)
+                    except InvalidOrder as e:
+                        assert raises(round_value, value) == str(e), (value, precision_mode, precision)
+                        continue
+                    assert round_value(value) == expected, (value, precision_mode, precision)
+
+
+def test_limits():
+    limits = {
+        'amount': {'min': 0.001, 'max': 100},
+        'price': {'min': 1, 'max': 1000000},
+        'cost': {'min': 10, 'max': 50000},
+    }
+    rules = exchange_with(market(limits=limits)).market_rules('BTC/USDT')
+    assert rules.validate(0.12345, 100.555) == ('0.1234', '100.56')
+    assert rules.validate('1', '20000') == ('1', '20000')
+    # market orders are not checked against the price and the cost limits
+    assert rules.validate(0.5) == ('0.5', None)
+    assert rules.validate(0.001, None) == ('0.001', None)
+    # the limits are checked after rounding
+    assert 'amount of BTC/USDT must be greater than or equal to minimum amount of 0.001, got 0.0009' in raises(rules.validate, 0.00099, 20000)
+    assert 'amount of BTC/USDT must be less than or equal to maximum amount of 100' in raises(rules.validate, 100.1, 20)
+    assert rules.validate(100.00001, 20) == ('100', '20')
+    assert 'price of BTC/USDT must be greater than or equal to minimum price of 1, got 0.5' in raises(rules.validate, 50, 0.5)
+    assert 'price of BTC/USDT must be less than or equal to maximum price of 1000000' in raises(rules.validate, 0.01, 1000001)
+    assert 'cost of BTC/USDT must be greater than or equal to minimum cost of 10, got 9.9' in raises(rules.validate, 0.99, 10)
+    assert 'cost of BTC/USDT must be less than or equal to maximum cost of 50000' in raises(rules.validate, 3, 20000)
+    assert rules.validate(2.5, 20000) == ('2.5', '20000')
+    # rounding to zero raises like amount_to_precision and price_to_precision
+    assert 'amount of BTC/USDT must be greater than minimum amount precision of 4' in raises(rules.validate, 0.00001, 20000)
+    assert 'price of BTC/USDT must be greater than minimum price precision of 2' in raises(rules.validate, 1, 0.001)
+
+
+def test_contracts():
+    # the cost of linear contracts is amount * contractSize * price, of inverse contracts amount * contractSize / price
+    limits = {'cost': {'min': 10, 'max': 1000}}
+    linear = exchange_with(market('BTC/USDT:USDT', limits=limits, spot=False, swap=True, type='swap', contract=True, linear=True, inverse=False, contractSize=0.01)).market_rules('BTC/USDT:USDT')
+    assert linear.validate(1, 2000) == ('1', '2000')
+    assert 'cost of BTC/USDT:USDT must be greater than or equal to minimum cost of 10, got 9' in raises(linear.validate, 1, 900)
+    assert 'maximum cost of 1000' in raises(linear.validate, 10, 20000)
+    inverse = exchange_with(market('BTC/USD:BTC', precision={'price': 1, 'amount': 0}, limits=limits, spot=False, swap=True, type='swap', contract=True, linear=False, inverse=True, contractSize=100)).market_rules('BTC/USD:BTC')
+    assert inverse.validate(10, 10) == ('10', '10')
+    assert 'minimum cost of 10, got 5' in raises(inverse.validate, 10, 200)
+    # no limits, no checks
+    rules = exchange_with(market()).market_rules('BTC/USDT')
+    assert rules.validate(1e9, 1e9) == ('1000000000', '1000000000')
+
+
+def test_compiled():
+    # the rules are kept until the markets are reloaded or the precision mode is changed
+    exchange = exchange_with(market(), market('ETH/USDT'))
+    rules = exchange.market_rules('BTC/USDT')
+    assert exchange.market_rules('BTC/USDT') is rules
+    assert exchange.market_rules('ETH/USDT') is not rules
+    exchange.paddingMode = PAD_WITH_ZERO
+    padded = exchange.market_rules('BTC/USDT')
+    assert padded is not rules and padded.round_price(1) == '1.00'
+    exchange.set_markets([market(precision={'price': 1, 'amount': 2})])
+    assert exchange.market_rules('BTC/USDT').round_price(1.25) == '1.3'
+
+
+def test_overridden():
+    # the exchanges that round differently keep their rounding
+    class Exchange(ccxt.Exchange):
+        def price_to_precision(self, symbol, price):
+            return str(int(price))
+
+    exchange = Exchange({'id': 'test'})
+    exchange.set_markets([market(limits={'price': {'min': 2}})])
+    rules = exchange.market_rules('BTC/USDT')
+    assert rules.round_price(5.99) == '5'
+    assert rules.round_amount(0.123456) == '0.1234'
+    assert rules.validate(1, 3.7) == ('1', '3')
+    assert 'minimum price of 2, got 1' in raises(rules.validate, 1, 1.9)
+
+
+test_rounding()
+test_limits()
+test_contracts()
+test_compiled()
+test_overridden()
+print('market rules succeeded')
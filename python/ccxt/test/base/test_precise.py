@@ -0,0 +1,158 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import random  # noqa: E402
+from decimal import Decimal, getcontext  # noqa: E402
+from ccxt.base.precise import Precise, compile_expression, parse  # noqa: E402
+
+getcontext().prec = 100
+
+
+def number():
+    integer = random.choice(['0', '1', '7', '10', '123', '1000', '98765432109876543210'])
+    sign = random.choice(['', '-'])
+    string = sign + integer
+    if random.random() < 0.6:
+        string += '.' + random.choice(['0', '5', '00001', '125', '10', '999999999999'])
+    if random.random() < 0.1:
+        string += random.choice(['e-8', 'e3', 'E-2'])
+    return string
+
+
+def same(string, expected):
+    return string is not None and Decimal(string) == expected
+
+
+def test_string_arithmetic():
+    # the string_ methods agree with Decimal on random operands
+    random.seed(1)
+    for i in range(3000):
+        a = number()
+        b = number()
+        x = Decimal(a)
+        y = Decimal(b)
+        assert same(Precise.string_add(a, b), x + y), (a, b)
+        assert same(Precise.string_sub(a, b), x - y), (a, b)
+        assert same(Precise.string_mul(a, b), x * y), (a, b)
+        assert same(Precise.string_abs(a), abs(x)), a
+        assert same(Precise.string_neg(a), -x), a
+        assert same(Precise.string_min(a, b), min(x, y)), (a, b)
+        assert same(Precise.string_max(a, b), max(x, y)), (a, b)
+        assert Precise.string_gt(a, b) == (x > y)
+        assert Precise.string_ge(a, b) == (x >= y)
+        assert Precise.string_lt(a, b) == (x < y)
+        assert Precise.string_le(a, b) == (x <= y)
+        assert Precise.string_eq(a, b) == (x == y)
+        assert Precise.string_equals(a, b) == (x == y)
+        if y != 0:
+            # the division and the modulo match the methods of the Precise objects
+            assert Precise.string_div(a, b) == str(Precise(a).div(Precise(b))), (a, b)
+            assert Precise.string_div(a, b, 8) == str(Precise(a).div(Precise(b), 8)), (a, b)
+            assert Precise.string_mod(a, b) == str(Precise(a).mod(Precise(b))), (a, b)
+            if x >= 0 and y > 0:
+                assert same(Precise.string_mod(a, b), x % y), (a, b)
+        else:
+            assert Precise.string_div(a, b) is None
+
+
+def test_string_results():
+    # the results are formatted like str(Precise(...)) of the previous implementation
+    assert Precise.string_add('1.10', '2.90') == '4'
+    assert Precise.string_mul('0.1', '0.2') == '0.02'
+    assert Precise.string_sub('1', '1.000') == '0'
+    assert Precise.string_mul('1e3', '2') == '2000'
+    assert Precise.string_div('1', '3') == '0.333333333333333333'
+    assert Precise.string_div('-1', '3') == '-0.333333333333333333'
+    assert Precise.string_div('1', '3', 2) == '0.33'
+    assert Precise.string_mod('5.5', '2') == '1.5'
+    assert Precise.string_neg('-0.001') == '0.001'
+    assert Precise.string_add(None, '1') == '1'
+    assert Precise.string_add('1', None) == '1'
+    assert Precise.string_add(None, None) is None
+    assert Precise.string_mul(None, '1') is None
+    assert Precise.string_gt('1', None) is None
+    assert str(Precise('0.00100')) == '0.001'
+    assert str(Precise('-12.50') + Precise('0.5')) == '-12'
+    assert Precise('1.50') == '1.5'
+    assert Precise('2') > Precise('1.999')
+    # the same strings are parsed once
+    parse.cache_clear()
+    Precise.string_mul('64000.10', '0.5')
+    Precise.string_mul('64000.10', '0.5')
+    assert parse.cache_info().hits == 2
+
+
+def test_expr():
+    values = {'price': '64000.10', 'amount': '0.5', 'rate': '0.001'}
+    assert Precise.expr('price * amount * (1 - rate)', **values) == '31968.04995'
+    assert Precise.expr('price * amount - rate', **values) == '32000.049'
+    assert Precise.expr('-price + price', **values) == '0'
+    assert Precise.expr('+amount', **values) == '0.5'
+    assert Precise.expr('-(amount - 1)', **values) == '0.5'
+    assert Precise.expr('amount * 2.5 + 1e-3', **values) == '1.251'
+    assert Precise.expr('price % 1', **values) == '0.1'
+    assert Precise.expr('1 / 3') == '0.333333333333333333'
+    assert Precise.expr('  amount / 4 ', **values) == '0.125'
+    # the names may be numbers too
+    assert Precise.expr('a * b', a=3, b=0.5) == '1.5'
+    # the result equals the chained string_ methods
+    random.seed(2)
+    for i in range(500):
+        a = number()
+        b = number()
+        c = number()
+        chained = Precise.string_sub(Precise.string_mul(a, Precise.string_add(b, c)), a)
+        assert Precise.expr('a * (b + c) - a', a=a, b=b, c=c) == chained, (a, b, c)
+
+
+def test_expr_none():
+    # None when a value that is used is None or when dividing by zero
+    assert Precise.expr('price * amount', price=None, amount='1') is None
+    assert Precise.expr('price * amount', price='1', amount=None) is None
+    assert Precise.expr('-price', price=None) is None
+    assert Precise.expr('price / amount', price='1', amount='0') is None
+    assert Precise.expr('price / (amount - amount) + 1', price='1', amount='2.5') is None
+    # the unused branches of the expression are not evaluated
+    assert Precise.expr('price', price='1', amount=None) == '1'
+    try:
+        Precise.expr('price', amount='1')
+        assert False, 'a missing value should raise'
+    except KeyError:
+        pass
+
+
+def test_expr_unsupported():
+    for expression in ['price ** 2', 'price // 2', 'abs(price)', 'price.x', '"1" + price', 'price < 1']:
+        try:
+            Precise.expr(expression, price='1')
+            assert False, expression + ' should raise'
+        except ValueError as e:
+            assert 'Precise.expr() supports' in str(e)
+    try:
+        Precise.expr('price *', price='1')
+        assert False, 'a syntax error should raise'
+    except SyntaxError:
+        pass
+
+
+def test_expr_cache():
+    # the expressions are compiled once
+    compile_expression.cache_clear()
+    for i in range(10):
+        Precise.expr('price * amount', price=str(i), amount='2')
+    info = compile_expression.cache_info()
+    assert info.misses == 1 and info.hits == 9
+
+
+test_string_arithmetic()
+test_string_results()
+test_expr()
+test_expr_none()
+test_expr_unsupported()
+test_expr_cache()
+print('precise succeeded')
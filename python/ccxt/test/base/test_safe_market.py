@@ -0,0 +1,41 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.test.base.fixtures import market  # noqa: E402
+
+
+def test_safe_market():
+    exchange = ccxt.Exchange({'id': 'mock'})
+    exchange.set_markets([market('BTC/USDT'), market('BTC/USDT:USDT'), market('ETH/USDT')])
+    structures = []
+    safe_market_structure = exchange.safe_market_structure
+
+    def counted(structure=None):
+        structures.append(structure)
+        return safe_market_structure(structure)
+
+    exchange.safe_market_structure = counted
+    # the known ids return the loaded markets without making the structure
+    eth = exchange.markets_by_id['ETHUSDT'][0]
+    assert exchange.safe_market('ETHUSDT') is eth
+    assert exchange.safe_market('ETHUSDT', None, '-') is eth
+    assert exchange.safe_market('BTCUSDT', None, None, 'swap') is exchange.markets_by_id['BTCUSDT'][1]
+    assert exchange.safe_market('BTCUSDT', eth) is exchange.markets_by_id['BTCUSDT'][0]
+    assert exchange.safe_symbol('ETHUSDT') == 'ETH/USDT'
+    assert len(structures) == 0
+    # the unknown ids get the structure or the market passed in
+    assert exchange.safe_market('XRP-USDT', None, '-')['symbol'] == 'XRP/USDT'
+    assert exchange.safe_market('XRPUSDT')['symbol'] == 'XRPUSDT'
+    assert len(structures) == 2
+    assert exchange.safe_market('XRPUSDT', eth) is eth
+    assert len(structures) == 2
+
+
+test_safe_market()
+print('safe_market succeeded')
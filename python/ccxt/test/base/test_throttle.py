@@ -7,8 +7,12 @@ sys.path.append(root)
 # ----------------------------------------------------------------------------
 
 import asyncio  # noqa: E402
+import tempfile  # noqa: E402
 import time  # noqa: E402
+from ccxt.async_support.base import throttler  # noqa: E402
 from ccxt.async_support.base.throttler import Throttler as Throttle  # noqa: E402
+from ccxt.async_support.base.budget import Budget, SharedBudget, BudgetServer, SocketBudget  # noqa: E402
+from ccxt.async_support import binance  # noqa: E402
 # from ccxt.async_support.base.throttle import throttle as Throttle
 
 
@@ -79,6 +83,8 @@ test_cases = [
 
 # add any more tests you want above
 
+# every case runs against both the polling looper and the timer scheduler
+test_cases = [dict(case, scheduler=scheduler) for scheduler in ['looper', 'timer'] for case in test_cases]
 
 for i, case in enumerate(test_cases, 1):
     case['number'] = i
@@ -94,6 +100,7 @@ async def schedule(case):
     throttle = Throttle({
         'tokens': case['tokens'],
         'refillRate': case['refillRate'],
+        'scheduler': case['scheduler'],
     })
     start = time.perf_counter_ns()
     for i in range(case['runs']):
@@ -101,12 +108,167 @@ async def schedule(case):
     end = time.perf_counter_ns()
     elapsed_ms = (end - start) / 1000000
     result = abs(case['expected'] - elapsed_ms) < delta
-    print(f'case {case["number"]} {"succeeded" if result else "failed"} in {elapsed_ms}ms expected {case["expected"]}ms')
+    print(f'case {case["number"]} ({case["scheduler"]}) {"succeeded" if result else "failed"} in {elapsed_ms}ms expected {case["expected"]}ms')
     assert result
 
 
+async def prioritize(scheduler):
+    # a trading request queued behind market data polls is granted right after the one in progress
+    # while a market data poll has to leave the tokens reserved for trading in the bucket
+    throttle = Throttle({
+        'refillRate': 1 / 10,
+        'capacity': 2,
+        'reserved': {'trading': 1},
+        'scheduler': scheduler,
+    })
+    granted = []
+
+    async def request(name, priority):
+        await throttle(1, priority)
+        granted.append(name)
+
+    start = time.perf_counter()
+    tasks = [asyncio.ensure_future(request('poll' + str(i), 'marketData')) for i in range(5)]
+    await asyncio.sleep(0.015)
+    await request('order', 'trading')
+    order = time.perf_counter()
+    await asyncio.gather(*tasks)
+    elapsed_ms = (order - start) * 1000
+    print(f'priority ({scheduler}) granted {granted}, order in {elapsed_ms}ms expected 15ms')
+    assert granted == ['poll0', 'order', 'poll1', 'poll2', 'poll3', 'poll4']
+    assert abs(elapsed_ms - 15) < delta
+
+
+async def route():
+    # the implicit api methods queue their requests in the lane of the endpoint or of params['rateLimitPriority']
+    exchange = binance()
+    urls = []
+
+    async def fetch(url, method='GET', headers=None, body=None):
+        urls.append(url)
+        return {}
+
+    exchange.fetch = fetch
+    await exchange.public_get_time()
+    await exchange.public_get_ping({'rateLimitPriority': 'trading'})
+    await exchange.close()
+    print(f'route lanes {exchange.throttle.lanes} urls {urls}')
+    assert exchange.throttle.lanes == ['trading', 'marketData']
+    assert all('rateLimitPriority' not in url for url in urls)
+
+
+async def window(scheduler):
+    # at most 3 units of weight per 200ms window, the exchange reports 2 of them used already
+    interval = 200
+    throttle = Throttle({
+        'refillRate': 1,
+        'capacity': 10,
+        'buckets': {
+            'weight': {'limit': 3, 'interval': interval, 'header': 'X-Used-Weight'},
+        },
+        'scheduler': scheduler,
+    })
+    # start right after a window boundary of the clock of the loop
+    await asyncio.sleep((interval - asyncio.get_running_loop().time() * 1000 % interval + 10) / 1000)
+    throttle.sync('https://example.com', {'X-Used-Weight': '2'})
+    windows = []
+    for i in range(4):
+        await throttle(1)
+        windows.append(int(asyncio.get_running_loop().time() * 1000 // interval))
+    print(f'window ({scheduler}) granted in windows {[w - windows[0] for w in windows]}')
+    assert windows[1] == windows[0] + 1
+    assert windows[3] == windows[1]
+
+
+async def bypass(scheduler):
+    # an order held back by the full window of the trading lane does not hold back the market data polls behind it
+    interval = 200
+    config = {
+        'refillRate': 1,
+        'capacity': 10,
+        'tokens': 10,
+        'buckets': {
+            'orders': {'limit': 1, 'interval': interval, 'lanes': ['trading']},
+        },
+        'scheduler': scheduler,
+    }
+    if scheduler == 'budget':
+        config['budget'] = Budget({'refillRate': 1, 'capacity': 10, 'tokens': 10})
+    throttle = Throttle(config)
+    await asyncio.sleep((interval - asyncio.get_running_loop().time() * 1000 % interval + 10) / 1000)
+    await throttle(1, 'trading')
+    order = asyncio.ensure_future(throttle(1, 'trading'))
+    await asyncio.sleep(0.005)
+    start = time.perf_counter()
+    await throttle(1, 'marketData')
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f'bypass ({scheduler}) poll in {elapsed_ms}ms expected 0ms')
+    assert not order.done()
+    assert elapsed_ms < delta
+    await order
+
+
+async def share(name):
+    # two throttlers drawing from one budget of 1 token per 20ms take 10 requests each
+    config = {'refillRate': 1 / 20}
+    server = None
+    if name == 'Budget':
+        budgets = [Budget(config)] * 2
+    elif name == 'SharedBudget':
+        budgets = [SharedBudget(config)] * 2
+    else:
+        path = os.path.join(tempfile.mkdtemp(), 'budget.sock')
+        server = await BudgetServer(path, config).start()
+        budgets = [SocketBudget(path), SocketBudget(path)]
+    throttles = [Throttle({'budget': budget}) for budget in budgets]
+
+    async def run(throttle):
+        for i in range(10):
+            await throttle(1)
+
+    start = time.perf_counter_ns()
+    await asyncio.gather(*[run(throttle) for throttle in throttles])
+    elapsed_ms = (time.perf_counter_ns() - start) / 1000000
+    for budget in budgets:
+        if isinstance(budget, SocketBudget):
+            budget.close()
+    if server is not None:
+        await server.close()
+    print(f'budget ({name}) 20 requests in {elapsed_ms}ms expected 380ms')
+    assert abs(elapsed_ms - 380) < delta * 2
+
+
+async def clock(scheduler):
+    # the wall clock jumping back an hour does not change the delays, the throttler only uses the clock of the loop
+    throttle = Throttle({'refillRate': 1 / 20, 'capacity': 1, 'scheduler': scheduler})
+    wall = time.time
+    offset = [0]
+    # the time functions imported by name too
+    modules = [module for module in [time, throttler] if getattr(module, 'time', None) is wall]
+    for module in modules:
+        module.time = lambda: wall() + offset[0]
+    try:
+        start = time.perf_counter()
+        for i in range(5):
+            await throttle(1)
+            offset[0] -= 3600000
+        elapsed_ms = (time.perf_counter() - start) * 1000
+    finally:
+        for module in modules:
+            module.time = wall
+    print(f'clock ({scheduler}) 5 requests in {elapsed_ms}ms expected 80ms')
+    assert abs(elapsed_ms - 80) < delta * 2
+
+
 async def main():
-    await asyncio.wait([schedule(case) for case in test_cases], return_when=asyncio.ALL_COMPLETED)
+    await asyncio.gather(*[schedule(case) for case in test_cases])
+    await asyncio.gather(*[prioritize(scheduler) for scheduler in ['looper', 'timer']])
+    await route()
+    await asyncio.gather(*[window(scheduler) for scheduler in ['looper', 'timer']])
+    await asyncio.gather(*[bypass(scheduler) for scheduler in ['looper', 'timer', 'budget']])
+    for scheduler in ['looper', 'timer']:
+        await clock(scheduler)
+    await asyncio.gather(*[share(name) for name in ['Budget', 'SharedBudget', 'SocketBudget']])
 
 
 asyncio.run(main())
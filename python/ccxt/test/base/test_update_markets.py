@@ -0,0 +1,162 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import copy  # noqa: E402
+import random  # noqa: E402
+import ccxt  # noqa: E402
+from ccxt.base.decimal_to_precision import TICK_SIZE  # noqa: E402
+from ccxt.test.base.fixtures import market  # noqa: E402
+
+# everything set_markets sets, compared with repr so the order counts too
+attributes = ['markets', 'markets_by_id', 'symbols', 'ids', 'currencies', 'currencies_by_id', 'codes', 'baseCurrencies', 'quoteCurrencies']
+
+
+def random_markets(count):
+    codes = ['BTC', 'ETH', 'LTC', 'XRP', 'SOL', 'USDT', 'USDC', 'EUR']
+    result = []
+    for i in range(count):
+        base, quote = random.sample(codes, 2)
+        spot = random.random() < 0.7
+        symbol = base + '/' + quote + ('' if spot else ':' + quote)
+        result.append(market(symbol, base + quote + ('' if spot else 'PERP'), random.randint(0, 3), random.randint(0, 3)))
+    return result
+
+
+def same(a, b):
+    for attribute in attributes:
+        assert repr(getattr(a, attribute, None)) == repr(getattr(b, attribute, None)), attribute
+
+
+def check(history, precision_mode=None):
+    # applying every load of the history with update_markets leaves the same state as set_markets
+    config = {'id': 'test'} if precision_mode is None else {'id': 'test', 'precisionMode': precision_mode}
+    expected = ccxt.Exchange(config)
+    updated = ccxt.Exchange(config)
+    for markets, currencies in history:
+        expected.set_markets(copy.deepcopy(markets), copy.deepcopy(currencies))
+        result = updated.update_markets(copy.deepcopy(markets), copy.deepcopy(currencies))
+        assert result is updated.markets
+        same(expected, updated)
+
+
+def test_reloads():
+    random.seed(6)
+    for precision_mode in [None, TICK_SIZE]:
+        for i in range(40):
+            markets = random_markets(30)
+            history = [(markets, None)]
+            for j in range(4):
+                markets = copy.deepcopy(markets)
+                # changes, delistings, listings and a different order
+                for changed in random.sample(markets, 3):
+                    changed['precision']['price'] = random.randint(0, 3)
+                for k in range(2):
+                    if markets:
+                        del markets[random.randrange(len(markets))]
+                markets.extend(random_markets(2))
+                if random.random() < 0.3:
+                    random.shuffle(markets)
+                history.append((markets, None))
+            check(history, precision_mode)
+
+
+def test_duplicates():
+    # several markets with the same symbol or the same id
+    btc = market('BTC/USDT')
+    twin = market('BTC/USDT', id='BTC-USDT', price=8)
+    swap = market('BTC/USDT:USDT')
+    shared = market('BTC/USDT:USDT', price=5)
+    eth = market('ETH/USDT')
+    check([([btc, eth], None), ([btc, twin, eth], None), ([twin, btc, eth], None), ([btc, eth], None)])
+    check([([btc, swap], None), ([btc, swap, shared], None), ([shared, btc, swap], None), ([btc, shared], None), ([btc, swap], None)])
+    check([([btc, twin], None), ([btc, twin], None), ([twin], None), ([twin, btc], None)])
+
+
+def test_order():
+    # the highest precision of a currency goes to the first of its markets, the markets are in the order they are fetched
+    a = market('BTC/USDT', price=2, amount=4)
+    b = market('BTC/EUR', price=2, amount=4)
+    c = market('ETH/BTC', price=4, amount=2)
+    check([([a, b, c], None), ([c, b, a], None), ([b, a, c], None), ([b, c], None), ([a, b, c], None)])
+    check([([a, b, c], None), ([c, b, a], None)], TICK_SIZE)
+
+
+def test_currencies():
+    # the fetched currencies and the currencies derived from the markets alternate
+    random.seed(7)
+    markets = random_markets(20)
+    currencies = {
+        'BTC': {'id': 'btc', 'code': 'BTC', 'precision': 8, 'name': 'Bitcoin'},
+        'USDT': {'id': 'usdt', 'code': 'USDT', 'precision': 6},
+    }
+    reloaded = copy.deepcopy(markets)
+    reloaded[0]['precision']['amount'] = 9
+    check([(markets, currencies), (markets, None), (reloaded, None), (reloaded, currencies), (markets, None), (markets, None)])
+
+
+def test_set_markets_between():
+    # set_markets between two updates
+    random.seed(8)
+    markets = random_markets(20)
+    reloaded = copy.deepcopy(markets[:-2]) + random_markets(2)
+    expected = ccxt.Exchange({'id': 'test'})
+    updated = ccxt.Exchange({'id': 'test'})
+    for exchange in [expected, updated]:
+        exchange.set_markets(copy.deepcopy(markets))
+    expected.set_markets(copy.deepcopy(reloaded))
+    updated.update_markets(copy.deepcopy(reloaded))
+    same(expected, updated)
+    assert updated.markets_with_derived_currencies is updated.markets
+    updated.set_markets(copy.deepcopy(markets))
+    assert updated.markets_with_derived_currencies is None
+    expected.set_markets(copy.deepcopy(markets))
+    same(expected, updated)
+    for exchange in [expected, updated]:
+        exchange.currencies = {}
+    expected.set_markets(copy.deepcopy(reloaded))
+    updated.update_markets(copy.deepcopy(reloaded))
+    same(expected, updated)
+
+
+def test_reused():
+    # the markets that did not change keep their structures
+    btc = market('BTC/USDT')
+    eth = market('ETH/USDT')
+    exchange = ccxt.Exchange({'id': 'test'})
+    exchange.update_markets([btc, eth])
+    loaded = exchange.markets
+    changed = dict(eth, precision={'price': 3, 'amount': 4})
+    exchange.update_markets([copy.deepcopy(btc), changed])
+    assert exchange.markets['BTC/USDT'] is loaded['BTC/USDT']
+    assert exchange.markets['ETH/USDT'] is not loaded['ETH/USDT']
+    assert exchange.markets['ETH/USDT']['precision']['price'] == 3
+
+
+def test_apply_markets():
+    # the exchanges that override set_markets keep using it
+    class Exchange(ccxt.Exchange):
+        def set_markets(self, markets, currencies=None):
+            self.overridden = True
+            return super(Exchange, self).set_markets(markets, currencies)
+
+    exchange = Exchange({'id': 'test'})
+    exchange.apply_markets([market('BTC/USDT')])
+    assert exchange.overridden
+    plain = ccxt.Exchange({'id': 'test'})
+    plain.apply_markets([market('BTC/USDT')])
+    assert not hasattr(plain, 'overridden') and plain.symbols == ['BTC/USDT']
+
+
+test_reloads()
+test_duplicates()
+test_order()
+test_currencies()
+test_set_markets_between()
+test_reused()
+test_apply_markets()
+print('update_markets succeeded')
@@ -4416,10 +4416,7 @@ export default class Exchange {
     }
 
     safeMarket (marketId: Str, market: Market = undefined, delimiter: Str = undefined, marketType: Str = undefined): MarketInterface {
-        const result = this.safeMarketStructure ({
-            'symbol': marketId,
-            'marketId': marketId,
-        });
+        // the markets of markets_by_id are returned as they are, the structure is only made for the unknown ids
         if (marketId !== undefined) {
             if ((this.markets_by_id !== undefined) && (marketId in this.markets_by_id)) {
                 const markets = this.markets_by_id[marketId];
@@ -4442,6 +4439,10 @@ export default class Exchange {
                     }
                 }
             } else if (delimiter !== undefined && delimiter !== '') {
+                const result = this.safeMarketStructure ({
+                    'symbol': marketId,
+                    'marketId': marketId,
+                });
                 const parts = marketId.split (delimiter);
                 const partsLength = parts.length;
                 if (partsLength === 2) {
@@ -4459,7 +4460,10 @@ export default class Exchange {
         if (market !== undefined) {
             return market;
         }
-        return result;
+        return this.safeMarketStructure ({
+            'symbol': marketId,
+            'marketId': marketId,
+        });
     }
 
     checkRequiredCredentials (error = true) {
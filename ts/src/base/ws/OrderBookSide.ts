@@ -7,6 +7,8 @@
 // Email: carlo.revelli@berkeley.edu
 //
 
+import { numberToString } from '../functions/number.js';
+
 /**
  *
  * @param array
@@ -23,6 +25,21 @@ function bisectLeft (array, x) {
     return low;
 }
 
+/**
+ *
+ * @param side
+ * @param depth
+ */
+function levelStrings (side, depth) {
+    // the [ price, amount ] strings of the first levels, for the checksums
+    const length = Math.min (depth, side.length)
+    const result = new Array (length)
+    for (let i = 0; i < length; i++) {
+        result[i] = [ numberToString (side[i][0]), numberToString (side[i][1]) ]
+    }
+    return result
+}
+
 const SIZE = 1024
 const SEED = new Float64Array (new Array (SIZE).fill (Number.MAX_VALUE))
 
@@ -30,6 +47,8 @@ const SEED = new Float64Array (new Array (SIZE).fill (Number.MAX_VALUE))
 interface IOrderBookSide<T> extends Array<T> {
     store(price: any, size: any);
     storeArray(array: any[]);
+    applyDeltas(deltas: any[]);
+    topStrings(depth: number): string[][];
     limit();
 }
 
@@ -89,6 +108,19 @@ class OrderBookSide extends Array implements IOrderBookSide<any> {
         this.storeArray ([ price, size ])
     }
 
+    // stores raw price levels like [ [ "31738.3", "0.05973179" ], ... ] in one call
+    // prices and amounts can be strings or numbers
+    applyDeltas (deltas, priceIndex = 0, amountIndex = 1) {
+        for (let i = 0; i < deltas.length; i++) {
+            const delta = deltas[i]
+            this.storeArray ([ parseFloat (delta[priceIndex]), parseFloat (delta[amountIndex]) ])
+        }
+    }
+
+    topStrings (depth) {
+        return levelStrings (this, depth)
+    }
+
     // replace stored orders with new values
     limit () {
         if (this.length > this.depth) {
@@ -111,6 +143,13 @@ class CountedOrderBookSide extends OrderBookSide {
         throw new Error ('CountedOrderBookSide.store() is not supported, use storeArray([price, size, count]) instead')
     }
 
+    applyDeltas (deltas, priceIndex = 0, amountIndex = 1, countIndex = 2) {
+        for (let i = 0; i < deltas.length; i++) {
+            const delta = deltas[i]
+            this.storeArray ([ parseFloat (delta[priceIndex]), parseFloat (delta[amountIndex]), parseInt (delta[countIndex]) ])
+        }
+    }
+
     storeArray (delta) {
         const price = delta[0]
         const size = delta[1]
@@ -178,6 +217,15 @@ class IndexedOrderBookSide extends Array implements IOrderBookSide<any> {
         throw new Error ('IndexedOrderBook.store() is not supported, use storeArray([price, size, id]) instead')
     }
 
+    applyDeltas (deltas, priceIndex = 0, amountIndex = 1, idIndex = 2) {
+        // the price can be missing when an order is changed or deleted
+        for (let i = 0; i < deltas.length; i++) {
+            const delta = deltas[i]
+            const price = delta[priceIndex]
+            this.storeArray ([ (price === undefined) ? undefined : parseFloat (price), parseFloat (delta[amountIndex]), delta[idIndex] ])
+        }
+    }
+
     storeArray (delta) {
         const price = delta[0]
         const size = delta[1]
@@ -251,6 +299,10 @@ class IndexedOrderBookSide extends Array implements IOrderBookSide<any> {
         }
     }
 
+    topStrings (depth) {
+        return levelStrings (this, depth)
+    }
+
     // replace stored orders with new values
     limit () {
         if (this.length > this.depth) {
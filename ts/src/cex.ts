@@ -194,6 +194,7 @@ export default class cex extends Exchange {
                 },
             },
             'options': {
+                'loadCurrenciesBeforeMarkets': true,
                 'fetchOHLCVWarning': true,
                 'createMarketBuyOrderRequiresPrice': true,
                 'order': {
@@ -210,6 +210,7 @@ export default class coinmetro extends Exchange {
             'precisionMode': DECIMAL_PLACES,
             // exchange-specific options
             'options': {
+                'loadCurrenciesBeforeMarkets': true,
                 'currenciesByIdForParseMarket': undefined,
                 'currencyIdsListForParseMarket': undefined,
             },
@@ -216,6 +216,7 @@ export default class latoken extends Exchange {
                 },
             },
             'options': {
+                'loadCurrenciesBeforeMarkets': true,
                 'defaultType': 'spot',
                 'types': {
                     'wallet': 'ACCOUNT_TYPE_WALLET',
@@ -785,9 +785,7 @@ export default class binance extends binanceRest {
     }
 
     handleDeltas (bookside, deltas) {
-        for (let i = 0; i < deltas.length; i++) {
-            this.handleDelta (bookside, deltas[i]);
-        }
+        bookside.applyDeltas (deltas);
     }
 
     handleOrderBookMessage (client: Client, message, orderbook) {
@@ -673,19 +673,33 @@ export default class bitfinex2 extends bitfinex2Rest {
         const asks = book['asks'];
         const prec = this.safeString (subscription, 'prec', 'P0');
         const isRaw = (prec === 'R0');
-        const idToCheck = isRaw ? 2 : 0;
-        // pepperoni pizza from bitfinex
-        for (let i = 0; i < depth; i++) {
-            const bid = this.safeValue (bids, i);
-            const ask = this.safeValue (asks, i);
-            if (bid !== undefined) {
-                stringArray.push (this.numberToString (bids[i][idToCheck]));
-                stringArray.push (this.numberToString (bids[i][1]));
+        if (isRaw) {
+            // the raw books are checked with the order ids instead of the prices
+            // pepperoni pizza from bitfinex
+            for (let i = 0; i < depth; i++) {
+                const bid = this.safeValue (bids, i);
+                const ask = this.safeValue (asks, i);
+                if (bid !== undefined) {
+                    stringArray.push (this.numberToString (bids[i][2]));
+                    stringArray.push (this.numberToString (bids[i][1]));
+                }
+                if (ask !== undefined) {
+                    stringArray.push (this.numberToString (asks[i][2]));
+                    stringArray.push (Precise.stringNeg (this.numberToString (asks[i][1])));
+                }
             }
-            if (ask !== undefined) {
-                stringArray.push (this.numberToString (asks[i][idToCheck]));
-                const aski1 = asks[i][1];
-                stringArray.push (this.numberToString (-aski1));
+        } else {
+            const bidStrings = bids.topStrings (depth);
+            const askStrings = asks.topStrings (depth);
+            for (let i = 0; i < depth; i++) {
+                if (i < bidStrings.length) {
+                    stringArray.push (bidStrings[i][0]);
+                    stringArray.push (bidStrings[i][1]);
+                }
+                if (i < askStrings.length) {
+                    stringArray.push (askStrings[i][0]);
+                    stringArray.push (Precise.stringNeg (askStrings[i][1]));
+                }
             }
         }
         const payload = stringArray.join (':');
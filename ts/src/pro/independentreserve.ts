@@ -236,7 +236,7 @@ export default class independentreserve extends independentreserveRest {
     }
 
     valueToChecksum (value) {
-        let result = value.toFixed (8);
+        let result = parseFloat (value).toFixed (8);
         result = result.replace ('.', '');
         // remove leading zeros
         result = this.parseNumber (result);
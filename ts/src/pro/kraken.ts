@@ -777,12 +777,14 @@ export default class kraken extends krakenRest {
                 const amountLength = amountParts[1].length - 0;
                 const payloadArray = [];
                 if (c !== undefined) {
-                    for (let i = 0; i < 10; i++) {
-                        const formatted = this.formatNumber (storedAsks[i][0], priceLength) + this.formatNumber (storedAsks[i][1], amountLength);
+                    const askStrings = storedAsks.topStrings (10);
+                    const bidStrings = storedBids.topStrings (10);
+                    for (let i = 0; i < askStrings.length; i++) {
+                        const formatted = this.formatNumber (askStrings[i][0], priceLength) + this.formatNumber (askStrings[i][1], amountLength);
                         payloadArray.push (formatted);
                     }
-                    for (let i = 0; i < 10; i++) {
-                        const formatted = this.formatNumber (storedBids[i][0], priceLength) + this.formatNumber (storedBids[i][1], amountLength);
+                    for (let i = 0; i < bidStrings.length; i++) {
+                        const formatted = this.formatNumber (bidStrings[i][0], priceLength) + this.formatNumber (bidStrings[i][1], amountLength);
                         payloadArray.push (formatted);
                     }
                 }
@@ -913,9 +913,7 @@ export default class okx extends okxRest {
     }
 
     handleDeltas (bookside, deltas) {
-        for (let i = 0; i < deltas.length; i++) {
-            this.handleDelta (bookside, deltas[i]);
-        }
+        bookside.applyDeltas (deltas);
     }
 
     handleOrderBookMessage (client: Client, message, orderbook, messageHash) {
@@ -945,17 +943,19 @@ export default class okx extends okxRest {
         const symbol = this.safeSymbol (marketId);
         const checksum = this.safeBool (this.options, 'checksum', true);
         if (checksum) {
-            const asksLength = storedAsks.length;
-            const bidsLength = storedBids.length;
+            const bidStrings = storedBids.topStrings (25);
+            const askStrings = storedAsks.topStrings (25);
+            const asksLength = askStrings.length;
+            const bidsLength = bidStrings.length;
             const payloadArray = [];
             for (let i = 0; i < 25; i++) {
                 if (i < bidsLength) {
-                    payloadArray.push (this.numberToString (storedBids[i][0]));
-                    payloadArray.push (this.numberToString (storedBids[i][1]));
+                    payloadArray.push (bidStrings[i][0]);
+                    payloadArray.push (bidStrings[i][1]);
                 }
                 if (i < asksLength) {
-                    payloadArray.push (this.numberToString (storedAsks[i][0]));
-                    payloadArray.push (this.numberToString (storedAsks[i][1]));
+                    payloadArray.push (askStrings[i][0]);
+                    payloadArray.push (askStrings[i][1]);
                 }
             }
             const payload = payloadArray.join (':');
@@ -394,3 +394,29 @@ resetBook.limit ();
 resetBook.reset (orderBookInput);
 resetBook.limit ();
 assert (equals (resetBook, orderBookTarget));
+
+// --------------------------------------------------------------------------------------------------------------------
+
+const deltasOrderBook = new OrderBook ({}, 3);
+const deltasBids = deltasOrderBook['bids'];
+deltasBids.applyDeltas ([ [ '10.0', '1.5' ], [ '9.5', '2' ], [ '9.0', '3' ], [ '8.5', '4' ] ]);
+assert (equals (deltasBids, [ [ 10.0, 1.5 ], [ 9.5, 2 ], [ 9.0, 3 ], [ 8.5, 4 ] ]));
+deltasBids.applyDeltas ([ [ '9.5', '2.5' ], [ '9.0', '0' ], [ '7.0', '0' ] ]);  // update, delete, delete a missing level
+assert (equals (deltasBids, [ [ 10.0, 1.5 ], [ 9.5, 2.5 ], [ 8.5, 4 ] ]));
+deltasBids.applyDeltas ([ [ 11, 1 ] ]);
+deltasOrderBook.limit ();
+assert (equals (deltasBids, [ [ 11, 1 ], [ 10.0, 1.5 ], [ 9.5, 2.5 ] ]));
+
+const deltasCountedOrderBook = new CountedOrderBook ({});
+const deltasCountedAsks = deltasCountedOrderBook['asks'];
+deltasCountedAsks.applyDeltas ([ [ '12', '2', '0', '1' ], [ '11', '1', '0', '2' ] ], 0, 1, 3);
+assert (equals (deltasCountedAsks, [ [ 11, 1, 2 ], [ 12, 2, 1 ] ]));
+deltasCountedAsks.applyDeltas ([ [ '11', '0', '0', '0' ], [ '12', '3', '0', '4' ] ], 0, 1, 3);
+assert (equals (deltasCountedAsks, [ [ 12, 3, 4 ] ]));
+
+const deltasIndexedOrderBook = new IndexedOrderBook ({});
+const deltasIndexedBids = deltasIndexedOrderBook['bids'];
+deltasIndexedBids.applyDeltas ([ [ '10', '1', 'a' ], [ '9', '2', 'b' ] ]);
+assert (equals (deltasIndexedBids, [ [ 10, 1, 'a' ], [ 9, 2, 'b' ] ]));
+deltasIndexedBids.applyDeltas ([ [ undefined, '3', 'a' ], [ '9', '0', 'b' ] ]);  // the price is missing when an order is changed
+assert (equals (deltasIndexedBids, [ [ 10, 3, 'a' ] ]));
@@ -197,6 +197,35 @@ function testUnCamelCase () {
     equal (unCamelCase ('hasFetchOHLCV'), 'has_fetch_ohlcv')
 }
 
+function testSafeMarket () {
+
+    const exchange = new Exchange ({ 'id': 'mock' })
+    exchange.setMarkets ([
+        { 'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'baseId': 'BTC', 'quoteId': 'USDT', 'type': 'spot', 'spot': true, 'swap': false },
+        { 'id': 'BTCUSDT', 'symbol': 'BTC/USDT:USDT', 'base': 'BTC', 'quote': 'USDT', 'baseId': 'BTC', 'quoteId': 'USDT', 'type': 'swap', 'spot': false, 'swap': true },
+        { 'id': 'ETHUSDT', 'symbol': 'ETH/USDT', 'base': 'ETH', 'quote': 'USDT', 'baseId': 'ETH', 'quoteId': 'USDT', 'type': 'spot', 'spot': true, 'swap': false },
+    ])
+    let structures = 0
+    const safeMarketStructure = exchange.safeMarketStructure
+    exchange.safeMarketStructure = function (market = undefined) {
+        structures += 1
+        return safeMarketStructure.call (this, market)
+    }
+    // the known ids return the loaded markets without making the structure
+    const eth = exchange.markets_by_id['ETHUSDT'][0]
+    equal (exchange.safeMarket ('ETHUSDT'), eth)
+    equal (exchange.safeMarket ('ETHUSDT', undefined, '-'), eth)
+    equal (exchange.safeMarket ('BTCUSDT', undefined, undefined, 'swap'), exchange.markets_by_id['BTCUSDT'][1])
+    equal (exchange.safeMarket ('BTCUSDT', eth), exchange.markets_by_id['BTCUSDT'][0])
+    equal (structures, 0)
+    // the unknown ids get the structure or the market passed in
+    equal (exchange.safeMarket ('XRP-USDT', undefined, '-')['symbol'], 'XRP/USDT')
+    equal (exchange.safeMarket ('XRPUSDT')['symbol'], 'XRPUSDT')
+    equal (structures, 2)
+    equal (exchange.safeMarket ('XRPUSDT', eth), eth)
+    equal (structures, 2)
+}
+
 // ----------------------------------------------------------------------------
 
 function testBase () {
@@ -210,3 +239,4 @@ function testBase () {
 }
 
 testUnCamelCase ()
+testSafeMarket ()